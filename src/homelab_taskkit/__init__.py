@@ -1,49 +1,100 @@
-"""homelab-taskkit: Functional-first task implementations for Argo Workflows."""
+"""homelab-taskkit: Functional-first task implementations for Argo Workflows.
+
+Public names are re-exported lazily (PEP 562): each submodule is imported
+the first time one of its names is accessed, so ``import homelab_taskkit``
+stays cheap for callers that only need a single entry point.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
 
-from homelab_taskkit.context import (
-    CONTEXT_PATCH_KEY,
-    ContextPatch,
-    TaskkitContext,
-    apply_patch,
-    empty_context,
-    extract_context_patch,
-    load_context,
-    write_context,
-)
-from homelab_taskkit.context_rules import validate_patch
-from homelab_taskkit.deps import Deps, TaskkitEnv, build_deps
-from homelab_taskkit.fanout import (
-    FANOUT_KEY,
-    TaskkitFanout,
-    empty_fanout,
-    extract_fanout,
-    write_fanout,
-)
-from homelab_taskkit.flow_control import (
-    FLOW_CONTROL_KEY,
-    TaskkitFlowControl,
-    empty_flow_control,
-    extract_flow_control,
-    make_flow_control,
-    write_flow_control,
-)
-from homelab_taskkit.messages import (
-    MESSAGES_KEY,
-    TaskkitMessages,
-    empty_messages,
-    extract_messages,
-    write_messages,
-)
-from homelab_taskkit.registry import TaskDef, get_task, list_tasks
-from homelab_taskkit.runner import run_task
-from homelab_taskkit.testing import (
-    chain_steps,
-    create_context_with_vars,
-    make_patch,
-    run_step_with_context,
-)
+if TYPE_CHECKING:
+    from homelab_taskkit.context import (
+        CONTEXT_PATCH_KEY,
+        ContextPatch,
+        TaskkitContext,
+        apply_patch,
+        empty_context,
+        extract_context_patch,
+        load_context,
+        write_context,
+    )
+    from homelab_taskkit.context_rules import validate_patch
+    from homelab_taskkit.deps import Deps, TaskkitEnv, build_deps
+    from homelab_taskkit.fanout import (
+        FANOUT_KEY,
+        TaskkitFanout,
+        empty_fanout,
+        extract_fanout,
+        write_fanout,
+    )
+    from homelab_taskkit.flow_control import (
+        FLOW_CONTROL_KEY,
+        TaskkitFlowControl,
+        empty_flow_control,
+        extract_flow_control,
+        make_flow_control,
+        write_flow_control,
+    )
+    from homelab_taskkit.messages import (
+        MESSAGES_KEY,
+        TaskkitMessages,
+        empty_messages,
+        extract_messages,
+        write_messages,
+    )
+    from homelab_taskkit.registry import TaskDef, get_task, list_tasks
+    from homelab_taskkit.runner import run_task
+    from homelab_taskkit.testing import (
+        chain_steps,
+        create_context_with_vars,
+        make_patch,
+        run_step_with_context,
+    )
+
+# Exported name -> defining submodule
+_LAZY_EXPORTS: dict[str, str] = {
+    "CONTEXT_PATCH_KEY": "context",
+    "ContextPatch": "context",
+    "TaskkitContext": "context",
+    "apply_patch": "context",
+    "empty_context": "context",
+    "extract_context_patch": "context",
+    "load_context": "context",
+    "write_context": "context",
+    "validate_patch": "context_rules",
+    "Deps": "deps",
+    "TaskkitEnv": "deps",
+    "build_deps": "deps",
+    "FANOUT_KEY": "fanout",
+    "TaskkitFanout": "fanout",
+    "empty_fanout": "fanout",
+    "extract_fanout": "fanout",
+    "write_fanout": "fanout",
+    "FLOW_CONTROL_KEY": "flow_control",
+    "TaskkitFlowControl": "flow_control",
+    "empty_flow_control": "flow_control",
+    "extract_flow_control": "flow_control",
+    "make_flow_control": "flow_control",
+    "write_flow_control": "flow_control",
+    "MESSAGES_KEY": "messages",
+    "TaskkitMessages": "messages",
+    "empty_messages": "messages",
+    "extract_messages": "messages",
+    "write_messages": "messages",
+    "TaskDef": "registry",
+    "get_task": "registry",
+    "list_tasks": "registry",
+    "run_task": "runner",
+    "chain_steps": "testing",
+    "create_context_with_vars": "testing",
+    "make_patch": "testing",
+    "run_step_with_context": "testing",
+}
 
 __all__ = [
     # Core
@@ -89,3 +140,19 @@ __all__ = [
     "make_patch",
     "run_step_with_context",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule that defines ``name`` on first access."""
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,10 @@
+"""Slim entry points for the CLI's hot path.
+
+Imports only what ``task-run run`` needs, without going through the
+package-level re-exports in ``homelab_taskkit/__init__.py``.
+"""
+
+from homelab_taskkit.registry import get_task
+from homelab_taskkit.runner import run_task
+
+__all__ = ["get_task", "run_task"]
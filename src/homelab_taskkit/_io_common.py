@@ -0,0 +1,201 @@
+"""Low-level file writes shared by the artifact writers.
+
+The writers in io, fanout, flow_control, messages and context encode their
+documents to bytes up front, or for fanout and messages item by item through
+write_chunks, so the file side is a raw descriptor write with no buffered or
+text-mode wrapper in between.
+
+Writes go to a temporary file next to the destination and are renamed
+into place, so a reader racing the writer (e.g. the Argo artifact
+collector) sees either the old file or the complete new one. JSON Lines
+messages, which grow across runs, are instead appended with one O_APPEND
+write per call.
+
+Parent directories created by ensure_parent are remembered, so a step
+writing several artifacts under /outputs only pays for one mkdir. With
+TASKKIT_FSYNC=1 the renames are made durable by one sync_directories()
+call once all artifacts are written, rather than a directory fsync per file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+# Set to "1" to fdatasync artifact files before they are renamed into place
+FSYNC_ENV = "TASKKIT_FSYNC"
+
+# Messages and fanout artifacts with this suffix are written as JSON Lines
+JSONL_SUFFIX = ".jsonl"
+
+# Sentinel for "key not present" in task output lookups by the artifact extractors
+MISSING: Any = object()
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+_APPEND_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_CLOEXEC", 0)
+
+# Small chunks passed to write_chunks are coalesced up to this size per write()
+_WRITE_BUFFER_SIZE = 128 * 1024
+
+# fdatasync skips the metadata flush; macOS only has fsync
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+# Directories holding renames not yet made durable (only tracked with TASKKIT_FSYNC=1)
+_PENDING_DIR_SYNCS: set[str] = set()
+_SYNC_LOCK = threading.Lock()
+
+# Directories ensure_parent has already created or found in this process
+_MKDIR_CACHE: set[str] = set()
+_MKDIR_LOCK = threading.Lock()
+
+
+def ensure_parent(path: str | Path) -> None:
+    """Create the parent directory of path unless it is known to exist.
+
+    Args:
+        path: File whose parent directory should exist.
+    """
+    parent = os.path.dirname(os.fspath(path)) or "."
+    if parent in _MKDIR_CACHE:
+        return
+    os.makedirs(parent, exist_ok=True)
+    with _MKDIR_LOCK:
+        _MKDIR_CACHE.add(parent)
+
+
+def _forget_parent(path: str) -> bool:
+    """Drop path's parent from the mkdir cache, returning whether it was cached."""
+    parent = os.path.dirname(path) or "."
+    with _MKDIR_LOCK:
+        if parent not in _MKDIR_CACHE:
+            return False
+        _MKDIR_CACHE.discard(parent)
+    return True
+
+
+def write_bytes(path: str | Path, data: bytes) -> None:
+    """Atomically replace the contents of a file with data.
+
+    If the parent directory was cached by ensure_parent but has since been
+    removed, it is recreated and the write retried once.
+
+    Args:
+        path: File to write. Created if missing, replaced otherwise.
+        data: Encoded contents.
+
+    Raises:
+        OSError: If the file cannot be written or renamed into place.
+    """
+    write_chunks(path, (data,))
+
+
+def write_chunks(path: str | Path, chunks: Iterable[bytes]) -> None:
+    """Atomically replace the contents of a file with a sequence of byte chunks.
+
+    Like write_bytes, but the document never has to exist as one buffer:
+    chunks are consumed lazily and small ones are coalesced into writes of
+    up to 128 KiB.
+
+    Args:
+        path: File to write. Created if missing, replaced otherwise.
+        chunks: Encoded contents, in order.
+
+    Raises:
+        OSError: If the file cannot be written or renamed into place.
+    """
+    path = os.fspath(path)
+    tmp = f"{path}.tmp.{os.getpid()}"
+    try:
+        fd = os.open(tmp, _WRITE_FLAGS, 0o644)
+    except FileNotFoundError:
+        if not _forget_parent(path):
+            raise
+        ensure_parent(path)
+        fd = os.open(tmp, _WRITE_FLAGS, 0o644)
+    try:
+        try:
+            pending: list[bytes] = []
+            pending_size = 0
+            for chunk in chunks:
+                if pending and pending_size + len(chunk) > _WRITE_BUFFER_SIZE:
+                    _write_all(fd, pending)
+                    pending = []
+                    pending_size = 0
+                pending.append(chunk)
+                pending_size += len(chunk)
+            if pending:
+                _write_all(fd, pending)
+            fsync = os.environ.get(FSYNC_ENV) == "1"
+            if fsync:
+                _datasync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+        if fsync:
+            with _SYNC_LOCK:
+                _PENDING_DIR_SYNCS.add(os.path.dirname(path) or ".")
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def append_bytes(path: str | Path, data: bytes) -> None:
+    """Append data to a file in a single O_APPEND write where possible.
+
+    Used for JSON Lines artifacts, which grow instead of being replaced. One
+    write(2) per call means a concurrent reader sees either none or all of the
+    appended lines, instead of a line cut at a buffer boundary.
+
+    Args:
+        path: File to append to. Created if missing.
+        data: Encoded lines to append.
+
+    Raises:
+        OSError: If the file cannot be opened or written.
+    """
+    path = os.fspath(path)
+    try:
+        fd = os.open(path, _APPEND_FLAGS, 0o644)
+    except FileNotFoundError:
+        if not _forget_parent(path):
+            raise
+        ensure_parent(path)
+        fd = os.open(path, _APPEND_FLAGS, 0o644)
+    try:
+        _write_all(fd, [data])
+        if os.environ.get(FSYNC_ENV) == "1":
+            _datasync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, chunks: list[bytes]) -> None:
+    """Write the concatenation of chunks to fd, retrying short writes."""
+    view = memoryview(chunks[0] if len(chunks) == 1 else b"".join(chunks))
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def sync_directories() -> None:
+    """Fsync each directory that received an artifact since the last call.
+
+    Makes the renames done by write_bytes durable. Does nothing unless
+    TASKKIT_FSYNC=1 was set for those writes. Errors are ignored, since some
+    filesystems do not support fsync on directories.
+    """
+    with _SYNC_LOCK:
+        pending = list(_PENDING_DIR_SYNCS)
+        _PENDING_DIR_SYNCS.clear()
+    for directory in pending:
+        with contextlib.suppress(OSError):
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
@@ -0,0 +1,188 @@
+"""JSON encoding and decoding for taskkit artifacts.
+
+Uses orjson when it is available and falls back to the standard library
+otherwise. Both paths produce UTF-8 bytes, compact separators unless
+``indent`` is requested, and non-string dict keys coerced to strings.
+
+orjson only handles 64-bit integers, so documents with larger ones go
+through the standard library in both directions and keep full precision.
+One difference remains: with orjson, NaN and infinities are written as
+``null`` (valid JSON), where the standard library writes ``NaN`` and
+``Infinity``.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import re
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch this
+JSONDecodeError = json.JSONDecodeError
+
+# A run of 19+ digits may be an integer outside the 64-bit range, which orjson
+# would parse as a float; such documents are decoded by the stdlib instead
+_LONG_DIGITS = re.compile(rb"\d{19}")
+_LONG_DIGITS_STR = re.compile(r"\d{19}", re.ASCII)
+
+# orjson's TypeError for integers it cannot encode
+_INT_RANGE_ERROR = "Integer exceeds 64-bit range"
+
+if orjson is not None:
+    # Let `default` see datetimes and dataclasses, matching json.dumps(default=...)
+    _BASE_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Parse a JSON document.
+
+    Documents containing a run of 19 or more digits are parsed by the standard
+    library, so integers beyond 64 bits keep their exact value.
+
+    Args:
+        data: JSON document as bytes or str.
+
+    Returns:
+        Parsed Python object.
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        if isinstance(data, str):
+            has_long_digits = _LONG_DIGITS_STR.search(data) is not None
+        else:
+            has_long_digits = _LONG_DIGITS.search(data) is not None
+        if not has_long_digits:
+            return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    newline: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize.
+        indent: Pretty-print with two-space indentation.
+        newline: Append a trailing newline.
+        default: Fallback for objects that are not natively serializable.
+
+    Integers beyond 64 bits, which orjson rejects, are encoded by the
+    standard library instead.
+
+    Returns:
+        Encoded JSON document.
+
+    Raises:
+        TypeError: If obj contains a value that cannot be serialized.
+    """
+    if orjson is not None:
+        option = _BASE_OPTIONS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError as e:
+            if str(e) != _INT_RANGE_ERROR:
+                raise
+
+    text = json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+        default=default,
+    )
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+@functools.lru_cache(maxsize=16)
+def _envelope_head(version: str, field: str) -> bytes:
+    """Return the indented bytes preceding the payload in an envelope document."""
+    return b'{\n  "version": ' + dumps(version) + b",\n  " + dumps(field) + b": "
+
+
+def dumps_envelope(
+    version: str,
+    field: str,
+    value: Any,
+    *,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize ``{"version": version, field: value}`` without building the dict.
+
+    Output is byte-for-byte what ``dumps(..., indent=True, newline=True)``
+    gives for that dict. The constant head is cached per (version, field) and
+    the payload is re-indented one level; encoded strings escape newlines, so
+    every raw newline in the payload is layout.
+
+    Args:
+        version: Envelope version string.
+        field: Name of the payload key.
+        value: Payload to serialize.
+        default: Fallback for objects that are not natively serializable.
+
+    Returns:
+        Encoded, newline-terminated JSON document.
+
+    Raises:
+        TypeError: If value contains a value that cannot be serialized.
+    """
+    body = dumps(value, indent=True, default=default).replace(b"\n", b"\n  ")
+    return _envelope_head(version, field) + body + b"\n}\n"
+
+
+def iter_envelope(
+    version: str,
+    field: str,
+    items: Iterable[Any],
+    *,
+    default: Callable[[Any], Any] | None = None,
+) -> Iterator[bytes]:
+    """Serialize ``{"version": version, field: [*items]}`` one item at a time.
+
+    Joining the chunks gives exactly ``dumps_envelope(version, field,
+    list(items))``, but only one encoded item is held at a time, so large
+    payloads can be streamed to a file without a document-sized buffer.
+
+    Args:
+        version: Envelope version string.
+        field: Name of the list payload key.
+        items: Payload items, consumed lazily.
+        default: Fallback for objects that are not natively serializable.
+
+    Yields:
+        Consecutive pieces of the encoded, newline-terminated document.
+
+    Raises:
+        TypeError: If an item contains a value that cannot be serialized.
+    """
+    yield _envelope_head(version, field)
+    separator = b"[\n    "
+    empty = True
+    for item in items:
+        yield separator + dumps(item, indent=True, default=default).replace(b"\n", b"\n    ")
+        separator = b",\n    "
+        empty = False
+    yield b"[]\n}\n" if empty else b"\n  ]\n}\n"
@@ -0,0 +1,122 @@
+"""Build-time registry manifest for fast step start-up.
+
+Importing every task and step package just to find one handler is the
+largest fixed cost of `task-run step run`. This module records where each
+registered task and step handler lives so the step runner can import only
+the module it needs.
+
+Run at image build time:
+    python -m homelab_taskkit.build_registry
+
+The manifest is written next to the package as ``registry.json``. If it is
+missing or does not list a handler, the step runner falls back to importing
+everything.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+from pathlib import Path
+from typing import Any
+
+from homelab_taskkit import _json
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_MANIFEST_VERSION = "taskkit-registry/v1"
+DEFAULT_MANIFEST_PATH = Path(__file__).with_name("registry.json")
+
+
+def build_manifest() -> dict[str, Any]:
+    """Import all tasks and steps and describe where each one is defined.
+
+    Returns:
+        Manifest dict with "tasks" and "steps" sections keyed by name.
+    """
+    import homelab_taskkit.steps  # noqa: F401
+    import homelab_taskkit.tasks  # noqa: F401
+    from homelab_taskkit.registry import list_tasks
+    from homelab_taskkit.workflow.registry import _STEP_REGISTRY
+
+    tasks = {
+        task.name: {
+            "module": task.run.__module__,
+            "func": task.run.__name__,
+            "input_schema": task.input_schema,
+            "output_schema": task.output_schema,
+        }
+        for task in list_tasks()
+    }
+    steps = {
+        name: {"module": handler.__module__, "func": handler.__name__}
+        for name, handler in sorted(_STEP_REGISTRY.items())
+    }
+    return {"version": REGISTRY_MANIFEST_VERSION, "tasks": tasks, "steps": steps}
+
+
+def write_manifest(path: str | Path = DEFAULT_MANIFEST_PATH) -> dict[str, Any]:
+    """Build the manifest and write it to a JSON file.
+
+    Args:
+        path: Destination path (default: registry.json next to the package).
+
+    Returns:
+        The manifest that was written.
+    """
+    manifest = build_manifest()
+    Path(path).write_bytes(_json.dumps(manifest, indent=True, newline=True))
+    return manifest
+
+
+def load_manifest(path: str | Path) -> dict[str, Any] | None:
+    """Load a registry manifest.
+
+    Args:
+        path: Path to the manifest JSON file.
+
+    Returns:
+        The manifest, or None if it is missing, unreadable, or from another version.
+    """
+    try:
+        manifest = _json.loads(Path(path).read_bytes())
+    except (OSError, ValueError) as e:
+        logger.debug("Registry manifest unavailable at %s: %s", path, e)
+        return None
+
+    if not isinstance(manifest, dict) or manifest.get("version") != REGISTRY_MANIFEST_VERSION:
+        logger.debug("Ignoring registry manifest with unexpected format at %s", path)
+        return None
+    return manifest
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Write the registry manifest.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m homelab_taskkit.build_registry",
+        description="Write the task/step registry manifest used for fast step start-up.",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        default=str(DEFAULT_MANIFEST_PATH),
+        help=f"Manifest path (default: {DEFAULT_MANIFEST_PATH})",
+    )
+    args = parser.parse_args(argv)
+
+    manifest = write_manifest(args.output)
+    print(
+        f"Wrote {len(manifest['tasks'])} tasks and {len(manifest['steps'])} steps to {args.output}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
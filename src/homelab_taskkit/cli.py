@@ -2,134 +2,122 @@
 
 from __future__ import annotations
 
+import argparse
 import contextlib
+import functools
 import logging
+import os
+import sys
+from argparse import ArgumentParser
+from collections.abc import Callable, Iterable, Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-import typer
-from rich.console import Console
-from rich.table import Table
+if TYPE_CHECKING:
+    from rich.console import Console
 
-from homelab_taskkit.registry import list_tasks
-from homelab_taskkit.runner import run_task
+_PROG = "task-run"
+_DESCRIPTION = "Run homelab tasks with schema validation."
 
-app = typer.Typer(
-    name="task-run",
-    help="Run homelab tasks with schema validation.",
-    no_args_is_help=True,
-)
+_SCHEMA_TYPES = frozenset({"input", "output"})
 
-workflow_app = typer.Typer(
-    name="workflow",
-    help="Workflow execution commands.",
-    no_args_is_help=True,
-)
-app.add_typer(workflow_app, name="workflow")
+# LocalRunner result -> exit code; any other result exits 2
+_WORKFLOW_EXIT_CODES: Mapping[str, int] = MappingProxyType({"Succeeded": 0, "Failed": 1})
 
-step_app = typer.Typer(
-    name="step",
-    help="Step execution commands (for Argo containers).",
-    no_args_is_help=True,
-)
-app.add_typer(step_app, name="step")
+# Set to import every task and step package when the CLI module loads (e.g. in CI,
+# to surface import errors up front instead of on the first command that needs them)
+EAGER_IMPORT_ENV = "TASKKIT_EAGER_IMPORT"
 
-console = Console()
+# Set once the task/step packages have been imported (registries populated)
+_TASKS_LOADED = False
+_STEPS_LOADED = False
 
 
-@app.command("run")
-def run_cmd(
-    task_name: str = typer.Argument(..., help="Name of the task to run"),
-    input_source: str = typer.Option(
-        ...,
-        "--input",
-        "-i",
-        help="Path to input JSON file or inline JSON string",
-    ),
-    output_path: str = typer.Option(
-        ...,
-        "--output",
-        "-o",
-        help="Path to write the output JSON",
-    ),
-    schemas_root: str = typer.Option(
-        "schemas",
-        "--schemas",
-        "-s",
-        help="Root directory containing task schemas",
-    ),
-    context_enabled: bool | None = typer.Option(
-        None,
-        "--context/--no-context",
-        help="Enable/disable context artifacts (default: auto-detect)",
-    ),
-    context_in: str | None = typer.Option(
-        None,
-        "--context-in",
-        help="Path to input context JSON (default: /inputs/context.json)",
-    ),
-    context_out: str | None = typer.Option(
-        None,
-        "--context-out",
-        help="Path to output context JSON (default: /outputs/context.json)",
-    ),
-    max_context_bytes: int = typer.Option(
-        32 * 1024,
-        "--max-context-bytes",
-        help="Maximum context size in bytes (default: 32KB)",
-    ),
-    messages_enabled: bool | None = typer.Option(
-        None,
-        "--messages/--no-messages",
-        help="Enable/disable messages artifact (default: auto-detect based on /outputs)",
-    ),
-    messages_out: str | None = typer.Option(
-        None,
-        "--messages-out",
-        help="Path to write messages JSON (default: /outputs/messages.json)",
-    ),
-    fanout_enabled: bool | None = typer.Option(
-        None,
-        "--fanout/--no-fanout",
-        help="Enable/disable fanout artifact (default: auto-detect based on /outputs)",
-    ),
-    fanout_out: str | None = typer.Option(
-        None,
-        "--fanout-out",
-        help="Path to write fanout JSON (default: /outputs/fanout.json)",
-    ),
-) -> None:
+def _ensure_tasks_loaded(steps: bool = False) -> None:
+    """Import the task packages, and optionally the step packages, once per process.
+
+    Args:
+        steps: Also import homelab_taskkit.steps (workflow step handlers).
+    """
+    global _TASKS_LOADED, _STEPS_LOADED
+    if not _TASKS_LOADED:
+        import homelab_taskkit.tasks  # noqa: F401
+
+        _TASKS_LOADED = True
+    if steps and not _STEPS_LOADED:
+        with contextlib.suppress(ImportError):
+            import homelab_taskkit.steps  # noqa: F401
+        _STEPS_LOADED = True
+
+
+@functools.cache
+def _get_console() -> Console:
+    """Return the shared Rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+_TSV_ESCAPES = str.maketrans({"\t": " ", "\n": " ", "\r": " "})
+
+
+def _write_tsv(header: tuple[str, ...], rows: Iterable[Iterable[str]]) -> None:
+    """Write a header and rows as tab-separated lines in a single write (for piped output).
+
+    Tabs and newlines inside cells are replaced with spaces so every row
+    stays on one line with a fixed number of columns.
+    """
+    lines = ["\t".join(header)]
+    lines.extend("\t".join(cell.translate(_TSV_ESCAPES) for cell in row) for row in rows)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def run_cmd(args: argparse.Namespace) -> int:
     """Run a task with input/output validation and optional artifacts."""
-    # Import tasks to populate registry
-    import homelab_taskkit.tasks  # noqa: F401
-
-    exit_code = run_task(
-        task_name=task_name,
-        input_source=input_source,
-        output_path=output_path,
-        schemas_root=schemas_root,
-        context_enabled=context_enabled,
-        context_input_path=context_in,
-        context_output_path=context_out,
-        max_context_bytes=max_context_bytes,
-        messages_enabled=messages_enabled,
-        messages_output_path=messages_out,
-        fanout_enabled=fanout_enabled,
-        fanout_output_path=fanout_out,
+    _ensure_tasks_loaded()
+    from homelab_taskkit._fast import run_task
+
+    return run_task(
+        task_name=args.task_name,
+        input_source=args.input_source,
+        output_path=args.output_path,
+        schemas_root=args.schemas_root,
+        context_enabled=args.context_enabled,
+        context_input_path=args.context_in,
+        context_output_path=args.context_out,
+        max_context_bytes=args.max_context_bytes,
+        messages_enabled=args.messages_enabled,
+        messages_output_path=args.messages_out,
+        fanout_enabled=args.fanout_enabled,
+        fanout_output_path=args.fanout_out,
     )
-    raise typer.Exit(code=exit_code)
 
 
-@app.command("list")
-def list_cmd() -> None:
+def list_cmd(args: argparse.Namespace) -> int:
     """List all available tasks."""
-    # Import tasks to populate registry
-    import homelab_taskkit.tasks  # noqa: F401
+    _ensure_tasks_loaded()
+    from homelab_taskkit.registry import list_tasks
 
     tasks = list_tasks()
 
+    if not sys.stdout.isatty():
+        _write_tsv(
+            ("Name", "Description", "Input Schema", "Output Schema"),
+            [
+                (task.name, task.description, task.input_schema, task.output_schema)
+                for task in tasks
+            ],
+        )
+        return 0
+
+    from rich.table import Table
+
+    console = _get_console()
+
     if not tasks:
         console.print("[yellow]No tasks registered.[/yellow]")
-        return
+        return 0
 
     table = Table(title="Available Tasks")
     table.add_column("Name", style="cyan", no_wrap=True)
@@ -146,109 +134,66 @@ def list_cmd() -> None:
         )
 
     console.print(table)
+    return 0
 
 
-@app.command("schema")
-def schema_cmd(
-    task_name: str = typer.Argument(..., help="Name of the task"),
-    schema_type: str = typer.Option(
-        "input",
-        "--type",
-        "-t",
-        help="Schema type: 'input' or 'output'",
-    ),
-    schemas_root: str = typer.Option(
-        "schemas",
-        "--schemas",
-        "-s",
-        help="Root directory containing task schemas",
-    ),
-) -> None:
+def schema_cmd(args: argparse.Namespace) -> int:
     """Print the JSON schema for a task."""
-    import json
-
-    # Import tasks to populate registry
-    import homelab_taskkit.tasks  # noqa: F401
+    _ensure_tasks_loaded()
     from homelab_taskkit.registry import TaskNotFoundError, get_task
-    from homelab_taskkit.schema import load_schema
+
+    console = _get_console()
 
     try:
-        task = get_task(task_name)
+        task = get_task(args.task_name)
     except TaskNotFoundError as e:
         console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1) from None
+        return 1
 
-    schema_path = Path(schemas_root) / (
-        task.input_schema if schema_type == "input" else task.output_schema
+    schema_path = Path(args.schemas_root) / (
+        task.input_schema if args.schema_type == "input" else task.output_schema
     )
 
     try:
-        schema = load_schema(schema_path)
-        console.print_json(json.dumps(schema, indent=2))
+        data = schema_path.read_bytes()
     except FileNotFoundError:
         console.print(f"[red]Error:[/red] Schema not found: {schema_path}")
-        raise typer.Exit(code=1) from None
+        return 1
 
+    if sys.stdout.isatty():
+        # Rich parses the document once to indent and colorize it
+        console.print_json(data.decode("utf-8"))
+    else:
+        # Piped output: schema files are already formatted, pass them through as-is
+        sys.stdout.flush()
+        sys.stdout.buffer.write(data if data.endswith(b"\n") else data + b"\n")
+        sys.stdout.buffer.flush()
 
-@workflow_app.command("run")
-def workflow_run_cmd(
-    workflow_path: str = typer.Option(
-        ...,
-        "--workflow",
-        "-w",
-        help="Path to workflow YAML file",
-    ),
-    params_path: str | None = typer.Option(
-        None,
-        "--params",
-        "-p",
-        help="Path to params JSON file",
-    ),
-    workdir: str | None = typer.Option(
-        None,
-        "--workdir",
-        help="Working directory for execution (default: auto-generated)",
-    ),
-    task_id: str | None = typer.Option(
-        None,
-        "--task-id",
-        help="Task ID for the run (default: auto-generated)",
-    ),
-    verbose: bool = typer.Option(
-        False,
-        "--verbose",
-        "-v",
-        help="Enable verbose logging",
-    ),
-) -> None:
+    return 0
+
+
+def workflow_run_cmd(args: argparse.Namespace) -> int:
     """Run a workflow locally for testing.
 
     Example:
         task-run workflow run -w workflows/smoke_test.yaml -p params.json --workdir ./test-run
     """
-    # Import step handlers to populate registry
-    import homelab_taskkit.tasks  # noqa: F401
-
-    # Also import any workflow steps
-    with contextlib.suppress(ImportError):
-        import homelab_taskkit.steps  # noqa: F401
-
-    # Configure logging
-    log_level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    _ensure_tasks_loaded(steps=True)
+
+    from homelab_taskkit.runner import init_logging
+
+    init_logging(logging.DEBUG if args.verbose else logging.INFO)
 
     from homelab_taskkit.workflow import LocalRunner
 
+    console = _get_console()
+
     try:
         runner = LocalRunner(
-            workflow_path=workflow_path,
-            params_path=params_path,
-            workdir=workdir,
-            task_id=task_id,
+            workflow_path=args.workflow_path,
+            params_path=args.params_path,
+            workdir=args.workdir,
+            task_id=args.task_id,
         )
 
         console.print(f"[cyan]Workflow:[/cyan] {runner.workflow.name}")
@@ -257,34 +202,23 @@ def workflow_run_cmd(
         console.print()
 
         result = runner.run()
+        exit_code = _WORKFLOW_EXIT_CODES.get(result, 2)
 
-        if result == "Succeeded":
+        if exit_code == 0:
             console.print(f"\n[green]✓ Workflow {result}[/green]")
-            raise typer.Exit(code=0)
-        elif result == "Failed":
-            console.print(f"\n[red]✗ Workflow {result}[/red]")
-            raise typer.Exit(code=1)
         else:
             console.print(f"\n[red]✗ Workflow {result}[/red]")
-            raise typer.Exit(code=2)
+        return exit_code
 
     except FileNotFoundError as e:
         console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1) from None
+        return 1
     except ValueError as e:
         console.print(f"[red]Validation Error:[/red] {e}")
-        raise typer.Exit(code=1) from None
+        return 1
 
 
-@workflow_app.command("validate")
-def workflow_validate_cmd(
-    workflow_path: str = typer.Option(
-        ...,
-        "--workflow",
-        "-w",
-        help="Path to workflow YAML file",
-    ),
-) -> None:
+def workflow_validate_cmd(args: argparse.Namespace) -> int:
     """Validate a workflow definition without executing it.
 
     Checks:
@@ -293,17 +227,15 @@ def workflow_validate_cmd(
     - Dependencies are valid
     - No circular dependencies
     """
-    # Import step handlers to populate registry
-    import homelab_taskkit.tasks  # noqa: F401
-
-    with contextlib.suppress(ImportError):
-        import homelab_taskkit.steps  # noqa: F401
+    _ensure_tasks_loaded(steps=True)
 
     from homelab_taskkit.workflow import LocalRunner
 
+    console = _get_console()
+
     try:
         runner = LocalRunner(
-            workflow_path=workflow_path,
+            workflow_path=args.workflow_path,
             params_path=None,
             workdir=None,
         )
@@ -314,35 +246,38 @@ def workflow_validate_cmd(
             console.print("[red]Validation failed:[/red]")
             for error in errors:
                 console.print(f"  • {error}")
-            raise typer.Exit(code=1)
+            return 1
         else:
             console.print(f"[green]✓ Workflow '{runner.workflow.name}' is valid[/green]")
-            raise typer.Exit(code=0)
+            return 0
 
     except FileNotFoundError as e:
         console.print(f"[red]Error:[/red] {e}")
-        raise typer.Exit(code=1) from None
+        return 1
     except ValueError as e:
         console.print(f"[red]Validation Error:[/red] {e}")
-        raise typer.Exit(code=1) from None
+        return 1
 
 
-@workflow_app.command("list-steps")
-def workflow_list_steps_cmd() -> None:
+def workflow_list_steps_cmd(args: argparse.Namespace) -> int:
     """List all registered step handlers."""
-    # Import step handlers to populate registry
-    import homelab_taskkit.tasks  # noqa: F401
-
-    with contextlib.suppress(ImportError):
-        import homelab_taskkit.steps  # noqa: F401
+    _ensure_tasks_loaded(steps=True)
 
     from homelab_taskkit.workflow import list_steps
 
     steps = list_steps()
 
+    if not sys.stdout.isatty():
+        _write_tsv(("Handler Name",), [(step_name,) for step_name in steps])
+        return 0
+
+    from rich.table import Table
+
+    console = _get_console()
+
     if not steps:
         console.print("[yellow]No step handlers registered.[/yellow]")
-        return
+        return 0
 
     table = Table(title="Registered Step Handlers")
     table.add_column("Handler Name", style="cyan", no_wrap=True)
@@ -351,17 +286,10 @@ def workflow_list_steps_cmd() -> None:
         table.add_row(step_name)
 
     console.print(table)
+    return 0
 
 
-@step_app.command("run")
-def step_run_cmd(
-    verbose: bool = typer.Option(
-        False,
-        "--verbose",
-        "-v",
-        help="Enable verbose/debug logging",
-    ),
-) -> None:
+def step_run_cmd(args: argparse.Namespace) -> int:
     """Run a workflow step in Argo container mode.
 
     This command is designed to be called by Argo Workflows with environment variables
@@ -387,47 +315,372 @@ def step_run_cmd(
     Example:
         TASKKIT_STEP_NAME=init TASKKIT_TASK_ID=test-123 ... task-run step run
     """
-    # Import step handlers to populate registry
-    import homelab_taskkit.tasks  # noqa: F401
-
-    with contextlib.suppress(ImportError):
-        import homelab_taskkit.steps  # noqa: F401
-
+    from homelab_taskkit.build_registry import DEFAULT_MANIFEST_PATH
     from homelab_taskkit.workflow import step_runner_main
 
-    exit_code = step_runner_main(debug=verbose)
-    raise typer.Exit(code=exit_code)
+    # The runner imports step handlers itself, scoped by the build-time manifest
+    # or TASKKIT_HANDLER_PREFIX, and falls back to importing every package
+    manifest_path = DEFAULT_MANIFEST_PATH if DEFAULT_MANIFEST_PATH.is_file() else None
+    return step_runner_main(debug=args.verbose, manifest_path=manifest_path)
 
 
-@step_app.command("env")
-def step_env_cmd() -> None:
+def step_env_cmd(args: argparse.Namespace) -> int:
     """Show the expected environment variables for step execution.
 
     Lists all TASKKIT_* environment variables used by the step runner,
     their current values (if set), and whether they are required.
     """
-    from homelab_taskkit.workflow.env import ENV_VARS, REQUIRED_ENV_VARS
+    from homelab_taskkit.workflow.env import ENV_VARS_SORTED, REQUIRED_ENV_VARS
+
+    get = os.environ.get
+
+    if not sys.stdout.isatty():
+        _write_tsv(
+            ("Variable", "Required", "Current Value"),
+            [
+                (env_var, "Yes" if env_var in REQUIRED_ENV_VARS else "No", get(env_var, ""))
+                for _field_name, env_var in ENV_VARS_SORTED
+            ],
+        )
+        return 0
 
-    import os
+    from rich.table import Table
 
     table = Table(title="TASKKIT Environment Variables")
     table.add_column("Variable", style="cyan", no_wrap=True)
     table.add_column("Required", style="yellow")
     table.add_column("Current Value", style="green")
 
-    for field_name, env_var in sorted(ENV_VARS.items(), key=lambda x: x[1]):
+    for _field_name, env_var in ENV_VARS_SORTED:
         required = "Yes" if env_var in REQUIRED_ENV_VARS else "No"
-        value = os.environ.get(env_var, "[not set]")
+        value = get(env_var, "[not set]")
         if len(value) > 50:
             value = value[:47] + "..."
         table.add_row(env_var, required, value)
 
-    console.print(table)
+    _get_console().print(table)
+    return 0
+
+
+def _new_parser(
+    key: tuple[str, ...], handler: Callable[[argparse.Namespace], int]
+) -> ArgumentParser:
+    """Create a parser for one command, described by its handler's docstring."""
+    return argparse.ArgumentParser(
+        prog=" ".join((_PROG, *key)),
+        description=_summary(handler),
+    )
+
+
+def _run_parser() -> ArgumentParser:
+    parser = _new_parser(("run",), run_cmd)
+    parser.add_argument("task_name", help="Name of the task to run")
+    parser.add_argument(
+        "--input",
+        "-i",
+        dest="input_source",
+        required=True,
+        help="Path to input JSON file or inline JSON string",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        dest="output_path",
+        required=True,
+        help="Path to write the output JSON",
+    )
+    parser.add_argument(
+        "--schemas",
+        "-s",
+        dest="schemas_root",
+        default="schemas",
+        help="Root directory containing task schemas",
+    )
+    parser.add_argument(
+        "--context",
+        dest="context_enabled",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Enable/disable context artifacts (default: auto-detect)",
+    )
+    parser.add_argument(
+        "--context-in",
+        default=None,
+        help="Path to input context JSON (default: /inputs/context.json)",
+    )
+    parser.add_argument(
+        "--context-out",
+        default=None,
+        help="Path to output context JSON (default: /outputs/context.json)",
+    )
+    parser.add_argument(
+        "--max-context-bytes",
+        type=int,
+        default=32 * 1024,
+        help="Maximum context size in bytes (default: 32KB)",
+    )
+    parser.add_argument(
+        "--messages",
+        dest="messages_enabled",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Enable/disable messages artifact (default: auto-detect based on /outputs)",
+    )
+    parser.add_argument(
+        "--messages-out",
+        default=None,
+        help="Path to write messages JSON; a .jsonl suffix appends JSON Lines "
+        "(default: /outputs/messages.json)",
+    )
+    parser.add_argument(
+        "--fanout",
+        dest="fanout_enabled",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Enable/disable fanout artifact (default: auto-detect based on /outputs)",
+    )
+    parser.add_argument(
+        "--fanout-out",
+        default=None,
+        help="Path to write fanout JSON; a .jsonl suffix writes JSON Lines "
+        "(default: /outputs/fanout.json)",
+    )
+    return parser
+
+
+def _list_parser() -> ArgumentParser:
+    return _new_parser(("list",), list_cmd)
+
+
+def _schema_parser() -> ArgumentParser:
+    parser = _new_parser(("schema",), schema_cmd)
+    parser.add_argument("task_name", help="Name of the task")
+    parser.add_argument(
+        "--type",
+        "-t",
+        dest="schema_type",
+        default="input",
+        choices=sorted(_SCHEMA_TYPES),
+        help="Schema type: 'input' or 'output'",
+    )
+    parser.add_argument(
+        "--schemas",
+        "-s",
+        dest="schemas_root",
+        default="schemas",
+        help="Root directory containing task schemas",
+    )
+    return parser
+
+
+def _workflow_run_parser() -> ArgumentParser:
+    parser = _new_parser(("workflow", "run"), workflow_run_cmd)
+    parser.add_argument(
+        "--workflow",
+        "-w",
+        dest="workflow_path",
+        required=True,
+        help="Path to workflow YAML file",
+    )
+    parser.add_argument(
+        "--params",
+        "-p",
+        dest="params_path",
+        default=None,
+        help="Path to params JSON file",
+    )
+    parser.add_argument(
+        "--workdir",
+        default=None,
+        help="Working directory for execution (default: auto-generated)",
+    )
+    parser.add_argument(
+        "--task-id",
+        default=None,
+        help="Task ID for the run (default: auto-generated)",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    return parser
+
+
+def _workflow_validate_parser() -> ArgumentParser:
+    parser = _new_parser(("workflow", "validate"), workflow_validate_cmd)
+    parser.add_argument(
+        "--workflow",
+        "-w",
+        dest="workflow_path",
+        required=True,
+        help="Path to workflow YAML file",
+    )
+    return parser
+
+
+def _workflow_list_steps_parser() -> ArgumentParser:
+    return _new_parser(("workflow", "list-steps"), workflow_list_steps_cmd)
+
+
+def _step_run_parser() -> ArgumentParser:
+    parser = _new_parser(("step", "run"), step_run_cmd)
+    parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose/debug logging")
+    return parser
+
+
+def _step_env_parser() -> ArgumentParser:
+    return _new_parser(("step", "env"), step_env_cmd)
+
+
+# Command groups: name -> help text
+_GROUPS: Mapping[str, str] = MappingProxyType(
+    {
+        "workflow": "Workflow execution commands.",
+        "step": "Step execution commands (for Argo containers).",
+    }
+)
+
+# Command path (argv prefix) -> handler
+COMMANDS: Mapping[tuple[str, ...], Callable[[argparse.Namespace], int]] = MappingProxyType(
+    {
+        ("run",): run_cmd,
+        ("list",): list_cmd,
+        ("schema",): schema_cmd,
+        ("workflow", "run"): workflow_run_cmd,
+        ("workflow", "validate"): workflow_validate_cmd,
+        ("workflow", "list-steps"): workflow_list_steps_cmd,
+        ("step", "run"): step_run_cmd,
+        ("step", "env"): step_env_cmd,
+    }
+)
+
+# Command path -> parser factory; parsers are built on first use only
+_PARSER_FACTORIES: Mapping[tuple[str, ...], Callable[[], ArgumentParser]] = MappingProxyType(
+    {
+        ("run",): _run_parser,
+        ("list",): _list_parser,
+        ("schema",): _schema_parser,
+        ("workflow", "run"): _workflow_run_parser,
+        ("workflow", "validate"): _workflow_validate_parser,
+        ("workflow", "list-steps"): _workflow_list_steps_parser,
+        ("step", "run"): _step_run_parser,
+        ("step", "env"): _step_env_parser,
+    }
+)
+
+_PARSERS: dict[tuple[str, ...], ArgumentParser] = {}
+
+_HELP_FLAGS = frozenset({"-h", "--help"})
+_VERBOSE_FLAGS = frozenset({"-v", "--verbose"})
+
+# Terminal commands that have written all their files before returning; main()
+# skips interpreter teardown for these (one container process per step)
+_FAST_EXIT_COMMANDS = frozenset({("run",), ("step", "run")})
+
+
+def _summary(handler: Callable[..., Any]) -> str:
+    """First line of a handler's docstring, used as its help text."""
+    return (handler.__doc__ or "").strip().split("\n", 1)[0]
+
+
+def _get_parser(key: tuple[str, ...]) -> ArgumentParser:
+    """Return the parser for a command, building and caching it on first use."""
+    parser = _PARSERS.get(key)
+    if parser is None:
+        parser = _PARSERS[key] = _PARSER_FACTORIES[key]()
+    return parser
+
+
+def _format_help(group: str | None = None) -> str:
+    """Format the usage text for the top level or for a command group.
+
+    Args:
+        group: Group name (e.g. "workflow"), or None for the top level
+
+    Returns:
+        Help text listing the available commands
+    """
+    if group is None:
+        prog = _PROG
+        description = _DESCRIPTION
+        entries = [
+            (key[0], _summary(handler)) for key, handler in COMMANDS.items() if len(key) == 1
+        ]
+        entries.extend(_GROUPS.items())
+    else:
+        prog = f"{_PROG} {group}"
+        description = _GROUPS[group]
+        entries = [
+            (key[1], _summary(handler)) for key, handler in COMMANDS.items() if key[0] == group
+        ]
+
+    width = max(len(name) for name, _ in entries)
+    lines = [f"usage: {prog} COMMAND [ARGS]...", "", description, "", "commands:"]
+    lines.extend(f"  {name.ljust(width)}  {summary}" for name, summary in entries)
+    return "\n".join(lines) + "\n"
+
+
+def _usage_error(message: str, group: str | None = None) -> int:
+    sys.stderr.write(_format_help(group))
+    sys.stderr.write(f"\n{_PROG}: error: {message}\n")
+    return 2
+
+
+def app(argv: list[str] | None = None) -> int:
+    """Parse arguments and dispatch to the selected command.
+
+    The command path (one or two leading tokens) is looked up in COMMANDS;
+    only that command's parser is built to handle the remaining arguments.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Exit code of the command
+    """
+    args = sys.argv[1:] if argv is None else argv
+
+    # Fast path for the Argo hot path: `step run [-v]` takes all real input from
+    # TASKKIT_* env vars, so skip parser construction entirely
+    if args[:2] == ["step", "run"] and _VERBOSE_FLAGS.issuperset(args[2:]):
+        return step_run_cmd(argparse.Namespace(verbose=len(args) > 2))
+
+    # `run` is the other container entry point: go straight to its parser
+    if args[:1] == ["run"]:
+        return run_cmd(_get_parser(("run",)).parse_args(args[1:]))
+
+    if not args or args[0] in _HELP_FLAGS:
+        sys.stdout.write(_format_help())
+        return 0
+
+    head = args[0]
+    if head in _GROUPS:
+        if len(args) < 2 or args[1] in _HELP_FLAGS:
+            sys.stdout.write(_format_help(head))
+            return 0
+        key: tuple[str, ...] = (head, args[1])
+        if key not in COMMANDS:
+            return _usage_error(f"unknown command '{args[1]}'", head)
+        rest = args[2:]
+    else:
+        key = (head,)
+        if key not in COMMANDS:
+            return _usage_error(f"unknown command '{head}'")
+        rest = args[1:]
+
+    return COMMANDS[key](_get_parser(key).parse_args(rest))
 
 
 def main() -> None:
     """Entry point for the CLI."""
-    app()
+    argv = sys.argv[1:]
+    code = app(argv)
+    if tuple(argv[:1]) in _FAST_EXIT_COMMANDS or tuple(argv[:2]) in _FAST_EXIT_COMMANDS:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+    sys.exit(code)
+
+
+if os.environ.get(EAGER_IMPORT_ENV):
+    _ensure_tasks_loaded(steps=True)
 
 
 if __name__ == "__main__":
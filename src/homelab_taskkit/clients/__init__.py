@@ -4,7 +4,15 @@ These provide reusable HTTP and webhook functionality
 that tasks can compose into their logic.
 """
 
-from homelab_taskkit.clients.http import HTTPResponse, request
-from homelab_taskkit.clients.webhook import WebhookPayload, send_webhook
+from homelab_taskkit.clients.http import HTTPResponse, arequest, default_client, request
+from homelab_taskkit.clients.webhook import WebhookPayload, send_webhook, send_webhook_async
 
-__all__ = ["request", "HTTPResponse", "send_webhook", "WebhookPayload"]
+__all__ = [
+    "request",
+    "arequest",
+    "default_client",
+    "HTTPResponse",
+    "send_webhook",
+    "send_webhook_async",
+    "WebhookPayload",
+]
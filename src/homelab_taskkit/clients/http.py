@@ -8,19 +8,28 @@ Provides a clean interface for HTTP requests with:
 
 from __future__ import annotations
 
+import atexit
 import contextlib
+import importlib.util
 import logging
+import re
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from typing import Any
 
 import httpx
 
+from homelab_taskkit import _json
 from homelab_taskkit.errors import HTTPError, TimeoutError
 
 logger = logging.getLogger(__name__)
 
+# Webhook endpoints whose last path segment is a secret token
+_WEBHOOK_URL_RE = re.compile(r"(discord(?:app)?\.com/api/webhooks|hooks\.slack\.com)")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class HTTPResponse:
     """Structured HTTP response.
 
@@ -28,16 +37,16 @@ class HTTPResponse:
         status_code: HTTP status code (200, 404, etc.)
         body: Response body as string
         json: Parsed JSON body (None if not JSON)
-        headers: Response headers as dict
-        elapsed_ms: Request duration in milliseconds
+        headers: Response headers (case-insensitive mapping for real responses)
+        elapsed_ms: Request duration in whole milliseconds
         ok: True if status code is 2xx
     """
 
     status_code: int
     body: str
     json: dict[str, Any] | list[Any] | None
-    headers: dict[str, str]
-    elapsed_ms: float
+    headers: Mapping[str, str]
+    elapsed_ms: int
 
     @property
     def ok(self) -> bool:
@@ -45,6 +54,33 @@ class HTTPResponse:
         return 200 <= self.status_code < 300
 
 
+@cache
+def http2_available() -> bool:
+    """Return True if the optional ``h2`` package is installed (``http2`` extra)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@cache
+def default_client() -> httpx.Client:
+    """Return a process-wide pooled client for callers without their own.
+
+    Connections are kept alive between calls, so repeated requests to the same
+    host skip the TCP/TLS handshake. HTTP/2 is used when the optional ``h2``
+    package is installed. The client is closed at interpreter exit.
+
+    Returns:
+        Shared httpx.Client (pass it to request()).
+    """
+    client = httpx.Client(
+        http2=http2_available(),
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(30.0),
+        follow_redirects=True,
+    )
+    atexit.register(client.close)
+    return client
+
+
 def request(
     client: httpx.Client,
     method: str,
@@ -57,7 +93,7 @@ def request(
     """Make an HTTP request with consistent error handling.
 
     Args:
-        client: httpx.Client instance (from deps.http)
+        client: httpx.Client instance (from deps.http, or default_client())
         method: HTTP method (GET, POST, PUT, PATCH, DELETE)
         url: Target URL
         headers: Optional request headers
@@ -71,8 +107,10 @@ def request(
         HTTPError: If request fails with HTTP error status
         TimeoutError: If request times out
     """
-    log_url = _redact_url(url)
-    logger.debug(f"HTTP {method} {log_url}")
+    # Skip URL redaction and message formatting unless debug logging is on
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("HTTP %s %s", method, _redact_url(url))
 
     try:
         response = client.request(
@@ -82,37 +120,121 @@ def request(
             json=json_body,
             timeout=timeout,
         )
-    except httpx.TimeoutException as e:
-        raise TimeoutError(
-            f"Request timed out: {method} {log_url}",
-            timeout_seconds=timeout or client.timeout.connect,
-        ) from e
     except httpx.RequestError as e:
-        raise HTTPError(
-            f"Request failed: {e}",
-            url=log_url,
-            method=method,
-        ) from e
+        raise _request_error(e, method, _redact_url(url), timeout or client.timeout.connect) from e
+
+    result = _build_response(response)
+    if debug:
+        logger.debug(
+            "HTTP %s %s -> %s in %sms",
+            method,
+            _redact_url(url),
+            result.status_code,
+            result.elapsed_ms,
+        )
+    return result
+
+
+async def arequest(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    json_body: dict[str, Any] | list[Any] | None = None,
+    timeout: float | None = None,
+) -> HTTPResponse:
+    """Async variant of request() for issuing several calls concurrently.
+
+    Tasks making more than one call can gather them, e.g.
+    ``asyncio.run(asyncio.gather(*(arequest(client, "GET", u) for u in urls)))``.
+
+    Args:
+        client: httpx.AsyncClient instance
+        method: HTTP method (GET, POST, PUT, PATCH, DELETE)
+        url: Target URL
+        headers: Optional request headers
+        json_body: Optional JSON body for POST/PUT/PATCH
+        timeout: Optional timeout override (uses client default if not set)
+
+    Returns:
+        HTTPResponse with status, body, and parsed JSON
+
+    Raises:
+        HTTPError: If request fails with HTTP error status
+        TimeoutError: If request times out
+    """
+    # Skip URL redaction and message formatting unless debug logging is on
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("HTTP %s %s", method, _redact_url(url))
+
+    try:
+        response = await client.request(
+            method=method.upper(),
+            url=url,
+            headers=headers,
+            json=json_body,
+            timeout=timeout,
+        )
+    except httpx.RequestError as e:
+        raise _request_error(e, method, _redact_url(url), timeout or client.timeout.connect) from e
+
+    result = _build_response(response)
+    if debug:
+        logger.debug(
+            "HTTP %s %s -> %s in %sms",
+            method,
+            _redact_url(url),
+            result.status_code,
+            result.elapsed_ms,
+        )
+    return result
+
+
+def _request_error(
+    error: httpx.RequestError, method: str, log_url: str, timeout: float | None
+) -> HTTPError | TimeoutError:
+    """Map an httpx transport error to the taskkit error type."""
+    if isinstance(error, httpx.TimeoutException):
+        return TimeoutError(f"Request timed out: {method} {log_url}", timeout_seconds=timeout)
+    return HTTPError(f"Request failed: {error}", url=log_url, method=method)
+
 
+def _build_response(response: httpx.Response) -> HTTPResponse:
+    """Convert an httpx response into an HTTPResponse."""
     # Parse JSON if content-type indicates JSON
     json_data = None
     content_type = response.headers.get("content-type", "")
     if "application/json" in content_type:
         with contextlib.suppress(ValueError):
-            json_data = response.json()
+            json_data = _json.loads(response.content)
 
-    elapsed_ms = round(response.elapsed.total_seconds() * 1000, 2)
-
-    result = HTTPResponse(
+    # Integer milliseconds straight from the timedelta fields, no float math
+    elapsed = response.elapsed
+    return HTTPResponse(
         status_code=response.status_code,
         body=response.text,
         json=json_data,
-        headers=dict(response.headers),
-        elapsed_ms=elapsed_ms,
+        headers=response.headers,
+        elapsed_ms=(elapsed.days * 86400 + elapsed.seconds) * 1000 + elapsed.microseconds // 1000,
     )
 
-    logger.debug(f"HTTP {method} {log_url} -> {result.status_code} in {elapsed_ms}ms")
-    return result
+
+@lru_cache(maxsize=512)
+def _webhook_kind(url: str) -> str:
+    """Classify a URL as a Discord or Slack webhook.
+
+    Results are cached per URL, since a deployment posts to the same few
+    webhooks over and over.
+
+    Returns:
+        'discord', 'slack', or 'unknown'
+    """
+    match = _WEBHOOK_URL_RE.search(url)
+    if match is None:
+        return "unknown"
+    return "discord" if match.group(1).startswith("discord") else "slack"
 
 
 def _redact_url(url: str) -> str:
@@ -120,14 +242,8 @@ def _redact_url(url: str) -> str:
 
     Hides webhook tokens, API keys in query params, etc.
     """
-    # Redact Discord/Slack webhook tokens
-    if "discord.com/api/webhooks" in url or "discordapp.com/api/webhooks" in url:
-        parts = url.split("/")
-        if len(parts) >= 2:
-            return "/".join(parts[:-1]) + "/***"
-    if "hooks.slack.com" in url:
-        parts = url.split("/")
-        if len(parts) >= 2:
-            return "/".join(parts[:-1]) + "/***"
-
-    return url
+    # Redact Discord/Slack webhook tokens (the last path segment)
+    if _webhook_kind(url) == "unknown":
+        return url
+    prefix, sep, _ = url.rpartition("/")
+    return f"{prefix}/***" if sep else url
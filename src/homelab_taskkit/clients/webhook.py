@@ -5,13 +5,15 @@ Provides payload building and delivery for common webhook types.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Any
 
 import httpx
 
-from homelab_taskkit.clients.http import HTTPResponse, request
+from homelab_taskkit.clients.http import HTTPResponse, _webhook_kind, arequest, request
 from homelab_taskkit.errors import WebhookError
 
 
@@ -44,11 +46,7 @@ def detect_webhook_type(url: str) -> str:
     Returns:
         'discord', 'slack', or 'unknown'
     """
-    if "discord.com/api/webhooks" in url or "discordapp.com/api/webhooks" in url:
-        return "discord"
-    elif "hooks.slack.com" in url:
-        return "slack"
-    return "unknown"
+    return _webhook_kind(url)
 
 
 def send_webhook(
@@ -57,6 +55,7 @@ def send_webhook(
     payload: WebhookPayload,
     *,
     timeout: float = 30.0,
+    now_iso: str | None = None,
 ) -> HTTPResponse:
     """Send a webhook notification.
 
@@ -67,6 +66,8 @@ def send_webhook(
         url: Webhook URL (Discord, Slack, or generic)
         payload: WebhookPayload with message content
         timeout: Request timeout in seconds
+        now_iso: Embed timestamp to use; pass one value (see utc_timestamp)
+            when sending a burst of notifications. Defaults to the current time.
 
     Returns:
         HTTPResponse from the webhook endpoint
@@ -76,12 +77,7 @@ def send_webhook(
     """
     webhook_type = detect_webhook_type(url)
 
-    if webhook_type == "discord":
-        body = _build_discord_payload(payload)
-    elif webhook_type == "slack":
-        body = _build_slack_payload(payload)
-    else:
-        body = _build_generic_payload(payload)
+    body = _BUILDERS.get(webhook_type, _BUILDERS["unknown"])(payload, now_iso)
 
     try:
         response = request(
@@ -98,6 +94,59 @@ def send_webhook(
             webhook_type=webhook_type,
         ) from e
 
+    return _check_response(response, webhook_type)
+
+
+async def send_webhook_async(
+    client: httpx.AsyncClient,
+    url: str,
+    payload: WebhookPayload,
+    *,
+    timeout: float = 30.0,
+    now_iso: str | None = None,
+) -> HTTPResponse:
+    """Async variant of send_webhook() for fan-out notifications.
+
+    Tasks sending more than one webhook can deliver them concurrently:
+    ``await asyncio.gather(*(send_webhook_async(client, u, payload) for u in urls))``.
+
+    Args:
+        client: httpx.AsyncClient instance
+        url: Webhook URL (Discord, Slack, or generic)
+        payload: WebhookPayload with message content
+        timeout: Request timeout in seconds
+        now_iso: Embed timestamp to use (defaults to the current time)
+
+    Returns:
+        HTTPResponse from the webhook endpoint
+
+    Raises:
+        WebhookError: If webhook delivery fails
+    """
+    webhook_type = detect_webhook_type(url)
+
+    body = _BUILDERS.get(webhook_type, _BUILDERS["unknown"])(payload, now_iso)
+
+    try:
+        response = await arequest(
+            client,
+            "POST",
+            url,
+            json_body=body,
+            headers={"Content-Type": "application/json"},
+            timeout=timeout,
+        )
+    except Exception as e:
+        raise WebhookError(
+            f"Failed to deliver {webhook_type} webhook: {e}",
+            webhook_type=webhook_type,
+        ) from e
+
+    return _check_response(response, webhook_type)
+
+
+def _check_response(response: HTTPResponse, webhook_type: str) -> HTTPResponse:
+    """Raise WebhookError for a non-2xx webhook response."""
     if not response.ok:
         raise WebhookError(
             "Webhook returned error status",
@@ -108,66 +157,130 @@ def send_webhook(
     return response
 
 
-def _build_discord_payload(payload: WebhookPayload) -> dict[str, Any]:
-    """Build Discord webhook payload with embed."""
-    result: dict[str, Any] = {"username": payload.username}
+def utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string (second precision)."""
+    return f"{datetime.now(UTC):%Y-%m-%dT%H:%M:%S}Z"
 
-    if payload.avatar_url:
-        result["avatar_url"] = payload.avatar_url
 
-    # Use embed if we have title, color, or fields
-    if payload.title or payload.color or payload.fields:
-        embed: dict[str, Any] = {"description": payload.message}
+def _discord_color(color: str) -> int:
+    """Convert a hex color to the integer Discord expects."""
+    return int(color.lstrip("#"), 16)
+
+
+def _discord_fields(fields: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {"name": f["name"], "value": f["value"], "inline": f.get("inline", False)} for f in fields
+    ]
+
+
+def _slack_color(color: str) -> str:
+    """Slack uses hex without #."""
+    return color.lstrip("#")
+
+
+def _slack_fields(fields: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return [
+        {"title": f["name"], "value": f["value"], "short": f.get("inline", False)} for f in fields
+    ]
+
 
-        if payload.title:
-            embed["title"] = payload.title
+# Optional embed/attachment parts as (key, payload attribute, converter), in output order
+_DISCORD_PARTS: tuple[tuple[str, str, Callable[[Any], Any] | None], ...] = (
+    ("title", "title", None),
+    ("color", "color", _discord_color),
+    ("fields", "fields", _discord_fields),
+)
+_SLACK_PARTS: tuple[tuple[str, str, Callable[[Any], Any] | None], ...] = (
+    ("title", "title", None),
+    ("color", "color", _slack_color),
+    ("fields", "fields", _slack_fields),
+)
 
-        if payload.color:
-            # Convert hex color to integer
-            embed["color"] = int(payload.color.lstrip("#"), 16)
 
-        if payload.fields:
-            embed["fields"] = [
-                {"name": f["name"], "value": f["value"], "inline": f.get("inline", False)}
-                for f in payload.fields
-            ]
+def _shape(payload: WebhookPayload) -> tuple[bool, bool, bool]:
+    """Which optional parts (title, color, fields) a payload uses."""
+    return bool(payload.title), bool(payload.color), bool(payload.fields)
 
-        embed["timestamp"] = datetime.now(UTC).isoformat()
+
+@lru_cache(maxsize=16)
+def _discord_builder(
+    shape: tuple[bool, bool, bool], has_avatar: bool
+) -> Callable[[WebhookPayload, str | None], dict[str, Any]]:
+    """Return a Discord payload builder specialized for one payload shape.
+
+    The presence checks run once per shape here instead of on every call;
+    the returned builder only copies the parts the shape says are set.
+    """
+    parts = tuple(part for part, present in zip(_DISCORD_PARTS, shape, strict=True) if present)
+
+    if not parts:
+
+        def build(payload: WebhookPayload, now_iso: str | None = None) -> dict[str, Any]:
+            result: dict[str, Any] = {"username": payload.username}
+            if has_avatar:
+                result["avatar_url"] = payload.avatar_url
+            result["content"] = payload.message
+            return result
+
+        return build
+
+    def build_embed(payload: WebhookPayload, now_iso: str | None = None) -> dict[str, Any]:
+        result: dict[str, Any] = {"username": payload.username}
+        if has_avatar:
+            result["avatar_url"] = payload.avatar_url
+        embed: dict[str, Any] = {"description": payload.message}
+        for key, attr, convert in parts:
+            value = getattr(payload, attr)
+            embed[key] = convert(value) if convert else value
+        embed["timestamp"] = now_iso or utc_timestamp()
         result["embeds"] = [embed]
-    else:
-        result["content"] = payload.message
+        return result
 
-    return result
+    return build_embed
 
 
-def _build_slack_payload(payload: WebhookPayload) -> dict[str, Any]:
-    """Build Slack webhook payload with attachment."""
-    result: dict[str, Any] = {"username": payload.username}
+@lru_cache(maxsize=8)
+def _slack_builder(
+    shape: tuple[bool, bool, bool],
+) -> Callable[[WebhookPayload], dict[str, Any]]:
+    """Return a Slack payload builder specialized for one payload shape."""
+    parts = tuple(part for part, present in zip(_SLACK_PARTS, shape, strict=True) if present)
+
+    if not parts:
+
+        def build(payload: WebhookPayload) -> dict[str, Any]:
+            return {"username": payload.username, "text": payload.message}
+
+        return build
 
-    # Use attachment if we have title, color, or fields
-    if payload.title or payload.color or payload.fields:
+    def build_attachment(payload: WebhookPayload) -> dict[str, Any]:
         attachment: dict[str, Any] = {"text": payload.message}
+        for key, attr, convert in parts:
+            value = getattr(payload, attr)
+            attachment[key] = convert(value) if convert else value
+        return {"username": payload.username, "attachments": [attachment]}
 
-        if payload.title:
-            attachment["title"] = payload.title
+    return build_attachment
 
-        if payload.color:
-            # Slack uses hex without #
-            attachment["color"] = payload.color.lstrip("#")
 
-        if payload.fields:
-            attachment["fields"] = [
-                {"title": f["name"], "value": f["value"], "short": f.get("inline", False)}
-                for f in payload.fields
-            ]
+def _build_discord_payload(payload: WebhookPayload, now_iso: str | None = None) -> dict[str, Any]:
+    """Build Discord webhook payload, with an embed if title, color, or fields are set."""
+    return _discord_builder(_shape(payload), bool(payload.avatar_url))(payload, now_iso)
 
-        result["attachments"] = [attachment]
-    else:
-        result["text"] = payload.message
 
-    return result
+def _build_slack_payload(payload: WebhookPayload) -> dict[str, Any]:
+    """Build Slack webhook payload, with an attachment if title, color, or fields are set."""
+    return _slack_builder(_shape(payload))(payload)
 
 
 def _build_generic_payload(payload: WebhookPayload) -> dict[str, Any]:
     """Build generic webhook payload."""
     return {"text": payload.message, "username": payload.username}
+
+
+# Webhook type -> payload builder taking (payload, now_iso)
+_BUILDERS: dict[str, Callable[[WebhookPayload, str | None], dict[str, Any]]] = {
+    "discord": _build_discord_payload,
+    "slack": lambda payload, _now_iso: _build_slack_payload(payload),
+    "unknown": lambda payload, _now_iso: _build_generic_payload(payload),
+}
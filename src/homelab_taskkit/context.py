@@ -17,11 +17,13 @@ Naming rules (enforced by context_rules.py):
 
 from __future__ import annotations
 
-import json
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from homelab_taskkit import _io_common, _json
 from homelab_taskkit.errors import ContextError, ContextSizeError
 
 # Constants
@@ -32,32 +34,52 @@ CONTEXT_PATCH_KEY = "__taskkit_context_patch__"
 MAX_CONTEXT_BYTES = 32 * 1024  # 32KB
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskkitContext:
     """Immutable context container.
 
     Attributes:
         version: Context format version string.
-        vars: The context variables (namespaced keys).
+        vars: Read-only view of the context variables (namespaced keys).
+            Consumers can hold on to it without copying; code that needs
+            a mutable dict must copy explicitly with dict(ctx.vars).
     """
 
     version: str = CONTEXT_VERSION
-    vars: dict[str, Any] = field(default_factory=dict)
+    vars: Mapping[str, Any] = field(default_factory=dict)
+    # The dict behind the vars proxy, handed to the encoder as-is
+    _vars: dict[str, Any] = field(init=False, repr=False, compare=False)
+    # Compact, newline-terminated JSON encoding, filled in on first serialization.
+    # Contexts are treated as immutable, so vars must not be mutated once serialized.
+    _encoded: bytes | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # A plain dict is owned as-is; any other mapping (including another
+        # context's proxy) is copied once so the proxy never aliases a view
+        vars_ = self.vars
+        raw = vars_ if type(vars_) is dict else dict(vars_)
+        object.__setattr__(self, "_vars", raw)
+        object.__setattr__(self, "vars", MappingProxyType(raw))
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {"version": self.version, "vars": self.vars}
+        return {"version": self.version, "vars": self._vars}
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> TaskkitContext:
-        """Create from dictionary."""
+        """Create from dictionary.
+
+        The "vars" dict is used as-is rather than copied, so the new context
+        owns it; callers must not mutate it afterwards.
+        """
+        vars_ = data.get("vars")
         return cls(
             version=data.get("version", CONTEXT_VERSION),
-            vars=dict(data.get("vars", {})),
+            vars=vars_ if isinstance(vars_, dict) else {},
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContextPatch:
     """Context patch with set/unset operations.
 
@@ -87,15 +109,16 @@ def load_context(path: str | Path) -> TaskkitContext:
     Raises:
         ContextError: If file exists but contains invalid JSON or structure.
     """
-    path = Path(path)
-
-    if not path.exists():
+    # Single binary read; a missing file is the common "no upstream context" case
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
         return empty_context()
 
     try:
-        with open(path) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
+        data = _json.loads(raw)
+    except _json.JSONDecodeError as e:
         raise ContextError(f"Invalid JSON in context file: {e}") from e
 
     if not isinstance(data, dict):
@@ -116,6 +139,7 @@ def extract_context_patch(
     task_output: dict[str, Any],
     *,
     patch_key: str = CONTEXT_PATCH_KEY,
+    consume: bool = False,
 ) -> tuple[dict[str, Any], ContextPatch | None]:
     """Extract context patch from task output.
 
@@ -123,8 +147,11 @@ def extract_context_patch(
     and the parsed patch.
 
     Args:
-        task_output: Raw task output dictionary.
+        task_output: Raw task output dictionary (anything else is returned as is).
         patch_key: Key containing the context patch.
+        consume: Remove the key from task_output in place instead of copying
+            it. Only for callers that own task_output; it is left unchanged
+            if the patch is invalid.
 
     Returns:
         Tuple of (cleaned_output, patch or None).
@@ -132,16 +159,25 @@ def extract_context_patch(
     Raises:
         ContextError: If patch has invalid structure.
     """
-    if patch_key not in task_output:
+    # Non-dict output carries no reserved keys and passes through unchanged;
+    # otherwise one lookup covers the common case where the key is absent
+    if not isinstance(task_output, dict):
         return task_output, None
+    patch_data = task_output.get(patch_key, _io_common.MISSING)
+    if patch_data is _io_common.MISSING:
+        return task_output, None
+
+    patch = None if patch_data is None else _parse_patch(patch_data)
 
-    # Clone output and extract patch
-    clean_output = dict(task_output)
-    patch_data = clean_output.pop(patch_key)
+    # Shallow-copy (dict.copy is a single C-level copy) so the caller's output is
+    # left untouched, unless the caller handed over ownership of it
+    clean_output = task_output if consume else task_output.copy()
+    del clean_output[patch_key]
+    return clean_output, patch
 
-    if patch_data is None:
-        return clean_output, None
 
+def _parse_patch(patch_data: Any) -> ContextPatch:
+    """Validate a context patch payload and build the ContextPatch."""
     if not isinstance(patch_data, dict):
         raise ContextError(f"context_patch must be an object, got {type(patch_data).__name__}")
 
@@ -155,14 +191,18 @@ def extract_context_patch(
     if not isinstance(unset_ops, list):
         raise ContextError("context_patch.unset must be an array")
 
-    # Validate unset values are strings
-    for key in unset_ops:
-        if not isinstance(key, str):
-            raise ContextError(
-                f"context_patch.unset values must be strings, got {type(key).__name__}"
-            )
+    # Validate unset values are strings: str.join checks the batch in C, and
+    # the per-key loop only runs to name the offending type
+    try:
+        "\x00".join(unset_ops)
+    except TypeError:
+        for key in unset_ops:
+            if not isinstance(key, str):
+                raise ContextError(
+                    f"context_patch.unset values must be strings, got {type(key).__name__}"
+                ) from None
 
-    return clean_output, ContextPatch(set=set_ops, unset=unset_ops)
+    return ContextPatch(set=set_ops, unset=unset_ops)
 
 
 def apply_patch(ctx: TaskkitContext, patch: ContextPatch | None) -> TaskkitContext:
@@ -180,7 +220,7 @@ def apply_patch(ctx: TaskkitContext, patch: ContextPatch | None) -> TaskkitConte
     if patch is None:
         return ctx
 
-    new_vars = dict(ctx.vars)
+    new_vars = ctx._vars.copy()
 
     # Apply unset first
     for key in patch.unset:
@@ -195,7 +235,22 @@ def apply_patch(ctx: TaskkitContext, patch: ContextPatch | None) -> TaskkitConte
 
 def serialized_size_bytes(ctx: TaskkitContext) -> int:
     """Return UTF-8 byte length of compact JSON serialization."""
-    return len(json.dumps(ctx.to_dict(), separators=(",", ":")).encode("utf-8"))
+    # Excludes the trailing newline _encode appends for the file
+    return len(_encode(ctx)) - 1
+
+
+def _encode(ctx: TaskkitContext) -> bytes:
+    """Return the compact UTF-8 JSON encoding of a context, newline-terminated.
+
+    The bytes are cached on the context, so the size check and the write in
+    write_context share one encode, and the file is written from them as-is.
+    """
+    data = ctx._encoded
+    if data is None:
+        # Trailing newline for POSIX compliance
+        data = _json.dumps(ctx.to_dict(), newline=True, default=str)
+        object.__setattr__(ctx, "_encoded", data)
+    return data
 
 
 def write_context(
@@ -203,13 +258,18 @@ def write_context(
     ctx: TaskkitContext,
     *,
     max_bytes: int = MAX_CONTEXT_BYTES,
+    indent: bool = False,
 ) -> None:
     """Write context to a JSON file with size validation.
 
+    The compact encoding used for the size check is what gets written, so
+    the context is serialized once unless indent is requested.
+
     Args:
         path: Path to write context JSON.
         ctx: Context to write.
         max_bytes: Maximum allowed size in bytes.
+        indent: Pretty-print the file for humans (costs a second encode).
 
     Raises:
         ContextSizeError: If serialized context exceeds max_bytes.
@@ -217,7 +277,8 @@ def write_context(
     path = Path(path)
 
     # Check size before writing
-    size = serialized_size_bytes(ctx)
+    data = _encode(ctx)
+    size = len(data) - 1
     if size > max_bytes:
         raise ContextSizeError(
             f"Context size {size} bytes exceeds limit of {max_bytes} bytes",
@@ -225,9 +286,10 @@ def write_context(
             max_bytes=max_bytes,
         )
 
+    if indent:
+        data = _json.dumps(ctx.to_dict(), indent=True, newline=True, default=str)
+
     # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _io_common.ensure_parent(path)
 
-    with open(path, "w") as f:
-        json.dump(ctx.to_dict(), f, indent=2, default=str)
-        f.write("\n")  # Trailing newline for POSIX compliance
+    _io_common.write_bytes(path, data)
@@ -11,6 +11,8 @@ ensure predictable, maintainable step-to-step coordination.
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import Any
 
 from homelab_taskkit.context import ContextPatch
@@ -19,6 +21,13 @@ from homelab_taskkit.context import ContextPatch
 GLOBAL_PREFIXES = ("pipeline.", "idempotency.")
 
 
+@lru_cache(maxsize=256)
+def _allowed_prefix_re(task_name: str) -> re.Pattern[str]:
+    """Compile one pattern matching every prefix a task may write."""
+    prefixes = (f"{task_name}.",) + GLOBAL_PREFIXES
+    return re.compile("|".join(map(re.escape, prefixes)))
+
+
 def validate_patch(task_name: str, patch: ContextPatch | dict[str, Any] | None) -> None:
     """Validate a context patch follows naming rules.
 
@@ -53,28 +62,30 @@ def validate_patch(task_name: str, patch: ContextPatch | dict[str, Any] | None)
     if not isinstance(to_unset, list):
         raise AssertionError("context_patch.unset must be an array")
 
-    # Build allowed prefixes for this task
-    allowed_prefixes = (f"{task_name}.",) + GLOBAL_PREFIXES
-
-    # Validate set keys
-    for key in to_set:
-        if not isinstance(key, str):
-            raise AssertionError(f"context key must be a string, got {type(key).__name__}")
-        if not any(key.startswith(prefix) for prefix in allowed_prefixes):
-            raise AssertionError(
-                f"context key '{key}' must be namespaced for task '{task_name}' "
-                f"(allowed prefixes: {', '.join(allowed_prefixes)})"
-            )
-
-    # Validate unset keys
-    for key in to_unset:
-        if not isinstance(key, str):
-            raise AssertionError("context_patch.unset values must be strings")
-        if not any(key.startswith(prefix) for prefix in allowed_prefixes):
-            raise AssertionError(
-                f"context key '{key}' must be namespaced for task '{task_name}' "
-                f"(allowed prefixes: {', '.join(allowed_prefixes)})"
-            )
+    # Validate key types. Keys are almost always plain str, so check the whole
+    # batch cheaply first and only walk the keys to build an error message
+    if not all(type(key) is str for key in to_set):
+        for key in to_set:
+            if not isinstance(key, str):
+                raise AssertionError(f"context key must be a string, got {type(key).__name__}")
+
+    try:
+        # str.join type-checks every item in C
+        "\x00".join(to_unset)
+    except TypeError:
+        raise AssertionError("context_patch.unset values must be strings") from None
+
+    # Validate namespacing of set and unset keys, reporting all offenders at once
+    match = _allowed_prefix_re(task_name).match
+    bad = [key for key in to_set if not match(key)]
+    bad.extend(key for key in to_unset if not match(key))
+    if bad:
+        allowed_prefixes = (f"{task_name}.",) + GLOBAL_PREFIXES
+        keys = ", ".join(f"'{key}'" for key in bad)
+        raise AssertionError(
+            f"context {'key' if len(bad) == 1 else 'keys'} {keys} must be namespaced "
+            f"for task '{task_name}' (allowed prefixes: {', '.join(allowed_prefixes)})"
+        )
 
 
 def validate_context_vars(context_vars: dict[str, Any]) -> list[str]:
@@ -90,24 +101,15 @@ def validate_context_vars(context_vars: dict[str, Any]) -> list[str]:
         List of warning messages for any non-compliant keys.
     """
     warnings = []
-    known_task_prefixes = {
-        "echo.",
-        "http_request.",
-        "json_transform.",
-        "conditional_check.",
-        "webhook_notify.",
-    }
-    all_known_prefixes = known_task_prefixes | set(GLOBAL_PREFIXES)
 
     for key in context_vars:
         if not isinstance(key, str):
             warnings.append(f"Non-string key in context: {key!r}")
             continue
 
-        # Check if key matches any known prefix
-        has_known_prefix = any(key.startswith(prefix) for prefix in all_known_prefixes)
-        # Warn if key has no known prefix and is not namespaced (missing dot)
-        if not has_known_prefix and "." not in key:
+        # Every known prefix (task names, pipeline., idempotency.) ends in '.',
+        # so a key is namespaced exactly when it contains a dot
+        if "." not in key:
             warnings.append(f"Context key '{key}' is not namespaced (missing '.')")
 
     return warnings
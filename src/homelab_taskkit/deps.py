@@ -2,26 +2,72 @@
 
 from __future__ import annotations
 
+import atexit
+import functools
 import logging
+import threading
 from collections.abc import Callable, Iterator, Mapping
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from types import MappingProxyType
-from typing import TYPE_CHECKING, Any
+from typing import Any, TypeVar
 
 import httpx
 
-if TYPE_CHECKING:
-    pass
+from homelab_taskkit import __version__
+from homelab_taskkit.clients.http import http2_available
 
 logger = logging.getLogger(__name__)
 
+# Logger handed to tasks as Deps.logger
+_TASK_LOGGER = logging.getLogger("homelab_taskkit.task")
+
 # Environment variable prefixes and keys
 TASKKIT_ENV_PREFIX = "TASKKIT_"
 
+_N = TypeVar("_N", int, float)
+
+# Clock for Deps.now: a C-level partial, so calls add no Python frame and it pickles
+_NOW_UTC = functools.partial(datetime.now, UTC)
+
+# Shared read-only context for build_deps calls without one
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+# Shared HTTP clients keyed by (timeout, max_connections, max_keepalive, keepalive_expiry)
+_CLIENT_CACHE: dict[tuple[float, int, int, float], httpx.Client] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# HTTP connection pool tuning (overridable per process via the environment)
+HTTP_MAX_CONNECTIONS_ENV = "TASKKIT_HTTP_MAX_CONNECTIONS"
+HTTP_MAX_KEEPALIVE_ENV = "TASKKIT_HTTP_MAX_KEEPALIVE"
+HTTP_KEEPALIVE_EXPIRY_ENV = "TASKKIT_HTTP_KEEPALIVE_EXPIRY"
+DEFAULT_HTTP_MAX_CONNECTIONS = 100
+DEFAULT_HTTP_MAX_KEEPALIVE = 20
+DEFAULT_HTTP_KEEPALIVE_EXPIRY = 30.0
+
+# TaskkitEnv field, source variable and converter (None keeps the string);
+# unset variables fall back to the dataclass defaults
+_TASKKIT_FIELDS: tuple[tuple[str, str, Callable[[str], Any] | None], ...] = (
+    ("task_id", "TASKKIT_TASK_ID", None),
+    ("run_id", "TASKKIT_RUN_ID", None),
+    ("step_name", "TASKKIT_STEP_NAME", None),
+    ("step_retry", "TASKKIT_STEP_RETRY", int),
+    ("total_retries", "TASKKIT_TOTAL_RETRIES", int),
+    ("workflow_name", "TASKKIT_WORKFLOW_NAME", None),
+    ("workflow_namespace", "TASKKIT_WORKFLOW_NAMESPACE", None),
+    ("node_name", "TASKKIT_NODE_NAME", None),
+    ("workflow_result", "TASKKIT_WORKFLOW_RESULT", None),
+    ("api_url", "TASKKIT_API_URL", None),
+    ("api_token", "TASKKIT_API_TOKEN", None),
+    ("step_params", "TASKKIT_STEP_PARAMS", None),
+)
+
+# Variables read by TaskkitEnv.from_env, in a fixed order for cache keys
+_TASKKIT_ENV_KEYS = tuple(key for _, key, _ in _TASKKIT_FIELDS)
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskkitEnv:
     """Structured access to TASKKIT_* environment variables.
 
@@ -41,6 +87,8 @@ class TaskkitEnv:
         api_url: Base URL for homelab-tasks API (optional).
         api_token: Bearer token for API callbacks (optional).
         step_params: JSON-encoded step parameters (optional alternative to file).
+        is_finalize_step: True if this is the finalize step (has workflow_result).
+        workflow_succeeded: True if workflow succeeded, False if failed, None if unknown.
     """
 
     task_id: str | None = None
@@ -56,17 +104,16 @@ class TaskkitEnv:
     api_token: str | None = None
     step_params: str | None = None
 
-    @property
-    def is_finalize_step(self) -> bool:
-        """Check if this is the finalize step (has workflow_result)."""
-        return self.workflow_result is not None
+    # Derived from workflow_result once, so reads are plain slot loads
+    is_finalize_step: bool = field(init=False, repr=False, compare=False)
+    workflow_succeeded: bool | None = field(init=False, repr=False, compare=False)
 
-    @property
-    def workflow_succeeded(self) -> bool | None:
-        """Return True if workflow succeeded, False if failed, None if unknown."""
-        if self.workflow_result is None:
-            return None
-        return self.workflow_result == "Succeeded"
+    def __post_init__(self) -> None:
+        result = self.workflow_result
+        object.__setattr__(self, "is_finalize_step", result is not None)
+        object.__setattr__(
+            self, "workflow_succeeded", None if result is None else result == "Succeeded"
+        )
 
     @classmethod
     def from_env(cls, env: Mapping[str, str]) -> TaskkitEnv:
@@ -78,23 +125,16 @@ class TaskkitEnv:
         Returns:
             TaskkitEnv with values parsed from TASKKIT_* variables.
         """
-        return cls(
-            task_id=env.get("TASKKIT_TASK_ID"),
-            run_id=env.get("TASKKIT_RUN_ID"),
-            step_name=env.get("TASKKIT_STEP_NAME"),
-            step_retry=int(env.get("TASKKIT_STEP_RETRY", "0")),
-            total_retries=int(env.get("TASKKIT_TOTAL_RETRIES", "3")),
-            workflow_name=env.get("TASKKIT_WORKFLOW_NAME"),
-            workflow_namespace=env.get("TASKKIT_WORKFLOW_NAMESPACE"),
-            node_name=env.get("TASKKIT_NODE_NAME"),
-            workflow_result=env.get("TASKKIT_WORKFLOW_RESULT"),
-            api_url=env.get("TASKKIT_API_URL"),
-            api_token=env.get("TASKKIT_API_TOKEN"),
-            step_params=env.get("TASKKIT_STEP_PARAMS"),
-        )
+        get = env.get
+        fields: dict[str, Any] = {}
+        for name, key, convert in _TASKKIT_FIELDS:
+            raw = get(key)
+            if raw is not None:
+                fields[name] = raw if convert is None else convert(raw)
+        return cls(**fields)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Deps:
     """Dependencies injected into task functions.
 
@@ -118,21 +158,102 @@ class Deps:
     taskkit: TaskkitEnv
 
 
+@functools.lru_cache(maxsize=8)
+def _taskkit_env_for(values: tuple[str | None, ...]) -> TaskkitEnv:
+    """Build a TaskkitEnv from _TASKKIT_ENV_KEYS values (None when unset)."""
+    pairs = zip(_TASKKIT_ENV_KEYS, values, strict=True)
+    return TaskkitEnv.from_env({key: value for key, value in pairs if value is not None})
+
+
+def _taskkit_env(env: Mapping[str, str]) -> TaskkitEnv:
+    """Return the TaskkitEnv for env, reusing it while the TASKKIT_* values are unchanged."""
+    get = env.get
+    return _taskkit_env_for(tuple([get(key) for key in _TASKKIT_ENV_KEYS]))
+
+
+def _pool_setting(value: _N | None, env: Mapping[str, str], key: str, default: _N) -> _N:
+    """Return an explicit pool setting, else the env override, else the default."""
+    if value is not None:
+        return value
+    raw = env.get(key)
+    return default if raw is None else type(default)(raw)
+
+
+def _new_client(
+    timeout: float, max_connections: int, max_keepalive: int, keepalive_expiry: float
+) -> httpx.Client:
+    """Create a pooled HTTP client for task dependencies."""
+    return httpx.Client(
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2_available(),
+        headers={"User-Agent": f"homelab-taskkit/{__version__}"},
+        follow_redirects=True,
+    )
+
+
+def _shared_client(
+    timeout: float, max_connections: int, max_keepalive: int, keepalive_expiry: float
+) -> httpx.Client:
+    """Return the process-wide client for these settings, creating it on first use."""
+    key = (timeout, max_connections, max_keepalive, keepalive_expiry)
+    client = _CLIENT_CACHE.get(key)
+    if client is not None and not client.is_closed:
+        return client
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None or client.is_closed:
+            if not _CLIENT_CACHE:
+                atexit.register(_close_shared_clients)
+            client = _CLIENT_CACHE[key] = _new_client(*key)
+    return client
+
+
+def _close_shared_clients() -> None:
+    """Close and forget every shared client (registered with atexit)."""
+    with _CLIENT_LOCK:
+        for client in _CLIENT_CACHE.values():
+            client.close()
+        _CLIENT_CACHE.clear()
+
+
 @contextmanager
 def build_deps(
     env: Mapping[str, str],
     *,
     timeout: float = 30.0,
     context: Mapping[str, Any] | None = None,
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+    reuse_client: bool = True,
 ) -> Iterator[Deps]:
     """Build dependencies for task execution.
 
     This is a context manager that properly cleans up resources.
 
+    The HTTP client keeps connections alive between requests to the same
+    host and uses HTTP/2 when the optional ``h2`` package is installed.
+    Pool limits not passed explicitly are read from TASKKIT_HTTP_MAX_CONNECTIONS,
+    TASKKIT_HTTP_MAX_KEEPALIVE and TASKKIT_HTTP_KEEPALIVE_EXPIRY.
+
+    By default the client is shared process-wide per (timeout, limits), so
+    consecutive steps in one process reuse warm connections; it is left open
+    on exit and closed at interpreter shutdown.
+
     Args:
         env: Environment variables mapping (typically os.environ).
         timeout: HTTP client timeout in seconds.
         context: Read-only context variables (wrapped in MappingProxyType).
+        max_connections: Maximum concurrent connections in the pool.
+        max_keepalive_connections: Maximum idle connections kept open.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        reuse_client: Share the pooled client across calls. Pass False for an
+            isolated client that is closed when the context exits.
 
     Yields:
         A Deps instance with all dependencies wired up.
@@ -144,25 +265,39 @@ def build_deps(
         with build_deps(os.environ, context={"pipeline.run_id": "abc"}) as deps:
             result = my_task(inputs, deps)
     """
-    # Wrap context in MappingProxyType for read-only access
-    safe_context: Mapping[str, Any] = MappingProxyType(dict(context or {}))
+    # Wrap context in MappingProxyType for read-only access; an existing proxy
+    # (e.g. TaskkitContext.vars) is already read-only and is used without a copy
+    safe_context: Mapping[str, Any]
+    if context is None:
+        safe_context = _EMPTY_CONTEXT
+    elif type(context) is MappingProxyType:
+        safe_context = context
+    else:
+        safe_context = MappingProxyType(dict(context))
 
-    # Parse TASKKIT_* environment variables
-    taskkit_env = TaskkitEnv.from_env(env)
+    # Parse TASKKIT_* environment variables (cached, TaskkitEnv is immutable)
+    taskkit_env = _taskkit_env(env)
 
-    http_client = httpx.Client(
-        timeout=timeout,
-        follow_redirects=True,
+    pool = (
+        _pool_setting(max_connections, env, HTTP_MAX_CONNECTIONS_ENV, DEFAULT_HTTP_MAX_CONNECTIONS),
+        _pool_setting(
+            max_keepalive_connections, env, HTTP_MAX_KEEPALIVE_ENV, DEFAULT_HTTP_MAX_KEEPALIVE
+        ),
+        _pool_setting(
+            keepalive_expiry, env, HTTP_KEEPALIVE_EXPIRY_ENV, DEFAULT_HTTP_KEEPALIVE_EXPIRY
+        ),
     )
+    http_client = _shared_client(timeout, *pool) if reuse_client else _new_client(timeout, *pool)
 
     try:
         yield Deps(
             http=http_client,
-            now=lambda: datetime.now(UTC),
+            now=_NOW_UTC,
             env=env,
-            logger=logging.getLogger("homelab_taskkit.task"),
+            logger=_TASK_LOGGER,
             context=safe_context,
             taskkit=taskkit_env,
         )
     finally:
-        http_client.close()
+        if not reuse_client:
+            http_client.close()
@@ -16,12 +16,18 @@ class TaskError(Exception):
         super().__init__(message)
         self.message = message
         self.context = context or {}
+        # Rendered on first str() and reused (logging may format an error several times);
+        # reset to None after mutating self.context
+        self._str_cache: str | None = None
 
     def __str__(self) -> str:
-        if self.context:
-            ctx = ", ".join(f"{k}={v!r}" for k, v in self.context.items())
-            return f"{self.message} ({ctx})"
-        return self.message
+        if self._str_cache is None:
+            if self.context:
+                ctx = ", ".join([f"{k}={v!r}" for k, v in self.context.items()])
+                self._str_cache = f"{self.message} ({ctx})"
+            else:
+                self._str_cache = self.message
+        return self._str_cache
 
 
 class HTTPError(TaskError):
@@ -116,5 +122,6 @@ class ContextSizeError(ContextError):
         super().__init__(message)
         self.context["size_bytes"] = size_bytes
         self.context["max_bytes"] = max_bytes
+        self._str_cache = None
         self.size_bytes = size_bytes
         self.max_bytes = max_bytes
@@ -6,6 +6,9 @@ Works with Argo's withParam pattern for DAG fanout.
 Fanout format:
     {"version": "taskkit-fanout/v1", "items": [...]}
 
+JSON Lines format (output path ending in ``.jsonl``):
+    One item per line, without the envelope.
+
 Usage in tasks:
     def run(inputs, deps):
         # Generate targets for parallel execution
@@ -27,18 +30,42 @@ In Argo WorkflowTemplate:
 
 from __future__ import annotations
 
-import json
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from homelab_taskkit import _io_common, _json
+
 # Constants
 FANOUT_VERSION = "taskkit-fanout/v1"
 DEFAULT_FANOUT_OUT = "/outputs/fanout.json"
 FANOUT_KEY = "__taskkit_fanout__"
 
 
-@dataclass
+def _coerce_jsonable(value: Any) -> Any:
+    """Return value with every non-JSON-native leaf replaced by its str().
+
+    Matches what the writers' ``default=str`` would produce, but runs once when
+    the fanout is built so encoding never has to call back into Python.
+    Containers are only rebuilt when something inside them changes.
+    """
+    if value is None or isinstance(value, str | int | float):
+        return value
+    if isinstance(value, dict):
+        coerced = {k: _coerce_jsonable(v) for k, v in value.items()}
+        if all(coerced[k] is v for k, v in value.items()):
+            return value
+        return coerced
+    if isinstance(value, list | tuple):
+        items = [_coerce_jsonable(v) for v in value]
+        if all(a is b for a, b in zip(items, value, strict=True)):
+            return value
+        return items
+    return str(value)
+
+
+@dataclass(slots=True)
 class TaskkitFanout:
     """Container for fanout items.
 
@@ -65,13 +92,16 @@ class TaskkitFanout:
     def from_items(cls, items: list[Any]) -> TaskkitFanout:
         """Create from a list of items.
 
+        Values JSON cannot represent natively (datetimes, paths, ...) are
+        converted to strings here, once, rather than on every write.
+
         Args:
             items: List of items for fanout.
 
         Returns:
             TaskkitFanout instance.
         """
-        return cls(version=FANOUT_VERSION, items=list(items))
+        return cls(version=FANOUT_VERSION, items=[_coerce_jsonable(item) for item in items])
 
     @property
     def count(self) -> int:
@@ -88,6 +118,7 @@ def extract_fanout(
     task_output: dict[str, Any],
     *,
     fanout_key: str = FANOUT_KEY,
+    consume: bool = False,
 ) -> tuple[dict[str, Any], TaskkitFanout | None]:
     """Extract fanout from task output.
 
@@ -99,8 +130,11 @@ def extract_fanout(
         - A raw list (treated as items)
 
     Args:
-        task_output: Raw task output dictionary.
+        task_output: Raw task output dictionary (anything else is returned as is).
         fanout_key: Key containing the fanout data.
+        consume: Remove the key from task_output in place instead of copying
+            it. Only for callers that own task_output; it is left unchanged
+            if the fanout is invalid.
 
     Returns:
         Tuple of (cleaned_output, fanout or None).
@@ -108,35 +142,52 @@ def extract_fanout(
     Raises:
         ValueError: If fanout has invalid structure.
     """
-    if fanout_key not in task_output:
+    # Non-dict output carries no reserved keys and passes through unchanged;
+    # otherwise one lookup covers the common case where the key is absent
+    if not isinstance(task_output, dict):
+        return task_output, None
+    fanout_data = task_output.get(fanout_key, _io_common.MISSING)
+    if fanout_data is _io_common.MISSING:
         return task_output, None
 
-    # Clone output and extract fanout
-    clean_output = dict(task_output)
-    fanout_data = clean_output.pop(fanout_key)
-
-    if fanout_data is None:
-        return clean_output, None
-
-    # Accept either a list (raw items) or a dict with "items" key
-    if isinstance(fanout_data, list):
-        return clean_output, TaskkitFanout.from_items(fanout_data)
-
-    if isinstance(fanout_data, dict):
+    # Accept either a dict with "items" key (the usual envelope) or a list (raw
+    # items). Exact types are a pointer compare; subclasses take the slower route
+    kind = type(fanout_data)
+    if kind is not dict and kind is not list:
+        if isinstance(fanout_data, dict):
+            kind = dict
+        elif isinstance(fanout_data, list):
+            kind = list
+
+    fanout: TaskkitFanout | None
+    if kind is dict:
         items = fanout_data.get("items", [])
-        if not isinstance(items, list):
-            raise ValueError(f"fanout.items must be a list, got {type(items).__name__}")
-        return clean_output, TaskkitFanout(
+        if type(items) is not list and not isinstance(items, list):
+            raise ValueError(f"fanout.items must be a list, got {items.__class__.__name__}")
+        fanout = TaskkitFanout(
             version=fanout_data.get("version", FANOUT_VERSION),
-            items=items,
+            items=[_coerce_jsonable(item) for item in items],
+        )
+    elif kind is list:
+        fanout = TaskkitFanout.from_items(fanout_data)
+    elif fanout_data is None:
+        fanout = None
+    else:
+        raise ValueError(
+            f"{fanout_key} must be a list or object, got {fanout_data.__class__.__name__}"
         )
 
-    raise ValueError(f"{fanout_key} must be a list or object, got {type(fanout_data).__name__}")
+    # Shallow-copy unless the caller handed over ownership of the output
+    clean_output = task_output if consume else task_output.copy()
+    del clean_output[fanout_key]
+    return clean_output, fanout
 
 
 def write_fanout(path: str | Path, fanout: TaskkitFanout) -> None:
     """Write fanout to a JSON file.
 
+    If path ends in ``.jsonl``, items are written one per line instead.
+
     Args:
         path: Path to write fanout JSON.
         fanout: Fanout container to write.
@@ -144,11 +195,20 @@ def write_fanout(path: str | Path, fanout: TaskkitFanout) -> None:
     path = Path(path)
 
     # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _io_common.ensure_parent(path)
+
+    # Items are encoded and written one at a time, so a large fanout is never
+    # held in memory as a second, serialized copy
+    if path.suffix == _io_common.JSONL_SUFFIX:
+        _io_common.write_chunks(
+            path, (_json.dumps(item, newline=True, default=str) for item in fanout.items)
+        )
+        return
 
-    with open(path, "w") as f:
-        json.dump(fanout.to_dict(), f, indent=2, default=str)
-        f.write("\n")  # Trailing newline for POSIX compliance
+    # Same document as to_dict() would give, without the intermediate dict
+    _io_common.write_chunks(
+        path, _json.iter_envelope(fanout.version, "items", fanout.items, default=str)
+    )
 
 
 def write_fanout_items(path: str | Path, fanout: TaskkitFanout) -> None:
@@ -163,8 +223,23 @@ def write_fanout_items(path: str | Path, fanout: TaskkitFanout) -> None:
     path = Path(path)
 
     # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _io_common.ensure_parent(path)
+
+    _io_common.write_bytes(path, _json.dumps(fanout.items, indent=True, newline=True, default=str))
+
 
-    with open(path, "w") as f:
-        json.dump(fanout.items, f, indent=2, default=str)
-        f.write("\n")
+def iter_fanout_items(path: str | Path) -> Iterator[Any]:
+    """Iterate over items in a JSON Lines fanout file.
+
+    Lines are parsed lazily as the iterator is consumed.
+
+    Args:
+        path: Path to a fanout ``.jsonl`` file.
+
+    Yields:
+        Each fanout item.
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield _json.loads(line)
@@ -26,18 +26,19 @@ In Argo WorkflowTemplate:
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from homelab_taskkit import _io_common, _json
+
 # Constants
 FLOW_CONTROL_VERSION = "taskkit-flow-control/v1"
 DEFAULT_FLOW_CONTROL_OUT = "/outputs/flow_control.json"
 FLOW_CONTROL_KEY = "__taskkit_flow_control__"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskkitFlowControl:
     """Container for flow control variables.
 
@@ -126,6 +127,7 @@ def extract_flow_control(
     task_output: dict[str, Any],
     *,
     flow_control_key: str = FLOW_CONTROL_KEY,
+    consume: bool = False,
 ) -> tuple[dict[str, Any], TaskkitFlowControl | None]:
     """Extract flow control from task output.
 
@@ -137,8 +139,11 @@ def extract_flow_control(
         - A raw dict (treated as vars)
 
     Args:
-        task_output: Raw task output dictionary.
+        task_output: Raw task output dictionary (anything else is returned as is).
         flow_control_key: Key containing the flow control data.
+        consume: Remove the key from task_output in place instead of copying
+            it. Only for callers that own task_output; it is left unchanged
+            if the flow control is invalid.
 
     Returns:
         Tuple of (cleaned_output, flow_control or None).
@@ -146,20 +151,29 @@ def extract_flow_control(
     Raises:
         ValueError: If flow control has invalid structure.
     """
-    if flow_control_key not in task_output:
+    # Non-dict output carries no reserved keys and passes through unchanged;
+    # otherwise one lookup covers the common case where the key is absent
+    if not isinstance(task_output, dict):
+        return task_output, None
+    flow_data = task_output.get(flow_control_key, _io_common.MISSING)
+    if flow_data is _io_common.MISSING:
         return task_output, None
 
-    # Clone output and extract flow control
-    clean_output = dict(task_output)
-    flow_data = clean_output.pop(flow_control_key)
-
-    if flow_data is None:
-        return clean_output, None
-
-    if isinstance(flow_data, dict):
-        return clean_output, TaskkitFlowControl.from_dict(flow_data)
+    # Exact dict is a pointer compare; subclasses take the slower isinstance route
+    flow_control: TaskkitFlowControl | None
+    if type(flow_data) is dict or isinstance(flow_data, dict):
+        flow_control = TaskkitFlowControl.from_dict(flow_data)
+    elif flow_data is None:
+        flow_control = None
+    else:
+        raise ValueError(
+            f"{flow_control_key} must be an object, got {flow_data.__class__.__name__}"
+        )
 
-    raise ValueError(f"{flow_control_key} must be an object, got {type(flow_data).__name__}")
+    # Shallow-copy unless the caller handed over ownership of the output
+    clean_output = task_output if consume else task_output.copy()
+    del clean_output[flow_control_key]
+    return clean_output, flow_control
 
 
 def write_flow_control(path: str | Path, flow_control: TaskkitFlowControl) -> None:
@@ -172,11 +186,12 @@ def write_flow_control(path: str | Path, flow_control: TaskkitFlowControl) -> No
     path = Path(path)
 
     # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _io_common.ensure_parent(path)
 
-    with open(path, "w") as f:
-        json.dump(flow_control.to_dict(), f, indent=2, default=str)
-        f.write("\n")  # Trailing newline for POSIX compliance
+    # Same document as to_dict() would give, without the intermediate dict
+    _io_common.write_bytes(
+        path, _json.dumps_envelope(flow_control.version, "vars", flow_control.vars, default=str)
+    )
 
 
 def write_flow_control_vars(path: str | Path, flow_control: TaskkitFlowControl) -> None:
@@ -191,8 +206,8 @@ def write_flow_control_vars(path: str | Path, flow_control: TaskkitFlowControl)
     path = Path(path)
 
     # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _io_common.ensure_parent(path)
 
-    with open(path, "w") as f:
-        json.dump(flow_control.vars, f, indent=2, default=str)
-        f.write("\n")
+    _io_common.write_bytes(
+        path, _json.dumps(flow_control.vars, indent=True, newline=True, default=str)
+    )
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
+from homelab_taskkit import _io_common, _json
+
+# First characters of inline JSON that read_input parses without a stat
+_INLINE_JSON_STARTS = frozenset("{[")
+
+# Linux PATH_MAX; longer sources are always treated as inline JSON
+_MAX_PATH_LEN = 4096
+
 
 def read_input(source: str) -> Any:
     """Read input from a file path or inline JSON string.
@@ -20,14 +27,23 @@ def read_input(source: str) -> Any:
         json.JSONDecodeError: If the input is not valid JSON.
         FileNotFoundError: If source looks like a path but file doesn't exist.
     """
-    # Check if source looks like a file path and exists
-    source_path = Path(source)
-    if source_path.exists():
-        with open(source_path) as f:
-            return json.load(f)
+    # Inline objects/arrays are by far the common non-path input; parse them
+    # without a stat, falling back to the path check if they don't parse
+    if source[:1] in _INLINE_JSON_STARTS:
+        try:
+            return _json.loads(source)
+        except _json.JSONDecodeError:
+            pass
+
+    # Check if source looks like a file path and exists (longer strings can't be
+    # paths, and stat would fail with ENAMETOOLONG)
+    if len(source) < _MAX_PATH_LEN:
+        source_path = Path(source)
+        if source_path.exists():
+            return _json.loads(source_path.read_bytes())
 
     # Otherwise, treat as inline JSON
-    return json.loads(source)
+    return _json.loads(source)
 
 
 def write_output(dest: str | Path, obj: Any) -> None:
@@ -43,8 +59,7 @@ def write_output(dest: str | Path, obj: Any) -> None:
     dest_path = Path(dest)
 
     # Ensure parent directory exists
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    _io_common.ensure_parent(dest_path)
 
-    with open(dest_path, "w") as f:
-        json.dump(obj, f, indent=2, default=str)
-        f.write("\n")  # Trailing newline for POSIX compliance
+    # Trailing newline for POSIX compliance
+    _io_common.write_bytes(dest_path, _json.dumps(obj, indent=True, newline=True, default=str))
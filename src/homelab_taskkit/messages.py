@@ -8,6 +8,10 @@ Provides a uniform way for tasks to emit warnings/errors/info that:
 Message format:
     {"version": "taskkit-messages/v1", "messages": [...]}
 
+JSON Lines format (output path ending in ``.jsonl``):
+    One message object per line. Writes append, so steps sharing a file
+    only pay for their own messages.
+
 Message structure:
     {"level": "error|warning|info", "message": "...", "code": "...", "source": "...", "data": {...}}
 
@@ -23,12 +27,15 @@ Usage in tasks:
 
 from __future__ import annotations
 
-import json
+import time
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Literal
 
+from homelab_taskkit import _io_common, _json
+
 # Constants
 MESSAGES_VERSION = "taskkit-messages/v1"
 DEFAULT_MESSAGES_OUT = "/outputs/messages.json"
@@ -37,8 +44,33 @@ MESSAGES_KEY = "__taskkit_messages__"
 # Type alias for message levels
 MessageLevel = Literal["info", "warning", "error"]
 
+# Canonical level strings; parsed levels are swapped for these so every message
+# shares one object per level and level checks hit str's identity fast path
+_LEVELS: dict[str, MessageLevel] = {level: level for level in ("info", "warning", "error")}
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the most recent _utc_now_iso call
+_STAMP_SECOND: tuple[int, str] = (-1, "")
+
 
-@dataclass(frozen=True)
+def _utc_now_iso() -> str:
+    """Return datetime.now(UTC).isoformat() for the current time.
+
+    Only the microseconds are formatted per call; the date/time prefix is
+    reused while the wall-clock second is unchanged.
+    """
+    global _STAMP_SECOND
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_second, prefix = _STAMP_SECOND
+    if seconds != cached_second:
+        prefix = f"{datetime.fromtimestamp(seconds, UTC):%Y-%m-%dT%H:%M:%S}"
+        _STAMP_SECOND = (seconds, prefix)
+    # isoformat() drops the fraction entirely when it is zero
+    if micros:
+        return f"{prefix}.{micros:06d}+00:00"
+    return f"{prefix}+00:00"
+
+
+@dataclass(frozen=True, slots=True)
 class TaskkitMessage:
     """Single diagnostic message.
 
@@ -87,8 +119,11 @@ class TaskkitMessage:
         Returns:
             TaskkitMessage instance.
         """
+        level = data.get("level", "info")
+        if type(level) is str:
+            level = _LEVELS.get(level, level)
         return cls(
-            level=data.get("level", "info"),
+            level=level,
             message=data.get("message", ""),
             code=data.get("code"),
             source=data.get("source", default_source),
@@ -97,7 +132,7 @@ class TaskkitMessage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskkitMessages:
     """Container for diagnostic messages.
 
@@ -109,6 +144,16 @@ class TaskkitMessages:
     version: str = MESSAGES_VERSION
     messages: list[TaskkitMessage] = field(default_factory=list)
 
+    # Level counts for the list object _tracked while it holds _counted items
+    # ending in _last; kept current by add() and extend()
+    _tracked: list[TaskkitMessage] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _counted: int = field(default=0, init=False, repr=False, compare=False)
+    _last: TaskkitMessage | None = field(default=None, init=False, repr=False, compare=False)
+    _error_count: int = field(default=0, init=False, repr=False, compare=False)
+    _warning_count: int = field(default=0, init=False, repr=False, compare=False)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -134,17 +179,36 @@ class TaskkitMessages:
             source: Component that generated the message.
             data: Optional structured data.
         """
-        self.messages.append(
-            TaskkitMessage(
-                level=level,
-                message=message,
-                code=code,
-                source=source,
-                timestamp=datetime.now(UTC).isoformat(),
-                data=data or {},
+        self.extend(
+            (
+                TaskkitMessage(
+                    level=level,
+                    message=message,
+                    code=code,
+                    source=source,
+                    timestamp=_utc_now_iso(),
+                    data=data or {},
+                ),
             )
         )
 
+    def extend(self, messages: Iterable[TaskkitMessage]) -> None:
+        """Append messages, keeping the error and warning counts current.
+
+        Args:
+            messages: Messages to add, in order.
+        """
+        self._sync_counts()
+        target = self.messages
+        for m in messages:
+            target.append(m)
+            if m.level == "error":
+                self._error_count += 1
+            elif m.level == "warning":
+                self._warning_count += 1
+        self._counted = len(target)
+        self._last = target[-1] if target else None
+
     def add_error(
         self,
         message: str,
@@ -178,15 +242,38 @@ class TaskkitMessages:
         """Add an info message."""
         self.add("info", message, code=code, source=source, data=data)
 
+    def _sync_counts(self) -> None:
+        """Recount levels if ``messages`` was changed other than through add()/extend().
+
+        Reassigning the list, or appending, removing or replacing its last
+        item directly, is detected and costs one scan; the counts are then
+        maintained incrementally again. Replacing an earlier item in place is
+        not detected, so edit the list through extend() or reassign it.
+        """
+        messages = self.messages
+        if (
+            messages is self._tracked
+            and len(messages) == self._counted
+            and (messages[-1] if messages else None) is self._last
+        ):
+            return
+        self._tracked = messages
+        self._error_count = sum(1 for m in messages if m.level == "error")
+        self._warning_count = sum(1 for m in messages if m.level == "warning")
+        self._counted = len(messages)
+        self._last = messages[-1] if messages else None
+
     @property
     def has_errors(self) -> bool:
         """Check if any error messages exist."""
-        return any(m.level == "error" for m in self.messages)
+        self._sync_counts()
+        return self._error_count > 0
 
     @property
     def has_warnings(self) -> bool:
         """Check if any warning messages exist."""
-        return any(m.level == "warning" for m in self.messages)
+        self._sync_counts()
+        return self._warning_count > 0
 
 
 def empty_messages() -> TaskkitMessages:
@@ -199,6 +286,7 @@ def extract_messages(
     *,
     task_name: str,
     messages_key: str = MESSAGES_KEY,
+    consume: bool = False,
 ) -> tuple[dict[str, Any], list[TaskkitMessage]]:
     """Extract messages from task output.
 
@@ -206,9 +294,12 @@ def extract_messages(
     and the parsed messages. Auto-fills source with task_name if not specified.
 
     Args:
-        task_output: Raw task output dictionary.
+        task_output: Raw task output dictionary (anything else is returned as is).
         task_name: Name of the task (used as default source).
         messages_key: Key containing the messages list.
+        consume: Remove the key from task_output in place instead of copying
+            it. Only for callers that own task_output; it is left unchanged
+            if the messages are invalid.
 
     Returns:
         Tuple of (cleaned_output, list_of_messages).
@@ -216,32 +307,36 @@ def extract_messages(
     Raises:
         ValueError: If messages has invalid structure.
     """
-    if messages_key not in task_output:
+    # Non-dict output carries no reserved keys and passes through unchanged;
+    # otherwise one lookup covers the common case where the key is absent
+    if not isinstance(task_output, dict):
+        return task_output, []
+    messages_data = task_output.get(messages_key, _io_common.MISSING)
+    if messages_data is _io_common.MISSING:
         return task_output, []
-
-    # Clone output and extract messages
-    clean_output = dict(task_output)
-    messages_data = clean_output.pop(messages_key)
-
-    if messages_data is None:
-        return clean_output, []
-
-    if not isinstance(messages_data, list):
-        raise ValueError(f"{messages_key} must be a list, got {type(messages_data).__name__}")
 
     # Parse messages
     parsed: list[TaskkitMessage] = []
-    for item in messages_data:
-        if not isinstance(item, dict):
-            raise ValueError(f"Each message must be an object, got {type(item).__name__}")
-        parsed.append(TaskkitMessage.from_dict(item, default_source=task_name))
-
+    if messages_data is not None:
+        if not isinstance(messages_data, list):
+            raise ValueError(f"{messages_key} must be a list, got {type(messages_data).__name__}")
+        for item in messages_data:
+            if not isinstance(item, dict):
+                raise ValueError(f"Each message must be an object, got {type(item).__name__}")
+            parsed.append(TaskkitMessage.from_dict(item, default_source=task_name))
+
+    # Shallow-copy unless the caller handed over ownership of the output
+    clean_output = task_output if consume else task_output.copy()
+    del clean_output[messages_key]
     return clean_output, parsed
 
 
 def write_messages(path: str | Path, messages: TaskkitMessages) -> None:
     """Write messages to a JSON file.
 
+    If path ends in ``.jsonl``, messages are appended one object per line
+    instead of rewriting a single JSON document.
+
     Args:
         path: Path to write messages JSON.
         messages: Messages container to write.
@@ -249,8 +344,38 @@ def write_messages(path: str | Path, messages: TaskkitMessages) -> None:
     path = Path(path)
 
     # Ensure parent directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
+    _io_common.ensure_parent(path)
+
+    if path.suffix == _io_common.JSONL_SUFFIX:
+        _io_common.append_bytes(
+            path,
+            b"".join(
+                _json.dumps(m.to_dict(), newline=True, default=str) for m in messages.messages
+            ),
+        )
+        return
 
-    with open(path, "w") as f:
-        json.dump(messages.to_dict(), f, indent=2, default=str)
-        f.write("\n")  # Trailing newline for POSIX compliance
+    # Same document as to_dict() would give, encoded one message at a time
+    _io_common.write_chunks(
+        path,
+        _json.iter_envelope(
+            messages.version, "messages", (m.to_dict() for m in messages.messages), default=str
+        ),
+    )
+
+
+def iter_messages(path: str | Path) -> Iterator[TaskkitMessage]:
+    """Iterate over messages in a JSON Lines messages file.
+
+    Lines are parsed lazily as the iterator is consumed.
+
+    Args:
+        path: Path to a messages ``.jsonl`` file.
+
+    Yields:
+        TaskkitMessage for each non-empty line.
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield TaskkitMessage.from_dict(_json.loads(line))
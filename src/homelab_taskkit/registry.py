@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import bisect
+import operator
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
@@ -14,7 +16,7 @@ if TYPE_CHECKING:
 TaskRunFn = Callable[[dict[str, Any], "Deps"], dict[str, Any]]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskDef:
     """Definition of a task.
 
@@ -48,6 +50,10 @@ class TaskNotFoundError(Exception):
 # The task registry - populated by tasks/__init__.py
 _TASKS: dict[str, TaskDef] = {}
 
+# The same tasks kept in name order as they register, for list_tasks; only
+# register_task updates the two, so go through it rather than writing _TASKS
+_SORTED_TASKS: list[TaskDef] = []
+
 
 def register_task(task: TaskDef) -> TaskDef:
     """Register a task in the registry.
@@ -64,6 +70,7 @@ def register_task(task: TaskDef) -> TaskDef:
     if task.name in _TASKS:
         raise ValueError(f"Task '{task.name}' is already registered")
     _TASKS[task.name] = task
+    bisect.insort(_SORTED_TASKS, task, key=operator.attrgetter("name"))
     return task
 
 
@@ -79,9 +86,10 @@ def get_task(name: str) -> TaskDef:
     Raises:
         TaskNotFoundError: If the task doesn't exist.
     """
-    if name not in _TASKS:
-        raise TaskNotFoundError(name, list(_TASKS.keys()))
-    return _TASKS[name]
+    try:
+        return _TASKS[name]
+    except KeyError:
+        raise TaskNotFoundError(name, list(_TASKS.keys())) from None
 
 
 def list_tasks() -> list[TaskDef]:
@@ -90,4 +98,4 @@ def list_tasks() -> list[TaskDef]:
     Returns:
         List of all task definitions, sorted by name.
     """
-    return sorted(_TASKS.values(), key=lambda t: t.name)
+    return _SORTED_TASKS.copy()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import logging
 import os
 import sys
@@ -10,7 +11,9 @@ from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
+from homelab_taskkit import _io_common, _json
 from homelab_taskkit.context import (
+    CONTEXT_PATCH_KEY,
     DEFAULT_CONTEXT_IN,
     DEFAULT_CONTEXT_OUT,
     MAX_CONTEXT_BYTES,
@@ -19,10 +22,10 @@ from homelab_taskkit.context import (
     load_context,
     write_context,
 )
-from homelab_taskkit.deps import build_deps
 from homelab_taskkit.errors import ContextError, ContextSizeError
 from homelab_taskkit.fanout import (
     DEFAULT_FANOUT_OUT,
+    FANOUT_KEY,
     TaskkitFanout,
     empty_fanout,
     extract_fanout,
@@ -30,6 +33,7 @@ from homelab_taskkit.fanout import (
 )
 from homelab_taskkit.flow_control import (
     DEFAULT_FLOW_CONTROL_OUT,
+    FLOW_CONTROL_KEY,
     TaskkitFlowControl,
     empty_flow_control,
     extract_flow_control,
@@ -38,13 +42,16 @@ from homelab_taskkit.flow_control import (
 from homelab_taskkit.io import read_input, write_output
 from homelab_taskkit.messages import (
     DEFAULT_MESSAGES_OUT,
+    MESSAGES_KEY,
     TaskkitMessages,
     empty_messages,
     extract_messages,
     write_messages,
 )
 from homelab_taskkit.registry import TaskNotFoundError, get_task
-from homelab_taskkit.schema import SchemaValidationError, load_schema, validate
+
+# homelab_taskkit.schema (jsonschema) and homelab_taskkit.deps (httpx) dominate
+# import time, so run_task imports them only once a task has been resolved
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +62,37 @@ EXIT_VALIDATION_ERROR = 2
 EXIT_TASK_NOT_FOUND = 3
 EXIT_CONTEXT_ERROR = 4
 
+# Set to "jsonl" to default messages/fanout artifacts to JSON Lines
+ARTIFACT_FORMAT_ENV = "TASKKIT_ARTIFACT_FORMAT"
+
+# Task output keys consumed by the runner rather than written to the output
+_RESERVED_OUTPUT_KEYS = frozenset({CONTEXT_PATCH_KEY, MESSAGES_KEY, FANOUT_KEY, FLOW_CONTROL_KEY})
+
+# Built once at import; init_logging only attaches it to a handler
+_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%dT%H:%M:%SZ"
+)
+
+
+def init_logging(level: int = logging.INFO) -> None:
+    """Send root log records to stderr unless logging is already configured.
+
+    Shared by run_task and the CLI so both use the same format. Like
+    logging.basicConfig, this does nothing when the root logger already has
+    handlers, but that common case is a single attribute check with no lock
+    taken, and the formatter is built once at import.
+
+    Args:
+        level: Root logger level to set when configuring.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(_LOG_FORMATTER)
+    root.addHandler(handler)
+    root.setLevel(level)
+
 
 def run_task(
     task_name: str,
@@ -95,7 +133,9 @@ def run_task(
         input_source: Path to input JSON file or inline JSON string.
         output_path: Path to write the output JSON.
         schemas_root: Root directory containing task schemas.
-        env: Environment variables (defaults to os.environ).
+        env: Environment variables (defaults to os.environ). Setting
+            TASKKIT_ARTIFACT_FORMAT=jsonl switches the default messages and
+            fanout paths to JSON Lines (``.jsonl``).
         context_enabled: Enable context artifacts (None=auto-detect).
         context_input_path: Path to input context JSON (default: /inputs/context.json).
         context_output_path: Path to write output context JSON (default: /outputs/context.json).
@@ -116,18 +156,13 @@ def run_task(
     schemas_root = Path(schemas_root)
 
     # Configure logging for task output
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-        datefmt="%Y-%m-%dT%H:%M:%SZ",
-        stream=sys.stderr,
-    )
+    init_logging()
 
-    logger.info(f"Starting task: {task_name}")
+    logger.info("Starting task: %s", task_name)
 
     # Check for Argo environment
-    inputs_dir_exists = Path("/inputs").is_dir()
-    outputs_dir_exists = Path("/outputs").is_dir()
+    inputs_dir_exists = _dir_exists("/inputs")
+    outputs_dir_exists = _dir_exists("/outputs")
 
     # Determine if context artifacts are enabled
     # Auto-detect: enable if /inputs and /outputs directories exist (Argo environment)
@@ -152,6 +187,12 @@ def run_task(
         Path(messages_output_path) if messages_output_path else Path(DEFAULT_MESSAGES_OUT)
     )
     fanout_out_path = Path(fanout_output_path) if fanout_output_path else Path(DEFAULT_FANOUT_OUT)
+    if env.get(ARTIFACT_FORMAT_ENV) == "jsonl":
+        # JSON Lines defaults; explicit paths keep whatever suffix they were given
+        if not messages_output_path:
+            msgs_out_path = msgs_out_path.with_suffix(".jsonl")
+        if not fanout_output_path:
+            fanout_out_path = fanout_out_path.with_suffix(".jsonl")
     flow_ctrl_out_path = (
         Path(flow_control_output_path)
         if flow_control_output_path
@@ -159,81 +200,80 @@ def run_task(
     )
 
     if context_enabled:
-        logger.info(f"Context artifacts enabled (in={ctx_in_path}, out={ctx_out_path})")
+        logger.info("Context artifacts enabled (in=%s, out=%s)", ctx_in_path, ctx_out_path)
     if messages_enabled:
-        logger.info(f"Messages artifact enabled (out={msgs_out_path})")
+        logger.info("Messages artifact enabled (out=%s)", msgs_out_path)
     if fanout_enabled:
-        logger.info(f"Fanout artifact enabled (out={fanout_out_path})")
+        logger.info("Fanout artifact enabled (out=%s)", fanout_out_path)
     if flow_control_enabled:
-        logger.info(f"Flow control artifact enabled (out={flow_ctrl_out_path})")
+        logger.info("Flow control artifact enabled (out=%s)", flow_ctrl_out_path)
 
     # Initialize artifact containers
     messages: TaskkitMessages = empty_messages()
     fanout: TaskkitFanout = empty_fanout()
     flow_control: TaskkitFlowControl = empty_flow_control()
 
+    def fail(exit_code: int, message: str, *, code: str, data: dict[str, Any] | None = None) -> int:
+        """Record a runner error, write the messages artifact and return exit_code."""
+        messages.add_error(message, code=code, source="runner", data=data)
+        _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
+        return exit_code
+
     # 1. Resolve task definition
     try:
         task = get_task(task_name)
     except TaskNotFoundError as e:
-        logger.error(f"Task not found: {task_name}")
-        logger.error(f"Available tasks: {', '.join(e.available)}")
-        messages.add_error(
+        logger.error("Task not found: %s", task_name)
+        logger.error("Available tasks: %s", ", ".join(e.available))
+        return fail(
+            EXIT_TASK_NOT_FOUND,
             f"Task not found: {task_name}",
             code="TASK_NOT_FOUND",
-            source="runner",
             data={"available": e.available},
         )
-        _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-        return EXIT_TASK_NOT_FOUND
 
     # 2. Load context (if enabled)
     context_data = None
     if context_enabled:
         try:
             context_data = load_context(ctx_in_path)
-            logger.info(f"Context loaded: {len(context_data.vars)} vars")
+            logger.info("Context loaded: %d vars", len(context_data.vars))
         except ContextError as e:
-            logger.error(f"Failed to load context: {e}")
-            messages.add_error(str(e), code="CONTEXT_LOAD_ERROR", source="runner")
-            _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-            return EXIT_CONTEXT_ERROR
+            logger.error("Failed to load context: %s", e)
+            return fail(EXIT_CONTEXT_ERROR, str(e), code="CONTEXT_LOAD_ERROR")
+
+    from homelab_taskkit.schema import SchemaValidationError, load_validator, validate
 
     # 3. Load input and validate against schema
     try:
         input_data = read_input(input_source)
     except Exception as e:
-        logger.error(f"Failed to read input: {e}")
-        messages.add_error(f"Failed to read input: {e}", code="INPUT_READ_ERROR", source="runner")
-        _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-        return EXIT_VALIDATION_ERROR
+        logger.error("Failed to read input: %s", e)
+        return fail(EXIT_VALIDATION_ERROR, f"Failed to read input: {e}", code="INPUT_READ_ERROR")
 
     input_schema_path = schemas_root / task.input_schema
     try:
-        input_schema = load_schema(input_schema_path)
-        validate(input_data, input_schema)
+        validate(input_data, load_validator(input_schema_path))
         logger.info("Input validation passed")
     except FileNotFoundError:
-        logger.error(f"Input schema not found: {input_schema_path}")
-        messages.add_error(
+        logger.error("Input schema not found: %s", input_schema_path)
+        return fail(
+            EXIT_VALIDATION_ERROR,
             f"Input schema not found: {input_schema_path}",
             code="SCHEMA_NOT_FOUND",
-            source="runner",
         )
-        _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-        return EXIT_VALIDATION_ERROR
     except SchemaValidationError as e:
-        logger.error(f"Input validation failed: {e}")
+        logger.error("Input validation failed: %s", e)
         for err in e.errors:
-            logger.error(f"  - {err}")
-        messages.add_error(
+            logger.error("  - %s", err)
+        return fail(
+            EXIT_VALIDATION_ERROR,
             f"Input validation failed: {e}",
             code="INPUT_VALIDATION_ERROR",
-            source="runner",
             data={"errors": e.errors},
         )
-        _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-        return EXIT_VALIDATION_ERROR
+
+    from homelab_taskkit.deps import build_deps
 
     # 4. Build dependencies and execute task
     try:
@@ -242,132 +282,124 @@ def run_task(
             logger.info("Executing task...")
             output_data_raw = task.run(input_data, deps)
     except Exception as e:
-        logger.exception(f"Task execution failed: {e}")
-        messages.add_error(
-            f"Task execution failed: {e}", code="TASK_EXECUTION_ERROR", source="runner"
-        )
-        _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-        return EXIT_RUNTIME_ERROR
+        logger.exception("Task execution failed: %s", e)
+        return fail(EXIT_RUNTIME_ERROR, f"Task execution failed: {e}", code="TASK_EXECUTION_ERROR")
+
+    # 5. Extract context patch from output (if present). The reserved keys are
+    # stripped in place from one runner-owned copy of the task output; without
+    # any, the output is validated and written exactly as the task returned it.
+    # Non-dict outputs carry no reserved keys and go straight to validation.
+    output_data = output_data_raw
+    context_patch = None
+    if isinstance(output_data_raw, dict):
+        if not output_data_raw.keys().isdisjoint(_RESERVED_OUTPUT_KEYS):
+            output_data = dict(output_data_raw)
+        try:
+            output_data, context_patch = extract_context_patch(output_data, consume=True)
+            if context_patch and context_enabled:
+                logger.info(
+                    "Context patch: set=%d keys, unset=%d keys",
+                    len(context_patch.set),
+                    len(context_patch.unset),
+                )
+        except ContextError as e:
+            logger.error("Invalid context patch: %s", e)
+            return fail(EXIT_CONTEXT_ERROR, str(e), code="CONTEXT_PATCH_ERROR")
 
-    # 5. Extract context patch from output (if present)
-    try:
-        output_data, context_patch = extract_context_patch(output_data_raw)
-        if context_patch and context_enabled:
-            logger.info(
-                f"Context patch: set={len(context_patch.set)} keys, "
-                f"unset={len(context_patch.unset)} keys"
+        # 5a. Extract messages from output (if present)
+        try:
+            output_data, task_messages = extract_messages(
+                output_data, task_name=task_name, consume=True
             )
-    except ContextError as e:
-        logger.error(f"Invalid context patch: {e}")
-        messages.add_error(str(e), code="CONTEXT_PATCH_ERROR", source="runner")
-        _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-        return EXIT_CONTEXT_ERROR
-
-    # 5a. Extract messages from output (if present)
-    try:
-        output_data, task_messages = extract_messages(output_data, task_name=task_name)
-        messages.messages.extend(task_messages)
-        if task_messages:
-            logger.info(f"Task emitted {len(task_messages)} message(s)")
-    except ValueError as e:
-        logger.error(f"Invalid messages structure: {e}")
-        messages.add_error(str(e), code="MESSAGES_PARSE_ERROR", source="runner")
-
-    # 5b. Extract fanout from output (if present)
-    try:
-        output_data, extracted_fanout = extract_fanout(output_data)
-        if extracted_fanout is not None:
-            fanout = extracted_fanout
-            logger.info(f"Task emitted fanout with {fanout.count} item(s)")
-    except ValueError as e:
-        logger.error(f"Invalid fanout structure: {e}")
-        messages.add_error(str(e), code="FANOUT_PARSE_ERROR", source="runner")
-
-    # 5c. Extract flow_control from output (if present)
-    try:
-        output_data, extracted_flow_control = extract_flow_control(output_data)
-        if extracted_flow_control is not None:
-            flow_control = extracted_flow_control
-            logger.info(f"Task emitted flow_control with {flow_control.count} var(s)")
-    except ValueError as e:
-        logger.error(f"Invalid flow_control structure: {e}")
-        messages.add_error(str(e), code="FLOW_CONTROL_PARSE_ERROR", source="runner")
+            messages.extend(task_messages)
+            if task_messages:
+                logger.info("Task emitted %d message(s)", len(task_messages))
+        except ValueError as e:
+            logger.error("Invalid messages structure: %s", e)
+            messages.add_error(str(e), code="MESSAGES_PARSE_ERROR", source="runner")
+
+        # 5b. Extract fanout from output (if present)
+        try:
+            output_data, extracted_fanout = extract_fanout(output_data, consume=True)
+            if extracted_fanout is not None:
+                fanout = extracted_fanout
+                logger.info("Task emitted fanout with %d item(s)", fanout.count)
+        except ValueError as e:
+            logger.error("Invalid fanout structure: %s", e)
+            messages.add_error(str(e), code="FANOUT_PARSE_ERROR", source="runner")
+
+        # 5c. Extract flow_control from output (if present)
+        try:
+            output_data, extracted_flow_control = extract_flow_control(output_data, consume=True)
+            if extracted_flow_control is not None:
+                flow_control = extracted_flow_control
+                logger.info("Task emitted flow_control with %d var(s)", flow_control.count)
+        except ValueError as e:
+            logger.error("Invalid flow_control structure: %s", e)
+            messages.add_error(str(e), code="FLOW_CONTROL_PARSE_ERROR", source="runner")
 
     # 6. Validate output against schema
     output_schema_path = schemas_root / task.output_schema
     try:
-        output_schema = load_schema(output_schema_path)
-        validate(output_data, output_schema)
+        validate(output_data, load_validator(output_schema_path))
         logger.info("Output validation passed")
     except FileNotFoundError:
-        logger.error(f"Output schema not found: {output_schema_path}")
-        messages.add_error(
+        logger.error("Output schema not found: %s", output_schema_path)
+        return fail(
+            EXIT_VALIDATION_ERROR,
             f"Output schema not found: {output_schema_path}",
             code="SCHEMA_NOT_FOUND",
-            source="runner",
         )
-        _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-        return EXIT_VALIDATION_ERROR
     except SchemaValidationError as e:
-        logger.error(f"Output validation failed: {e}")
+        logger.error("Output validation failed: %s", e)
         for err in e.errors:
-            logger.error(f"  - {err}")
-        messages.add_error(
+            logger.error("  - %s", err)
+        return fail(
+            EXIT_VALIDATION_ERROR,
             f"Output validation failed: {e}",
             code="OUTPUT_VALIDATION_ERROR",
-            source="runner",
             data={"errors": e.errors},
         )
-        _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-        return EXIT_VALIDATION_ERROR
 
     # 7. Write output
     try:
         write_output(output_path, output_data)
-        logger.info(f"Output written to: {output_path}")
+        logger.info("Output written to: %s", output_path)
     except Exception as e:
-        logger.error(f"Failed to write output: {e}")
-        messages.add_error(
-            f"Failed to write output: {e}", code="OUTPUT_WRITE_ERROR", source="runner"
-        )
-        _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-        return EXIT_RUNTIME_ERROR
+        logger.error("Failed to write output: %s", e)
+        return fail(EXIT_RUNTIME_ERROR, f"Failed to write output: {e}", code="OUTPUT_WRITE_ERROR")
 
     # 8. Merge and write context (if enabled)
     if context_enabled and context_data is not None:
         try:
             merged_context = apply_patch(context_data, context_patch)
             write_context(ctx_out_path, merged_context, max_bytes=max_context_bytes)
-            logger.info(f"Context written to: {ctx_out_path} ({len(merged_context.vars)} vars)")
+            logger.info("Context written to: %s (%d vars)", ctx_out_path, len(merged_context.vars))
         except ContextSizeError as e:
-            logger.error(f"Context size exceeded: {e}")
-            messages.add_error(str(e), code="CONTEXT_SIZE_ERROR", source="runner")
-            _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-            return EXIT_CONTEXT_ERROR
+            logger.error("Context size exceeded: %s", e)
+            return fail(EXIT_CONTEXT_ERROR, str(e), code="CONTEXT_SIZE_ERROR")
         except ContextError as e:
-            logger.error(f"Failed to write context: {e}")
-            messages.add_error(str(e), code="CONTEXT_WRITE_ERROR", source="runner")
-            _write_artifacts_on_error(messages_enabled, msgs_out_path, messages)
-            return EXIT_CONTEXT_ERROR
+            logger.error("Failed to write context: %s", e)
+            return fail(EXIT_CONTEXT_ERROR, str(e), code="CONTEXT_WRITE_ERROR")
 
     # 9. Write messages artifact (if enabled)
     if messages_enabled:
         try:
             write_messages(msgs_out_path, messages)
             logger.info(
-                f"Messages written to: {msgs_out_path} ({len(messages.messages)} message(s))"
+                "Messages written to: %s (%d message(s))", msgs_out_path, len(messages.messages)
             )
         except Exception as e:
-            logger.warning(f"Failed to write messages artifact: {e}")
+            logger.warning("Failed to write messages artifact: %s", e)
             # Don't fail the task for artifact write errors
 
     # 10. Write fanout artifact (if enabled)
     if fanout_enabled:
         try:
             write_fanout(fanout_out_path, fanout)
-            logger.info(f"Fanout written to: {fanout_out_path} ({fanout.count} item(s))")
+            logger.info("Fanout written to: %s (%d item(s))", fanout_out_path, fanout.count)
         except Exception as e:
-            logger.warning(f"Failed to write fanout artifact: {e}")
+            logger.warning("Failed to write fanout artifact: %s", e)
             # Don't fail the task for artifact write errors
 
     # 11. Write flow_control artifact (if enabled)
@@ -375,16 +407,29 @@ def run_task(
         try:
             write_flow_control(flow_ctrl_out_path, flow_control)
             logger.info(
-                f"Flow control written to: {flow_ctrl_out_path} ({flow_control.count} var(s))"
+                "Flow control written to: %s (%d var(s))", flow_ctrl_out_path, flow_control.count
             )
         except Exception as e:
-            logger.warning(f"Failed to write flow_control artifact: {e}")
+            logger.warning("Failed to write flow_control artifact: %s", e)
             # Don't fail the task for artifact write errors
 
-    logger.info(f"Task {task_name} completed successfully")
+    # One durability pass over the artifact directories (TASKKIT_FSYNC=1 only)
+    _io_common.sync_directories()
+
+    logger.info("Task %s completed successfully", task_name)
     return EXIT_SUCCESS
 
 
+@functools.cache
+def _dir_exists(path: str) -> bool:
+    """Whether path is a directory, checked once per process.
+
+    Only used for the Argo mount points, which do not appear or disappear
+    while a worker is running.
+    """
+    return os.path.isdir(path)
+
+
 def _write_artifacts_on_error(
     messages_enabled: bool,
     msgs_out_path: Path,
@@ -398,10 +443,9 @@ def _write_artifacts_on_error(
     if messages_enabled:
         with contextlib.suppress(Exception):
             write_messages(msgs_out_path, messages)
+    _io_common.sync_directories()
 
 
 def _format_output(data: Any) -> str:
     """Format output data for logging."""
-    import json
-
-    return json.dumps(data, indent=2, default=str)
+    return _json.dumps(data, indent=True, default=str).decode("utf-8")
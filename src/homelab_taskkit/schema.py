@@ -2,13 +2,42 @@
 
 from __future__ import annotations
 
-import json
+import functools
+import os
 from pathlib import Path
 from typing import Any
 
 import jsonschema
 from jsonschema import Draft202012Validator
 
+from homelab_taskkit import _json
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional "fast-schema" extra
+    fastjsonschema = None
+
+# Set to "jsonschema" to skip the fastjsonschema pre-check and validate with
+# jsonschema alone (e.g. to rule out a difference between the two)
+VALIDATOR_ENV = "TASKKIT_VALIDATOR"
+
+# Keywords that mean the same in draft-07 (what fastjsonschema implements) and
+# 2020-12. Schemas using anything else are validated by jsonschema alone.
+# fmt: off
+_PORTABLE_KEYWORDS = frozenset(
+    {
+        "$schema", "$id", "title", "description", "default", "examples", "$comment",
+        "type", "enum", "const", "format",
+        "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "multipleOf",
+        "minLength", "maxLength", "pattern",
+        "items", "minItems", "maxItems", "uniqueItems",
+        "properties", "patternProperties", "additionalProperties", "required",
+        "minProperties", "maxProperties",
+        "allOf", "anyOf", "oneOf", "not",
+    }
+)
+# fmt: on
+
 
 class SchemaValidationError(Exception):
     """Raised when input or output fails schema validation."""
@@ -21,6 +50,10 @@ class SchemaValidationError(Exception):
 def load_schema(path: str | Path) -> dict[str, Any]:
     """Load a JSON schema from a file path.
 
+    Schemas are parsed once per process and cached by path, inode and
+    modification time, so an edited or replaced file is re-read. The returned dict is
+    shared and must not be mutated.
+
     Args:
         path: Path to the JSON schema file.
 
@@ -31,21 +64,143 @@ def load_schema(path: str | Path) -> dict[str, Any]:
         FileNotFoundError: If the schema file doesn't exist.
         json.JSONDecodeError: If the file contains invalid JSON.
     """
-    with open(path) as f:
-        return json.load(f)
+    return _load_schema_file(*_cache_key(path))
+
+
+def _cache_key(path: str | Path) -> tuple[str, tuple[int, int, int]]:
+    """Return (absolute path, file version) identifying a schema file version.
+
+    One stat() per lookup: the (device, inode, mtime) version follows
+    symlinks, so the path itself does not need resolving component by
+    component.
+    """
+    abs_path = os.path.abspath(path)
+    st = os.stat(abs_path)
+    return abs_path, (st.st_dev, st.st_ino, st.st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_schema_file(abs_path: str, version: tuple[int, int, int]) -> dict[str, Any]:
+    with open(abs_path, "rb") as f:
+        return _json.loads(f.read())
+
+
+def load_validator(path: str | Path) -> Draft202012Validator:
+    """Load a JSON schema file and build a validator for it.
+
+    Validators are built once per schema file and cached by path, inode and
+    modification time, so repeated validations skip schema loading and
+    validator setup while edits to the file still take effect.
+
+    Args:
+        path: Path to the JSON schema file.
+
+    Returns:
+        A validator for the schema.
+
+    Raises:
+        FileNotFoundError: If the schema file doesn't exist.
+        json.JSONDecodeError: If the file contains invalid JSON.
+    """
+    return _load_validator(*_cache_key(path))
 
 
-def validate(instance: Any, schema: dict[str, Any]) -> None:
+@functools.lru_cache(maxsize=128)
+def _load_validator(abs_path: str, version: tuple[int, int, int]) -> Draft202012Validator:
+    return Draft202012Validator(_load_schema_file(abs_path, version))
+
+
+# Validators for schema dicts passed to validate(), keyed by id(). The schema is
+# kept alongside so its id cannot be reused by another object while cached.
+_DICT_VALIDATORS: dict[int, tuple[dict[str, Any], Draft202012Validator]] = {}
+_DICT_VALIDATORS_MAX = 128
+
+
+def _validator_for(schema: dict[str, Any]) -> Draft202012Validator:
+    """Return a cached validator for a schema dict, building it on first use."""
+    entry = _DICT_VALIDATORS.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    validator = Draft202012Validator(schema)
+    if len(_DICT_VALIDATORS) >= _DICT_VALIDATORS_MAX:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _DICT_VALIDATORS[next(iter(_DICT_VALIDATORS))]
+    _DICT_VALIDATORS[id(schema)] = (schema, validator)
+    return validator
+
+
+def _is_portable(schema: Any) -> bool:
+    """Return True if schema only uses keywords in _PORTABLE_KEYWORDS."""
+    if isinstance(schema, bool):
+        return True
+    if not isinstance(schema, dict) or not _PORTABLE_KEYWORDS.issuperset(schema):
+        return False
+    subschemas: list[Any] = []
+    for key in ("properties", "patternProperties"):
+        subschemas.extend(schema.get(key, {}).values())
+    for key in ("allOf", "anyOf", "oneOf"):
+        subschemas.extend(schema.get(key, []))
+    # Array-form items is positional in draft-07 but invalid in 2020-12; a list
+    # here fails the dict check on recursion
+    for key in ("items", "additionalProperties", "not"):
+        if key in schema:
+            subschemas.append(schema[key])
+    return all(_is_portable(sub) for sub in subschemas)
+
+
+# Compiled fastjsonschema checks per validator (None when not applicable), keyed
+# by id() with the validator kept alongside, like _DICT_VALIDATORS
+_FAST_CHECKS: dict[int, tuple[Draft202012Validator, Any]] = {}
+
+
+def _fast_check(validator: Draft202012Validator) -> Any:
+    """Return a compiled fastjsonschema check for validator's schema, if usable."""
+    entry = _FAST_CHECKS.get(id(validator))
+    if entry is not None and entry[0] is validator:
+        return entry[1]
+    check = None
+    if fastjsonschema is not None and _is_portable(validator.schema):
+        try:
+            # No defaults (they would be written into the instance) and no formats
+            # (jsonschema does not check them without a format checker either)
+            check = fastjsonschema.compile(
+                validator.schema, use_default=False, use_formats=False, detailed_exceptions=False
+            )
+        except Exception:
+            # Not only JsonSchemaDefinitionException: fastjsonschema's code
+            # generator has raised KeyError on valid schemas (e.g. "const"), and
+            # jsonschema can validate anything it cannot compile
+            check = None
+    if len(_FAST_CHECKS) >= _DICT_VALIDATORS_MAX:
+        del _FAST_CHECKS[next(iter(_FAST_CHECKS))]
+    _FAST_CHECKS[id(validator)] = (validator, check)
+    return check
+
+
+def validate(instance: Any, schema: dict[str, Any] | Draft202012Validator) -> None:
     """Validate an instance against a JSON schema.
 
     Args:
         instance: The data to validate.
-        schema: The JSON schema to validate against.
+        schema: The JSON schema, or a prebuilt validator (see load_validator).
+            Validators built for schema dicts are cached, so the dict must not
+            be mutated after it is first used.
 
     Raises:
         SchemaValidationError: If validation fails.
     """
-    validator = Draft202012Validator(schema)
+    validator = schema if isinstance(schema, Draft202012Validator) else _validator_for(schema)
+
+    # Compiled check for the common valid case; on failure jsonschema below stays
+    # the authority and produces the full error list
+    check = _fast_check(validator) if os.environ.get(VALIDATOR_ENV) != "jsonschema" else None
+    if check is not None:
+        try:
+            check(instance)
+            return
+        except fastjsonschema.JsonSchemaValueException:
+            pass
+
     errors = list(validator.iter_errors(instance))
 
     if errors:
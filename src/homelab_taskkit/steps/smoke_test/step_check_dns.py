@@ -6,6 +6,8 @@ Checks DNS resolution for configured targets.
 from __future__ import annotations
 
 import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 from homelab_taskkit.workflow import (
     StepDeps,
@@ -14,6 +16,42 @@ from homelab_taskkit.workflow import (
     register_step,
 )
 
+# Upper bound on concurrent lookups; each one blocks a thread in getaddrinfo
+_MAX_DNS_WORKERS = 32
+
+
+# Seconds a successful lookup is reused by later checks in the same process
+_DNS_CACHE_TTL = 30.0
+
+# host -> (time.monotonic() of the lookup, addresses); failures are not cached
+_DNS_CACHE: dict[str, tuple[float, list[str]]] = {}
+
+
+def _cached_resolve(host: str) -> list[str] | socket.gaierror:
+    """Like _resolve, but reuse addresses resolved within the last _DNS_CACHE_TTL."""
+    now = time.monotonic()
+    entry = _DNS_CACHE.get(host)
+    if entry is not None and now - entry[0] < _DNS_CACHE_TTL:
+        return list(entry[1])
+    outcome = _resolve(host)
+    if not isinstance(outcome, socket.gaierror):
+        _DNS_CACHE[host] = (now, outcome)
+        outcome = list(outcome)
+    return outcome
+
+
+def _resolve(host: str) -> list[str] | socket.gaierror:
+    """Resolve host to its IPv4 and IPv6 addresses, returning the error on failure.
+
+    Addresses are de-duplicated in resolver order (getaddrinfo returns one
+    entry per socket type otherwise).
+    """
+    try:
+        infos = socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+    except socket.gaierror as e:
+        return e
+    return list(dict.fromkeys(str(info[4][0]) for info in infos))
+
 
 @register_step("smoke-test-check-dns")
 def handle_check_dns(step_input: StepInput, deps: StepDeps) -> StepResult:
@@ -23,51 +61,65 @@ def handle_check_dns(step_input: StepInput, deps: StepDeps) -> StepResult:
     """
     result = StepResult()
 
-    targets = step_input.params.get("targets", [])
+    # Shallow copies, not setdefault(): nested vars are shared with the runner
+    # (LocalRunner copies only the top level), so mutating them in place would
+    # double-count checks when a failed attempt is retried
     smoke_test = dict(step_input.vars.get("smoke_test", {}))
     dns_results = dict(smoke_test.get("dns_results", {}))
 
     passed = 0
     failed = 0
 
-    for target in targets:
-        name = target.get("name", "unknown")
-        dns_host = target.get("dns_host")
-
-        if not dns_host:
-            deps.logger.debug(f"Skipping DNS check for {name} (no dns_host configured)")
-            continue
-
-        try:
-            # Attempt DNS resolution
-            ip_addresses = socket.gethostbyname_ex(dns_host)[2]
-
-            dns_results[name] = {
-                "host": dns_host,
-                "resolved": True,
-                "addresses": ip_addresses,
-                "error": None,
-            }
-
-            result.add_info(
-                f"DNS resolved: {dns_host} -> {', '.join(ip_addresses)}",
-                system="smoke-test",
-            )
-            passed += 1
+    # Partitioned by smoke-test-init; filter params ourselves if it did not run
+    dns_targets = smoke_test.get("dns_targets")
+    if dns_targets is None:
+        dns_targets = []
+        for target in step_input.params.get("targets", []):
+            if not target.get("dns_host"):
+                name = target.get("name", "unknown")
+                deps.logger.debug("Skipping DNS check for %s (no dns_host configured)", name)
+                continue
+            dns_targets.append(target)
+
+    checks = [(target.get("name", "unknown"), target["dns_host"]) for target in dns_targets]
+
+    # Lookups are independent and blocking, so resolve them in parallel; map()
+    # keeps results (and the messages below) in target order
+    hosts = [dns_host for _, dns_host in checks]
+    if len(hosts) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_DNS_WORKERS, len(hosts))) as pool:
+            resolved = list(pool.map(_cached_resolve, hosts))
+    else:
+        resolved = [_cached_resolve(host) for host in hosts]
 
-        except socket.gaierror as e:
+    for (name, dns_host), outcome in zip(checks, resolved, strict=True):
+        if isinstance(outcome, socket.gaierror):
             dns_results[name] = {
                 "host": dns_host,
                 "resolved": False,
                 "addresses": [],
-                "error": str(e),
+                "error": str(outcome),
             }
 
             result.add_error(
-                f"DNS resolution failed: {dns_host} - {e}",
+                f"DNS resolution failed: {dns_host} - {outcome}",
                 system="smoke-test",
             )
             failed += 1
+            continue
+
+        dns_results[name] = {
+            "host": dns_host,
+            "resolved": True,
+            "addresses": outcome,
+            "error": None,
+        }
+
+        result.add_info(
+            f"DNS resolved: {dns_host} -> {', '.join(outcome)}",
+            system="smoke-test",
+        )
+        passed += 1
 
     # Update context
     smoke_test["dns_results"] = dns_results
@@ -5,7 +5,9 @@ Checks HTTP endpoint health for configured targets.
 
 from __future__ import annotations
 
-import httpx
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.parse import urlsplit
 
 from homelab_taskkit.workflow import (
     StepDeps,
@@ -14,6 +16,9 @@ from homelab_taskkit.workflow import (
     register_step,
 )
 
+# Upper bound on concurrent probes (the client may queue them on its pool limits)
+_MAX_HTTP_WORKERS = 32
+
 
 @register_step("smoke-test-check-http")
 def handle_check_http(step_input: StepInput, deps: StepDeps) -> StepResult:
@@ -21,84 +26,127 @@ def handle_check_http(step_input: StepInput, deps: StepDeps) -> StepResult:
 
     Updates context with HTTP results for each target.
     """
+    # Imported here so registering the step does not load httpx
+    import httpx
+
     result = StepResult()
 
-    targets = step_input.params.get("targets", [])
+    # Shallow copies, not setdefault(): nested vars are shared with the runner
+    # (LocalRunner copies only the top level), so mutating them in place would
+    # double-count checks when a failed attempt is retried
     smoke_test = dict(step_input.vars.get("smoke_test", {}))
     http_results = dict(smoke_test.get("http_results", {}))
 
     passed = 0
     failed = 0
 
-    for target in targets:
-        name = target.get("name", "unknown")
-        http_url = target.get("http_url")
-
-        if not http_url:
-            deps.logger.debug(f"Skipping HTTP check for {name} (no http_url configured)")
-            continue
-
-        expected_status = target.get("expected_status", 200)
-        timeout = target.get("timeout", 10.0)
+    # Partitioned by smoke-test-init; filter params ourselves if it did not run
+    http_targets = smoke_test.get("http_targets")
+    if http_targets is None:
+        http_targets = []
+        for target in step_input.params.get("targets", []):
+            if not target.get("http_url"):
+                name = target.get("name", "unknown")
+                deps.logger.debug("Skipping HTTP check for %s (no http_url configured)", name)
+                continue
+            http_targets.append(target)
+
+    checks: list[tuple[str, str, Any, float]] = [
+        (
+            target.get("name", "unknown"),
+            target["http_url"],
+            target.get("expected_status", 200),
+            target.get("timeout", 10.0),
+        )
+        for target in http_targets
+    ]
 
+    def probe(check: tuple[str, str, Any, float]) -> httpx.Response | httpx.RequestError:
         try:
-            # Make HTTP request
-            response = deps.http.get(http_url, timeout=timeout)
-
-            is_success = response.status_code == expected_status
-
-            http_results[name] = {
-                "url": http_url,
-                "success": is_success,
-                "status_code": response.status_code,
-                "expected_status": expected_status,
-                "response_time_ms": response.elapsed.total_seconds() * 1000,
-                "error": None,
-            }
-
-            if is_success:
-                result.add_info(
-                    f"HTTP check passed: {http_url} -> {response.status_code} "
-                    f"({response.elapsed.total_seconds() * 1000:.0f}ms)",
-                    system="smoke-test",
-                )
-                passed += 1
-            else:
-                result.add_error(
-                    f"HTTP check failed: {http_url} -> {response.status_code} "
-                    f"(expected {expected_status})",
-                    system="smoke-test",
-                )
-                failed += 1
-
-        except httpx.TimeoutException as e:
+            return deps.http.get(check[1], timeout=check[3])
+        except httpx.RequestError as e:
+            return e
+
+    def probe_host(indices: list[int]) -> list[httpx.Response | httpx.RequestError]:
+        return [probe(checks[i]) for i in indices]
+
+    # Targets on the same host:port are probed back to back by one worker, so
+    # they reuse a single pooled connection instead of racing to open one each;
+    # different hosts are probed concurrently on the shared (thread-safe) client
+    by_host: dict[str, list[int]] = {}
+    for i, check in enumerate(checks):
+        by_host.setdefault(urlsplit(check[1]).netloc, []).append(i)
+
+    outcomes: list[Any] = [None] * len(checks)
+    groups = list(by_host.values())
+    if len(groups) > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_HTTP_WORKERS, len(groups))) as pool:
+            group_outcomes = list(pool.map(probe_host, groups))
+    else:
+        group_outcomes = [probe_host(group) for group in groups]
+    # Results and messages stay in target order
+    for indices, results in zip(groups, group_outcomes, strict=True):
+        for i, outcome in zip(indices, results, strict=True):
+            outcomes[i] = outcome
+
+    for (name, http_url, expected_status, _), outcome in zip(checks, outcomes, strict=True):
+        if isinstance(outcome, httpx.TimeoutException):
             http_results[name] = {
                 "url": http_url,
                 "success": False,
                 "status_code": None,
                 "expected_status": expected_status,
                 "response_time_ms": None,
-                "error": f"Timeout: {e}",
+                "error": f"Timeout: {outcome}",
             }
 
             result.add_error(
-                f"HTTP timeout: {http_url} - {e}",
+                f"HTTP timeout: {http_url} - {outcome}",
                 system="smoke-test",
             )
             failed += 1
+            continue
 
-        except httpx.RequestError as e:
+        if isinstance(outcome, httpx.RequestError):
             http_results[name] = {
                 "url": http_url,
                 "success": False,
                 "status_code": None,
                 "expected_status": expected_status,
                 "response_time_ms": None,
-                "error": str(e),
+                "error": str(outcome),
             }
 
             result.add_error(
-                f"HTTP request error: {http_url} - {e}",
+                f"HTTP request error: {http_url} - {outcome}",
+                system="smoke-test",
+            )
+            failed += 1
+            continue
+
+        response = outcome
+        is_success = response.status_code == expected_status
+
+        http_results[name] = {
+            "url": http_url,
+            "success": is_success,
+            "status_code": response.status_code,
+            "expected_status": expected_status,
+            "response_time_ms": response.elapsed.total_seconds() * 1000,
+            "error": None,
+        }
+
+        if is_success:
+            result.add_info(
+                f"HTTP check passed: {http_url} -> {response.status_code} "
+                f"({response.elapsed.total_seconds() * 1000:.0f}ms)",
+                system="smoke-test",
+            )
+            passed += 1
+        else:
+            result.add_error(
+                f"HTTP check failed: {http_url} -> {response.status_code} "
+                f"(expected {expected_status})",
                 system="smoke-test",
             )
             failed += 1
@@ -5,9 +5,9 @@ Summarizes results and sets final workflow status.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
+from homelab_taskkit import _io_common, _json
 from homelab_taskkit.workflow import (
     StepDeps,
     StepInput,
@@ -47,8 +47,9 @@ def handle_finalize(step_input: StepInput, deps: StepDeps) -> StepResult:
     workdir = Path(deps.workdir)
     report_path = workdir / "smoke-test-report.json"
 
-    with open(report_path, "w") as f:
-        json.dump(summary, f, indent=2)
+    # Encoded in one pass and written with a single write, atomically replacing
+    # any report from an earlier run
+    _io_common.write_bytes(report_path, _json.dumps(summary, indent=True, newline=True))
 
     result.add_info(
         f"Report written to: {report_path}",
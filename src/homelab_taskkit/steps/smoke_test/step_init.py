@@ -63,7 +63,8 @@ def handle_init(step_input: StepInput, deps: StepDeps) -> StepResult:
     if result.has_errors:
         return result
 
-    # Initialize context variables
+    # Initialize context variables; targets are partitioned once here so the
+    # check steps only iterate the ones they apply to
     targets = step_input.params["targets"]
     result.context_updates["smoke_test"] = {
         "total_targets": len(targets),
@@ -71,6 +72,8 @@ def handle_init(step_input: StepInput, deps: StepDeps) -> StepResult:
         "failed_checks": 0,
         "dns_results": {},
         "http_results": {},
+        "dns_targets": [target for target in targets if target.get("dns_host")],
+        "http_targets": [target for target in targets if target.get("http_url")],
     }
 
     result.add_info(
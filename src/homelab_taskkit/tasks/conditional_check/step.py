@@ -13,11 +13,13 @@ all_conditions takes precedence (AND logic).
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from homelab_taskkit.deps import Deps
 from homelab_taskkit.registry import TaskDef, register_task
 
+if TYPE_CHECKING:
+    from homelab_taskkit.deps import Deps
+
 
 def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     """Evaluate conditions for pipeline branching.
@@ -99,11 +101,11 @@ def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     elif all_results:
         # AND logic takes precedence - all must pass
         result = all(all_results)
-        deps.logger.info(f"AND conditions: {sum(all_results)}/{len(all_results)} passed")
+        deps.logger.info("AND conditions: %d/%d passed", sum(all_results), len(all_results))
     elif any_results:
         # OR logic - any can pass
         result = any(any_results)
-        deps.logger.info(f"OR conditions: {sum(any_results)}/{len(any_results)} passed")
+        deps.logger.info("OR conditions: %d/%d passed", sum(any_results), len(any_results))
     else:
         # Single condition
         result = single_result if single_result is not None else True
@@ -112,7 +114,7 @@ def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     timestamp = deps.now().isoformat()
 
     deps.logger.info(
-        f"Conditional check result: {result} ({checks_passed}/{checks_performed} passed)"
+        "Conditional check result: %s (%d/%d passed)", result, checks_passed, checks_performed
     )
 
     return {
@@ -158,10 +160,10 @@ def _evaluate_condition(value: Any, operator: str, compare_to: Any, deps: Deps)
         elif operator == "truthy":
             return bool(value)
         else:
-            deps.logger.warning(f"Unknown operator: {operator}")
+            deps.logger.warning("Unknown operator: %s", operator)
             return False
     except Exception as e:
-        deps.logger.warning(f"Condition evaluation failed: {e}")
+        deps.logger.warning("Condition evaluation failed: %s", e)
         return False
 
 
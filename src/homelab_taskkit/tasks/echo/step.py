@@ -8,11 +8,13 @@ This task demonstrates the functional pattern:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from homelab_taskkit.deps import Deps
 from homelab_taskkit.registry import TaskDef, register_task
 
+if TYPE_CHECKING:
+    from homelab_taskkit.deps import Deps
+
 
 def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     """Echo the input message back with metadata.
@@ -27,7 +29,7 @@ def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     message = inputs["message"]
     metadata = inputs.get("metadata", {})
 
-    deps.logger.info(f"Echoing message: {message!r}")
+    deps.logger.info("Echoing message: %r", message)
 
     return {
         "echoed_message": message,
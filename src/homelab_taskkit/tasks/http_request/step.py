@@ -8,13 +8,14 @@ This task demonstrates:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from homelab_taskkit.clients.http import request
-from homelab_taskkit.deps import Deps
 from homelab_taskkit.errors import HTTPError, TimeoutError
 from homelab_taskkit.registry import TaskDef, register_task
 
+if TYPE_CHECKING:
+    from homelab_taskkit.deps import Deps
+
 
 def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     """Make an HTTP request and return the response.
@@ -32,19 +33,22 @@ def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
             - status_code: HTTP status code
             - headers: Response headers
             - body: Response body (parsed as JSON if possible)
-            - elapsed_ms: Request duration in milliseconds
+            - elapsed_ms: Request duration in whole milliseconds
             - success: True if 2xx status code
 
     Raises:
         RuntimeError: If the request fails (network error, timeout, etc.)
     """
+    # Imported here so registering the task does not load httpx
+    from homelab_taskkit.clients.http import request
+
     url = inputs["url"]
     method = inputs.get("method", "GET").upper()
     headers = inputs.get("headers", {})
     body = inputs.get("body")
     timeout = inputs.get("timeout", 30.0)
 
-    deps.logger.info(f"Making {method} request to {url}")
+    deps.logger.info("Making %s request to %s", method, url)
 
     try:
         response = request(
@@ -59,22 +63,22 @@ def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
         # Use JSON body if available, otherwise use text
         response_body = response.json if response.json is not None else response.body
 
-        deps.logger.info(f"Response: {response.status_code} in {response.elapsed_ms}ms")
+        deps.logger.info("Response: %d in %dms", response.status_code, response.elapsed_ms)
 
         return {
             "status_code": response.status_code,
-            "headers": response.headers,
+            "headers": dict(response.headers),
             "body": response_body,
             "elapsed_ms": response.elapsed_ms,
             "success": response.ok,
         }
 
     except TimeoutError as e:
-        deps.logger.error(f"Request timed out: {e}")
+        deps.logger.error("Request timed out: %s", e)
         raise RuntimeError(f"HTTP request timed out after {timeout}s") from e
 
     except HTTPError as e:
-        deps.logger.error(f"Request failed: {e}")
+        deps.logger.error("Request failed: %s", e)
         raise RuntimeError(f"HTTP request failed: {e}") from e
 
 
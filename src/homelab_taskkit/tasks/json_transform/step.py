@@ -9,11 +9,13 @@ Supports:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from homelab_taskkit.deps import Deps
 from homelab_taskkit.registry import TaskDef, register_task
 
+if TYPE_CHECKING:
+    from homelab_taskkit.deps import Deps
+
 
 def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     """Transform JSON data using mappings and expressions.
@@ -38,7 +40,7 @@ def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     merge_with = inputs.get("merge_with", {})
     wrap_key = inputs.get("wrap_key")
 
-    deps.logger.info(f"Transforming data (type: {type(data).__name__})")
+    deps.logger.info("Transforming data (type: %s)", type(data).__name__)
 
     result: Any
 
@@ -76,7 +78,7 @@ def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     elif isinstance(result, list):
         output["item_count"] = len(result)
 
-    deps.logger.info(f"Transform complete: {output['output_type']}")
+    deps.logger.info("Transform complete: %s", output["output_type"])
     return output
 
 
@@ -115,7 +117,7 @@ def _filter_list(data: list[dict[str, Any]], filter_expr: str, deps: Deps) -> li
     try:
         parts = filter_expr.split(".", 2)
         if len(parts) != 3:
-            deps.logger.warning(f"Invalid filter expression: {filter_expr}")
+            deps.logger.warning("Invalid filter expression: %s", filter_expr)
             return data
 
         field, operator, value = parts
@@ -154,13 +156,13 @@ def _filter_list(data: list[dict[str, Any]], filter_expr: str, deps: Deps) -> li
             elif operator == "endswith":
                 return str(item_value).endswith(value)
             else:
-                deps.logger.warning(f"Unknown operator: {operator}")
+                deps.logger.warning("Unknown operator: %s", operator)
                 return True
 
         return [item for item in data if matches(item)]
 
     except Exception as e:
-        deps.logger.warning(f"Filter failed: {e}")
+        deps.logger.warning("Filter failed: %s", e)
         return data
 
 
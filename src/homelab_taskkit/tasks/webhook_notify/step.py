@@ -8,13 +8,14 @@ Supports:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from homelab_taskkit.clients.webhook import WebhookPayload, detect_webhook_type, send_webhook
-from homelab_taskkit.deps import Deps
 from homelab_taskkit.errors import WebhookError
 from homelab_taskkit.registry import TaskDef, register_task
 
+if TYPE_CHECKING:
+    from homelab_taskkit.deps import Deps
+
 
 def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     """Send a notification via webhook.
@@ -35,6 +36,9 @@ def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
         timestamp: When notification was sent
         message_preview: Preview of the sent message
     """
+    # Imported here so registering the task does not load httpx
+    from homelab_taskkit.clients.webhook import WebhookPayload, detect_webhook_type, send_webhook
+
     webhook_url = inputs["webhook_url"]
     message = inputs["message"]
 
@@ -49,7 +53,7 @@ def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     )
 
     webhook_type = detect_webhook_type(webhook_url)
-    deps.logger.info(f"Sending {webhook_type} notification")
+    deps.logger.info("Sending %s notification", webhook_type)
 
     timestamp = deps.now().isoformat()
 
@@ -60,11 +64,11 @@ def run(inputs: dict[str, Any], deps: Deps) -> dict[str, Any]:
     except WebhookError as e:
         success = False
         status_code = e.status_code or 0
-        deps.logger.warning(f"Webhook failed: {e}")
+        deps.logger.warning("Webhook failed: %s", e)
     except Exception as e:
         success = False
         status_code = 0
-        deps.logger.error(f"Webhook failed unexpectedly: {e}")
+        deps.logger.error("Webhook failed unexpectedly: %s", e)
 
     return {
         "success": success,
@@ -84,7 +84,7 @@ def run_step_with_context(
         now=deps.now,
         env=deps.env,
         logger=deps.logger,
-        context=deepcopy(ctx.vars),
+        context=deepcopy(ctx.to_dict()["vars"]),
     )
 
     # Execute step
@@ -279,7 +279,7 @@ def run_step_with_artifacts(
         now=deps.now,
         env=deps.env,
         logger=deps.logger,
-        context=deepcopy(ctx.vars),
+        context=deepcopy(ctx.to_dict()["vars"]),
     )
 
     # Execute step
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import os
+from collections.abc import Mapping
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
@@ -22,7 +23,9 @@ class RuntimeEnv(BaseModel):
 
     # Task Identity
     task_id: str = Field(description="TASKKIT_TASK_ID - Unique task/workflow run identifier")
-    task_type: str = Field(default="", description="TASKKIT_TASK_TYPE - Task type (e.g., 'smoke-test')")
+    task_type: str = Field(
+        default="", description="TASKKIT_TASK_TYPE - Task type (e.g., 'smoke-test')"
+    )
     task_variant: str = Field(default="", description="TASKKIT_TASK_VARIANT - Task variant")
 
     # Workflow Metadata
@@ -31,21 +34,29 @@ class RuntimeEnv(BaseModel):
     context: str = Field(default="local", description="TASKKIT_CONTEXT - Execution context")
 
     # File System Paths
-    working_dir: str = Field(description="TASKKIT_WORKING_DIR - Working directory for step execution")
+    working_dir: str = Field(
+        description="TASKKIT_WORKING_DIR - Working directory for step execution"
+    )
     params_file: str = Field(description="TASKKIT_PARAMS_FILE - Path to params.json")
     output_file: str = Field(description="TASKKIT_OUTPUT_FILE - Path to write step_output.json")
-    vars_file: str = Field(default="", description="TASKKIT_VARS_FILE - Path to vars.yaml (optional)")
+    vars_file: str = Field(
+        default="", description="TASKKIT_VARS_FILE - Path to vars.yaml (optional)"
+    )
     flow_control_file: str = Field(
         default="/tmp/flow_control.json", description="TASKKIT_FLOW_CONTROL_FILE"
     )
 
     # Step Context
     step_name: str = Field(description="TASKKIT_STEP_NAME - Current step name")
-    step_template: str = Field(default="action", description="TASKKIT_STEP_TEMPLATE - Step template type")
+    step_template: str = Field(
+        default="action", description="TASKKIT_STEP_TEMPLATE - Step template type"
+    )
     step_params: dict[str, Any] = Field(
         default_factory=dict, description="TASKKIT_STEP_PARAMS - Step-specific params (JSON)"
     )
-    handler_prefix: str = Field(default="", description="TASKKIT_HANDLER_PREFIX - Step handler prefix")
+    handler_prefix: str = Field(
+        default="", description="TASKKIT_HANDLER_PREFIX - Step handler prefix"
+    )
 
     # Retry Tracking
     retries: int = Field(default=0, description="TASKKIT_RETRIES - Current attempt (0-based)")
@@ -129,15 +140,20 @@ ENV_VARS = {
     "workflow_result": "TASKKIT_WORKFLOW_RESULT",
 }
 
+# (field_name, env_var) pairs ordered by variable name, computed once for scans
+ENV_VARS_SORTED: tuple[tuple[str, str], ...] = tuple(sorted(ENV_VARS.items(), key=lambda x: x[1]))
+
 # Required environment variables (must be present)
-REQUIRED_ENV_VARS = [
-    "TASKKIT_STEP_NAME",
-    "TASKKIT_TASK_ID",
-    "TASKKIT_WORKFLOW_NAME",
-    "TASKKIT_WORKING_DIR",
-    "TASKKIT_PARAMS_FILE",
-    "TASKKIT_OUTPUT_FILE",
-]
+REQUIRED_ENV_VARS = frozenset(
+    {
+        "TASKKIT_STEP_NAME",
+        "TASKKIT_TASK_ID",
+        "TASKKIT_WORKFLOW_NAME",
+        "TASKKIT_WORKING_DIR",
+        "TASKKIT_PARAMS_FILE",
+        "TASKKIT_OUTPUT_FILE",
+    }
+)
 
 
 class EnvParseError(Exception):
@@ -146,7 +162,7 @@ class EnvParseError(Exception):
     pass
 
 
-def load_runtime_env(environ: dict[str, str] | None = None) -> RuntimeEnv:
+def load_runtime_env(environ: Mapping[str, str] | None = None) -> RuntimeEnv:
     """Load and parse all environment variables into RuntimeEnv.
 
     Args:
@@ -159,17 +175,18 @@ def load_runtime_env(environ: dict[str, str] | None = None) -> RuntimeEnv:
         EnvParseError: If required variables are missing
     """
     if environ is None:
-        environ = dict(os.environ)
+        environ = os.environ
+    get = environ.get
 
     # Check required variables
-    missing = [var for var in REQUIRED_ENV_VARS if not environ.get(var)]
+    missing = [var for _, var in ENV_VARS_SORTED if var in REQUIRED_ENV_VARS and not get(var)]
     if missing:
         raise EnvParseError(f"Missing required environment variables: {', '.join(missing)}")
 
     # Build kwargs from environment
     kwargs: dict[str, Any] = {}
-    for field_name, env_var in ENV_VARS.items():
-        value = environ.get(env_var)
+    for field_name, env_var in ENV_VARS_SORTED:
+        value = get(env_var)
         if value is not None:
             kwargs[field_name] = value
 
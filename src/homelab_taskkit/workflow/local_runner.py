@@ -23,7 +23,6 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-import httpx
 import yaml
 
 from homelab_taskkit.workflow.models import (
@@ -31,6 +30,7 @@ from homelab_taskkit.workflow.models import (
     StepDeps,
     StepInput,
     StepResult,
+    new_step_http_client,
 )
 from homelab_taskkit.workflow.registry import get_step, has_step
 from homelab_taskkit.workflow.workflow import (
@@ -148,7 +148,7 @@ class LocalRunner:
             return {}
 
         if not self.params_path.exists():
-            logger.warning(f"Params file not found: {self.params_path}")
+            logger.warning("Params file not found: %s", self.params_path)
             return {}
 
         with open(self.params_path) as f:
@@ -216,7 +216,7 @@ class LocalRunner:
     def _build_step_deps(self) -> StepDeps:
         """Build StepDeps for step execution."""
         return StepDeps(
-            http=httpx.Client(timeout=self.timeout, follow_redirects=True),
+            http=new_step_http_client(self.timeout),
             logger=logging.getLogger(f"homelab_taskkit.workflow.{self.workflow.name}"),
             env=dict(os.environ),
             workdir=str(self.workdir),
@@ -261,17 +261,17 @@ class LocalRunner:
             True if step succeeded, False otherwise.
         """
         handler_name = self.workflow.get_step_handler_name(step)
-        logger.info(f"Executing step: {step.name} (handler: {handler_name})")
+        logger.info("Executing step: %s (handler: %s)", step.name, handler_name)
 
         # Check if handler exists
         if not has_step(handler_name):
-            logger.error(f"Handler not found: {handler_name}")
+            logger.error("Handler not found: %s", handler_name)
             self._failed_steps.add(step.name)
             return False
 
         # Check if step should be skipped
         if self._should_skip_step(step):
-            logger.info(f"Skipping step due to flow control: {step.name}")
+            logger.info("Skipping step due to flow control: %s", step.name)
             self._skipped_steps.add(step.name)
             return True
 
@@ -289,12 +289,12 @@ class LocalRunner:
             for attempt in range(max_retries + 1):
                 step_input = self._build_step_input(step, attempt)
 
-                logger.info(f"Step {step.name} attempt {attempt + 1}/{max_retries + 1}")
+                logger.info("Step %s attempt %d/%d", step.name, attempt + 1, max_retries + 1)
 
                 try:
                     result = handler(step_input, deps)
                 except Exception as e:
-                    logger.exception(f"Step {step.name} raised exception: {e}")
+                    logger.exception("Step %s raised exception: %s", step.name, e)
                     result = StepResult()
                     result.add_error(f"Exception: {e}", system="local-runner")
 
@@ -308,7 +308,7 @@ class LocalRunner:
                         if msg.severity == Severity.ERROR
                         else (logging.WARNING if msg.severity == Severity.WARNING else logging.INFO)
                     )
-                    logger.log(level, f"[{step.name}] {msg.text}")
+                    logger.log(level, "[%s] %s", step.name, msg.text)
 
                 # Update vars with context_updates
                 if result.context_updates:
@@ -321,15 +321,15 @@ class LocalRunner:
 
                 # Check for success
                 if not result.has_errors:
-                    logger.info(f"Step {step.name} succeeded")
+                    logger.info("Step %s succeeded", step.name)
                     return True
 
                 # Check if we should retry
                 if attempt < max_retries:
-                    logger.warning(f"Step {step.name} failed, retrying...")
+                    logger.warning("Step %s failed, retrying...", step.name)
                     time.sleep(1)  # Brief delay before retry
                 else:
-                    logger.error(f"Step {step.name} failed after {max_retries + 1} attempts")
+                    logger.error("Step %s failed after %d attempts", step.name, max_retries + 1)
 
             # All retries exhausted
             self._failed_steps.add(step.name)
@@ -351,9 +351,9 @@ class LocalRunner:
         )
         execution.start_time = datetime.now(UTC)
 
-        logger.info(f"Starting workflow: {self.workflow.name}")
-        logger.info(f"Task ID: {self.task_id}")
-        logger.info(f"Working directory: {self.workdir}")
+        logger.info("Starting workflow: %s", self.workflow.name)
+        logger.info("Task ID: %s", self.task_id)
+        logger.info("Working directory: %s", self.workdir)
 
         try:
             # Load any existing vars (for resumed runs)
@@ -373,7 +373,7 @@ class LocalRunner:
 
                 # Stop on failure (but still run finalize)
                 if not success and step.name not in self._skipped_steps:
-                    logger.error(f"Workflow stopping due to step failure: {step.name}")
+                    logger.error("Workflow stopping due to step failure: %s", step.name)
                     execution.result = "Failed"
                     break
 
@@ -392,7 +392,7 @@ class LocalRunner:
                 execution.result = "Succeeded"
 
         except Exception as e:
-            logger.exception(f"Workflow execution error: {e}")
+            logger.exception("Workflow execution error: %s", e)
             execution.result = "Error"
             execution.error = str(e)
 
@@ -405,8 +405,8 @@ class LocalRunner:
             with open(result_path, "w") as f:
                 json.dump(execution.to_dict(), f, indent=2, default=str)
 
-            logger.info(f"Workflow completed: {execution.result}")
-            logger.info(f"Duration: {execution.duration_seconds:.2f}s")
+            logger.info("Workflow completed: %s", execution.result)
+            logger.info("Duration: %.2fs", execution.duration_seconds)
 
         return execution.result
 
@@ -18,6 +18,13 @@ from typing import Any
 import httpx
 from pydantic import BaseModel, Field
 
+from homelab_taskkit.clients.http import http2_available
+
+# Idle connections kept per step client; matches the smoke-test probe fan-out,
+# so a concurrent check does not close connections the next one could reuse
+STEP_HTTP_MAX_KEEPALIVE = 32
+STEP_HTTP_KEEPALIVE_EXPIRY = 30.0
+
 
 class Severity(str, Enum):
     """Message severity levels."""
@@ -161,5 +168,29 @@ class StepDeps(BaseModel):
         arbitrary_types_allowed = True
 
 
+def new_step_http_client(timeout: float) -> httpx.Client:
+    """Create the pooled HTTP client handed to step handlers as StepDeps.http.
+
+    Uses HTTP/2 when the optional ``h2`` package is installed, so probes to
+    one host share a single multiplexed connection, and keeps up to
+    STEP_HTTP_MAX_KEEPALIVE idle connections alive between requests.
+
+    Args:
+        timeout: Default request timeout in seconds.
+
+    Returns:
+        A new httpx.Client; the caller closes it when the step is done.
+    """
+    return httpx.Client(
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_keepalive_connections=STEP_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=STEP_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        http2=http2_available(),
+        follow_redirects=True,
+    )
+
+
 # Type alias for step handler functions
 StepHandler = Callable[[StepInput, StepDeps], StepResult]
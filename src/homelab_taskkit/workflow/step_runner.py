@@ -13,14 +13,14 @@ It performs all contract obligations:
 
 from __future__ import annotations
 
+import importlib
 import logging
 import os
 import sys
 import traceback
+from pathlib import Path
 from typing import Any
 
-import httpx
-
 from homelab_taskkit.workflow.env import EnvParseError, RuntimeEnv, load_runtime_env
 from homelab_taskkit.workflow.files import (
     FileReadError,
@@ -33,8 +33,14 @@ from homelab_taskkit.workflow.files import (
     write_step_output,
     write_vars_yaml,
 )
-from homelab_taskkit.workflow.models import Severity, StepDeps, StepInput, StepResult
-from homelab_taskkit.workflow.registry import get_step, has_step
+from homelab_taskkit.workflow.models import (
+    Severity,
+    StepDeps,
+    StepInput,
+    StepResult,
+    new_step_http_client,
+)
+from homelab_taskkit.workflow.registry import get_step, has_step, normalize_step_name
 
 # Logger for the runner itself
 logger = logging.getLogger("homelab_taskkit.step_runner")
@@ -75,7 +81,9 @@ def configure_logging(working_dir: str, step_name: str, debug: bool = False) ->
     root_logger.addHandler(console_handler)
 
 
-def build_step_input(env: RuntimeEnv, params: dict[str, Any], vars_data: dict[str, Any]) -> StepInput:
+def build_step_input(
+    env: RuntimeEnv, params: dict[str, Any], vars_data: dict[str, Any]
+) -> StepInput:
     """Build StepInput from parsed environment and files.
 
     Args:
@@ -112,19 +120,25 @@ def build_step_deps(env: RuntimeEnv, timeout: float = 30.0) -> StepDeps:
         StepDeps for the step handler
     """
     return StepDeps(
-        http=httpx.Client(timeout=timeout, follow_redirects=True),
+        http=new_step_http_client(timeout),
         logger=logging.getLogger(f"homelab_taskkit.step.{env.step_name}"),
         env=dict(os.environ),
         workdir=env.working_dir,
     )
 
 
-def run_step(env: RuntimeEnv, debug: bool = False) -> int:
+def run_step(
+    env: RuntimeEnv,
+    debug: bool = False,
+    manifest_path: str | Path | None = None,
+) -> int:
     """Execute a step with full contract handling.
 
     Args:
         env: Parsed runtime environment
         debug: Enable debug logging
+        manifest_path: Optional registry manifest used to import only the
+            handler's module (see homelab_taskkit.build_registry)
 
     Returns:
         Exit code (0 for success, non-zero for failure)
@@ -135,12 +149,12 @@ def run_step(env: RuntimeEnv, debug: bool = False) -> int:
 
     # Configure logging
     configure_logging(env.working_dir, step_name, debug=debug)
-    logger.info(f"Starting step: {step_name} (task: {task_id}, attempt: {env.retries})")
-    logger.info(f"Handler: {handler_name}")
+    logger.info("Starting step: %s (task: %s, attempt: %d)", step_name, task_id, env.retries)
+    logger.info("Handler: %s", handler_name)
 
     try:
         # Import steps to trigger registrations
-        _import_steps()
+        _import_steps(handler_name, manifest_path, env.handler_prefix)
 
         # Check if handler exists
         if not has_step(handler_name):
@@ -160,11 +174,11 @@ def run_step(env: RuntimeEnv, debug: bool = False) -> int:
         deps = build_step_deps(env)
 
         # Execute step handler
-        logger.info(f"Executing handler: {handler_name}")
+        logger.info("Executing handler: %s", handler_name)
         try:
             result = handler(step_input, deps)
         except Exception as e:
-            logger.exception(f"Step handler raised exception: {e}")
+            logger.exception("Step handler raised exception: %s", e)
             result = StepResult()
             result.add_error(f"Exception: {e}", system="taskkit")
         finally:
@@ -174,11 +188,11 @@ def run_step(env: RuntimeEnv, debug: bool = False) -> int:
         return _process_result(env, result, vars_data)
 
     except FileReadError as e:
-        logger.error(f"File read error: {e}")
+        logger.error("File read error: %s", e)
         return _handle_error(env, str(e), "taskkit")
 
     except Exception as e:
-        logger.exception(f"Step execution failed: {e}")
+        logger.exception("Step execution failed: %s", e)
         return _handle_error(env, str(e), "taskkit")
 
 
@@ -206,7 +220,7 @@ def _process_result(
             if msg.severity == Severity.ERROR
             else (logging.WARNING if msg.severity == Severity.WARNING else logging.INFO)
         )
-        logger.log(level, f"[{step_name}] {msg.text}")
+        logger.log(level, "[%s] %s", step_name, msg.text)
 
     # Build and write step_output.json
     output_payload = build_step_output(
@@ -216,25 +230,25 @@ def _process_result(
         flow_control=result.flow_control,
     )
     write_step_output(env.output_file, output_payload)
-    logger.info(f"Wrote step output to {env.output_file}")
+    logger.info("Wrote step output to %s", env.output_file)
 
     # Write flow_control.json if provided (typically from init step)
     if result.flow_control:
         write_flow_control(env.flow_control_file, result.flow_control)
-        logger.info(f"Wrote flow control to {env.flow_control_file}")
+        logger.info("Wrote flow control to %s", env.flow_control_file)
 
     # Update vars.yaml with context_updates
     if result.context_updates:
         merged_vars = {**vars_data, **result.context_updates}
         write_vars_yaml(env.vars_file_path, merged_vars)
-        logger.info(f"Updated vars with keys: {list(result.context_updates.keys())}")
+        logger.info("Updated vars with keys: %s", list(result.context_updates))
 
     # Determine exit code
     if result.has_errors:
-        logger.error(f"Step {step_name} failed with errors")
+        logger.error("Step %s failed with errors", step_name)
         return 1
 
-    logger.info(f"Step {step_name} completed successfully")
+    logger.info("Step %s completed successfully", step_name)
     return 0
 
 
@@ -254,16 +268,56 @@ def _handle_error(env: RuntimeEnv, error: str, system: str) -> int:
         output_payload = build_error_output(error, system)
         write_step_output(env.output_file, output_payload)
     except Exception as e:
-        logger.error(f"Failed to write error output: {e}")
+        logger.error("Failed to write error output: %s", e)
 
     return 1
 
 
-def _import_steps() -> None:
+def _import_steps(
+    handler_name: str | None = None,
+    manifest_path: str | Path | None = None,
+    handler_prefix: str = "",
+) -> None:
     """Import step modules to trigger step registrations.
 
-    This is called once at the start of step execution.
+    This is called once at the start of step execution. When a registry
+    manifest lists the handler, only its defining module is imported. Failing
+    that, a handler prefix selects the matching ``homelab_taskkit.steps``
+    subpackage (``smoke-test`` -> ``steps.smoke_test``). Otherwise every step
+    and task package is imported.
+
+    Args:
+        handler_name: Handler that is about to run
+        manifest_path: Optional registry manifest path
+        handler_prefix: Value of TASKKIT_HANDLER_PREFIX, if any
     """
+    if handler_name is not None and manifest_path is not None:
+        from homelab_taskkit.build_registry import load_manifest
+
+        manifest = load_manifest(manifest_path)
+        entry = manifest["steps"].get(normalize_step_name(handler_name)) if manifest else None
+        if entry is not None:
+            try:
+                importlib.import_module(entry["module"])
+            except ImportError as e:
+                logger.debug("Manifest import of %s failed: %s", entry["module"], e)
+            else:
+                if has_step(handler_name):
+                    logger.debug("Imported %s from registry manifest", entry["module"])
+                    return
+            logger.debug("Registry manifest is stale; importing all step packages")
+
+    if handler_name is not None and handler_prefix:
+        module_name = f"homelab_taskkit.steps.{handler_prefix.replace('-', '_')}"
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logger.debug("No step package for prefix %s: %s", handler_prefix, e)
+        else:
+            if has_step(handler_name):
+                logger.debug("Imported %s for prefix %s", module_name, handler_prefix)
+                return
+
     try:
         import homelab_taskkit.steps  # noqa: F401
 
@@ -279,18 +333,19 @@ def _import_steps() -> None:
         logger.debug("No homelab_taskkit.tasks package found")
 
 
-def main(debug: bool = False) -> int:
+def main(debug: bool = False, manifest_path: str | Path | None = None) -> int:
     """Main entry point for the step runner.
 
     Args:
         debug: Enable debug logging
+        manifest_path: Optional registry manifest path
 
     Returns:
         Exit code
     """
     try:
         env = load_runtime_env()
-        return run_step(env, debug=debug)
+        return run_step(env, debug=debug, manifest_path=manifest_path)
     except EnvParseError as e:
         # Can't configure logging yet, print to stderr
         print(f"Environment parse error: {e}", file=sys.stderr)
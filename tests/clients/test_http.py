@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+import asyncio
+import logging
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from homelab_taskkit.clients.http import HTTPResponse, _redact_url, request
+from homelab_taskkit.clients.http import (
+    HTTPResponse,
+    _redact_url,
+    arequest,
+    default_client,
+    request,
+)
 from homelab_taskkit.errors import HTTPError, TimeoutError
 
 
@@ -63,8 +72,8 @@ class TestRequest:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.text = '{"data": "value"}'
+        mock_response.content = b'{"data": "value"}'
         mock_response.headers = {"content-type": "application/json"}
-        mock_response.json.return_value = {"data": "value"}
         mock_client.request.return_value = mock_response
 
         result = request(mock_client, "GET", "https://api.example.com/data")
@@ -85,8 +94,8 @@ class TestRequest:
         mock_response = MagicMock()
         mock_response.status_code = 201
         mock_response.text = '{"id": 1}'
+        mock_response.content = b'{"id": 1}'
         mock_response.headers = {"content-type": "application/json"}
-        mock_response.json.return_value = {"id": 1}
         mock_client.request.return_value = mock_response
 
         result = request(
@@ -128,6 +137,47 @@ class TestRequest:
             timeout=None,
         )
 
+    def test_response_headers_are_not_copied(self):
+        mock_client = MagicMock(spec=httpx.Client)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "OK"
+        mock_response.headers = httpx.Headers({"X-Request-Id": "abc"})
+        mock_client.request.return_value = mock_response
+
+        result = request(mock_client, "GET", "https://api.example.com")
+
+        assert result.headers is mock_response.headers
+        assert result.headers["x-request-id"] == "abc"
+
+    def test_url_not_redacted_when_debug_disabled(self, caplog):
+        mock_client = MagicMock(spec=httpx.Client)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "OK"
+        mock_response.headers = {}
+        mock_client.request.return_value = mock_response
+
+        caplog.set_level(logging.INFO, logger="homelab_taskkit.clients.http")
+        with patch("homelab_taskkit.clients.http._redact_url") as redact:
+            request(mock_client, "GET", "https://discord.com/api/webhooks/1/token")
+
+        redact.assert_not_called()
+
+    def test_debug_log_redacts_url(self, caplog):
+        mock_client = MagicMock(spec=httpx.Client)
+        mock_response = MagicMock()
+        mock_response.status_code = 204
+        mock_response.text = ""
+        mock_response.headers = {}
+        mock_client.request.return_value = mock_response
+
+        caplog.set_level(logging.DEBUG, logger="homelab_taskkit.clients.http")
+        request(mock_client, "POST", "https://discord.com/api/webhooks/1/token")
+
+        assert "token" not in caplog.text
+        assert "POST https://discord.com/api/webhooks/1/*** -> 204" in caplog.text
+
     def test_timeout_raises_timeout_error(self):
         mock_client = MagicMock(spec=httpx.Client)
         mock_client.request.side_effect = httpx.TimeoutException("Request timed out")
@@ -160,6 +210,69 @@ class TestRequest:
         assert result.json is None
         assert result.body == "<html>Hello</html>"
 
+    def test_invalid_json_body_leaves_json_none(self):
+        mock_client = MagicMock(spec=httpx.Client)
+        mock_response = MagicMock()
+        mock_response.status_code = 502
+        mock_response.text = "Bad gateway"
+        mock_response.content = b"Bad gateway"
+        mock_response.headers = {"content-type": "application/json"}
+        mock_client.request.return_value = mock_response
+
+        result = request(mock_client, "GET", "https://example.com")
+
+        assert result.json is None
+        assert result.body == "Bad gateway"
+
+    def test_elapsed_is_integer_milliseconds(self):
+        mock_client = MagicMock(spec=httpx.Client)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "OK"
+        mock_response.headers = {}
+        mock_response.elapsed = timedelta(days=1, seconds=1, microseconds=234_567)
+        mock_client.request.return_value = mock_response
+
+        result = request(mock_client, "GET", "https://example.com")
+
+        assert result.elapsed_ms == 86_401_234
+        assert type(result.elapsed_ms) is int
+
+
+class TestArequest:
+    """Tests for the async arequest function."""
+
+    def test_successful_get_request(self):
+        mock_client = MagicMock(spec=httpx.AsyncClient)
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = '{"data": "value"}'
+        mock_response.content = b'{"data": "value"}'
+        mock_response.headers = {"content-type": "application/json"}
+        mock_client.request = AsyncMock(return_value=mock_response)
+
+        result = asyncio.run(arequest(mock_client, "get", "https://api.example.com/data"))
+
+        assert result.ok is True
+        assert result.json == {"data": "value"}
+        mock_client.request.assert_awaited_once_with(
+            method="GET",
+            url="https://api.example.com/data",
+            headers=None,
+            json=None,
+            timeout=None,
+        )
+
+    def test_timeout_raises_timeout_error(self):
+        mock_client = MagicMock(spec=httpx.AsyncClient)
+        mock_client.request = AsyncMock(side_effect=httpx.TimeoutException("timed out"))
+        mock_client.timeout = MagicMock(connect=30.0)
+
+        with pytest.raises(TimeoutError) as exc_info:
+            asyncio.run(arequest(mock_client, "GET", "https://slow.example.com"))
+
+        assert exc_info.value.timeout_seconds == 30.0
+
 
 class TestRedactUrl:
     """Tests for URL redaction."""
@@ -184,3 +297,21 @@ class TestRedactUrl:
         url = "https://api.example.com/data?key=value"
         redacted = _redact_url(url)
         assert redacted == url
+
+    def test_redaction_keeps_webhook_path(self):
+        url = "https://discord.com/api/webhooks/123456/abc123secret"
+        assert _redact_url(url) == "https://discord.com/api/webhooks/123456/***"
+
+    def test_webhook_host_without_path_unchanged(self):
+        assert _redact_url("hooks.slack.com") == "hooks.slack.com"
+
+
+class TestDefaultClient:
+    """Tests for the shared default client."""
+
+    def test_returns_same_open_client(self):
+        client = default_client()
+
+        assert client is default_client()
+        assert isinstance(client, httpx.Client)
+        assert not client.is_closed
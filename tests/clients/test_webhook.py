@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
@@ -12,8 +14,11 @@ from homelab_taskkit.clients.webhook import (
     WebhookPayload,
     _build_discord_payload,
     _build_slack_payload,
+    _discord_builder,
+    _shape,
     detect_webhook_type,
     send_webhook,
+    send_webhook_async,
 )
 from homelab_taskkit.errors import WebhookError
 
@@ -100,6 +105,19 @@ class TestBuildDiscordPayload:
         assert embed["fields"][0]["inline"] is True
         assert embed["fields"][1]["inline"] is False
 
+    def test_embed_uses_given_timestamp(self):
+        payload = WebhookPayload(message="Test", title="Title")
+        result = _build_discord_payload(payload, "2024-01-15T12:00:00Z")
+
+        assert result["embeds"][0]["timestamp"] == "2024-01-15T12:00:00Z"
+
+    def test_embed_timestamp_defaults_to_now(self):
+        payload = WebhookPayload(message="Test", title="Title")
+        result = _build_discord_payload(payload)
+
+        stamp = result["embeds"][0]["timestamp"]
+        assert datetime.strptime(stamp, "%Y-%m-%dT%H:%M:%SZ")
+
     def test_custom_avatar(self):
         payload = WebhookPayload(
             message="Test",
@@ -109,6 +127,13 @@ class TestBuildDiscordPayload:
 
         assert result["avatar_url"] == "https://example.com/avatar.png"
 
+    def test_same_shape_reuses_builder(self):
+        first = WebhookPayload(message="One", title="A", color="#00ff00")
+        second = WebhookPayload(message="Two", title="B", color="#0000ff")
+
+        assert _discord_builder(_shape(first), False) is _discord_builder(_shape(second), False)
+        assert _build_discord_payload(second)["embeds"][0]["color"] == 0x0000FF
+
 
 class TestBuildSlackPayload:
     """Tests for Slack payload building."""
@@ -173,6 +198,29 @@ class TestSendWebhook:
         assert result.status_code == 204
         mock_request.assert_called_once()
 
+    @pytest.mark.parametrize(
+        ("url", "expected_body"),
+        [
+            (
+                "https://hooks.slack.com/services/xxx",
+                {"username": "Homelab Tasks", "text": "Test"},
+            ),
+            (
+                "https://example.com/webhook",
+                {"text": "Test", "username": "Homelab Tasks"},
+            ),
+        ],
+    )
+    @patch("homelab_taskkit.clients.webhook.request")
+    def test_body_built_for_webhook_type(self, mock_request, url, expected_body):
+        mock_request.return_value = HTTPResponse(
+            status_code=200, body="ok", json=None, headers={}, elapsed_ms=1.0
+        )
+
+        send_webhook(MagicMock(spec=httpx.Client), url, WebhookPayload(message="Test"))
+
+        assert mock_request.call_args.kwargs["json_body"] == expected_body
+
     @patch("homelab_taskkit.clients.webhook.request")
     def test_error_response_raises_webhook_error(self, mock_request):
         mock_response = HTTPResponse(
@@ -212,3 +260,44 @@ class TestSendWebhook:
             )
 
         assert exc_info.value.webhook_type == "slack"
+
+
+class TestSendWebhookAsync:
+    """Tests for send_webhook_async function."""
+
+    @patch("homelab_taskkit.clients.webhook.arequest", new_callable=AsyncMock)
+    def test_successful_send(self, mock_arequest):
+        mock_arequest.return_value = HTTPResponse(
+            status_code=204, body="", json=None, headers={}, elapsed_ms=50.0
+        )
+
+        result = asyncio.run(
+            send_webhook_async(
+                MagicMock(spec=httpx.AsyncClient),
+                "https://hooks.slack.com/services/xxx",
+                WebhookPayload(message="Test"),
+            )
+        )
+
+        assert result.status_code == 204
+        assert mock_arequest.await_args.kwargs["json_body"] == {
+            "username": "Homelab Tasks",
+            "text": "Test",
+        }
+
+    @patch("homelab_taskkit.clients.webhook.arequest", new_callable=AsyncMock)
+    def test_error_response_raises_webhook_error(self, mock_arequest):
+        mock_arequest.return_value = HTTPResponse(
+            status_code=500, body="", json=None, headers={}, elapsed_ms=5.0
+        )
+
+        with pytest.raises(WebhookError) as exc_info:
+            asyncio.run(
+                send_webhook_async(
+                    MagicMock(spec=httpx.AsyncClient),
+                    "https://discord.com/api/webhooks/123/token",
+                    WebhookPayload(message="Test"),
+                )
+            )
+
+        assert exc_info.value.status_code == 500
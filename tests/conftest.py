@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -37,10 +37,10 @@ def fake_deps(fake_taskkit_env: TaskkitEnv) -> Deps:
     mock_http = MagicMock()
     mock_http.request.return_value = MagicMock(
         status_code=200,
-        json=lambda: {"test": "data"},
+        content=b'{"test": "data"}',
         text="test response",
         headers={"content-type": "application/json"},
-        elapsed=MagicMock(total_seconds=lambda: 0.1),
+        elapsed=timedelta(milliseconds=100),
     )
 
     return Deps(
@@ -59,10 +59,10 @@ def fake_deps_with_context(fake_taskkit_env: TaskkitEnv) -> Deps:
     mock_http = MagicMock()
     mock_http.request.return_value = MagicMock(
         status_code=200,
-        json=lambda: {"test": "data"},
+        content=b'{"test": "data"}',
         text="test response",
         headers={"content-type": "application/json"},
-        elapsed=MagicMock(total_seconds=lambda: 0.1),
+        elapsed=timedelta(milliseconds=100),
     )
 
     return Deps(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import MagicMock
 
 import httpx
@@ -20,7 +21,7 @@ class TestHttpRequestTask:
         assert result["status_code"] == 200
         assert result["success"] is True
         assert result["body"] == {"test": "data"}
-        assert "elapsed_ms" in result
+        assert result["elapsed_ms"] == 100
 
     def test_calls_http_client(self, fake_deps, sample_http_input):
         """Task should call the injected HTTP client."""
@@ -68,10 +69,10 @@ class TestHttpRequestTask:
         """Task should mark non-2xx responses as not successful."""
         fake_deps.http.request.return_value = MagicMock(
             status_code=404,
-            json=lambda: {"error": "not found"},
+            content=b'{"error": "not found"}',
             text="not found",
             headers={},
-            elapsed=MagicMock(total_seconds=lambda: 0.1),
+            elapsed=timedelta(milliseconds=100),
         )
 
         result = run({"url": "https://api.example.com/missing"}, fake_deps)
@@ -100,7 +101,7 @@ class TestHttpRequestTask:
             json=MagicMock(side_effect=ValueError("not json")),
             text="plain text response",
             headers={},
-            elapsed=MagicMock(total_seconds=lambda: 0.1),
+            elapsed=timedelta(milliseconds=100),
         )
 
         result = run({"url": "https://api.example.com/text"}, fake_deps)
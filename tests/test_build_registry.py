@@ -0,0 +1,66 @@
+"""Tests for the build-time registry manifest."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from homelab_taskkit.build_registry import (
+    REGISTRY_MANIFEST_VERSION,
+    build_manifest,
+    load_manifest,
+    main,
+    write_manifest,
+)
+
+
+class TestBuildManifest:
+    """Tests for build_manifest."""
+
+    def test_lists_tasks_with_modules_and_schemas(self):
+        manifest = build_manifest()
+
+        echo = manifest["tasks"]["echo"]
+        assert echo["module"] == "homelab_taskkit.tasks.echo.step"
+        assert echo["func"] == "run"
+        assert echo["input_schema"] == "echo/input.json"
+
+    def test_lists_step_handlers(self):
+        manifest = build_manifest()
+
+        entry = manifest["steps"]["smoke-test-init"]
+        assert entry["module"] == "homelab_taskkit.steps.smoke_test.step_init"
+
+
+class TestManifestFile:
+    """Tests for writing and loading the manifest file."""
+
+    def test_round_trip(self, tmp_path: Path):
+        path = tmp_path / "registry.json"
+
+        written = write_manifest(path)
+
+        assert load_manifest(path) == written
+
+    def test_missing_file_returns_none(self, tmp_path: Path):
+        assert load_manifest(tmp_path / "missing.json") is None
+
+    def test_invalid_json_returns_none(self, tmp_path: Path):
+        path = tmp_path / "registry.json"
+        path.write_text("{not json")
+
+        assert load_manifest(path) is None
+
+    def test_unknown_version_returns_none(self, tmp_path: Path):
+        path = tmp_path / "registry.json"
+        path.write_text(json.dumps({"version": "other", "tasks": {}, "steps": {}}))
+
+        assert load_manifest(path) is None
+
+    def test_main_writes_output(self, tmp_path: Path, capsys):
+        path = tmp_path / "registry.json"
+
+        assert main(["--output", str(path)]) == 0
+
+        assert json.loads(path.read_text())["version"] == REGISTRY_MANIFEST_VERSION
+        assert str(path) in capsys.readouterr().out
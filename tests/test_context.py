@@ -7,6 +7,7 @@ from pathlib import Path
 
 import pytest
 
+from homelab_taskkit import _json
 from homelab_taskkit.context import (
     CONTEXT_PATCH_KEY,
     CONTEXT_VERSION,
@@ -56,6 +57,38 @@ class TestTaskkitContext:
         assert ctx.version == CONTEXT_VERSION
         assert ctx.vars == {}
 
+    def test_encoding_is_cached_and_ignored_by_equality(self) -> None:
+        ctx = TaskkitContext(vars={"echo.key": "value"})
+
+        first = serialized_size_bytes(ctx)
+
+        assert ctx._encoded is not None
+        assert serialized_size_bytes(ctx) == first
+        assert ctx == TaskkitContext(vars={"echo.key": "value"})
+
+    def test_from_dict_takes_ownership_of_vars(self) -> None:
+        vars_ = {"key": "value"}
+        ctx = TaskkitContext.from_dict({"version": CONTEXT_VERSION, "vars": vars_})
+        assert ctx.to_dict()["vars"] is vars_
+
+    def test_vars_is_read_only_view(self) -> None:
+        ctx = TaskkitContext(vars={"echo.key": "value"})
+
+        with pytest.raises(TypeError):
+            ctx.vars["echo.key"] = "changed"  # type: ignore[index]
+        assert ctx.vars == {"echo.key": "value"}
+
+    def test_context_built_from_another_context_vars(self) -> None:
+        ctx = TaskkitContext(vars={"echo.key": "value"})
+        copy = TaskkitContext(vars=ctx.vars)
+
+        assert copy == ctx
+        assert type(copy.to_dict()["vars"]) is dict
+
+    def test_from_dict_ignores_non_object_vars(self) -> None:
+        ctx = TaskkitContext.from_dict({"vars": ["not", "object"]})
+        assert ctx.vars == {}
+
 
 class TestLoadContext:
     """Tests for load_context function."""
@@ -118,6 +151,12 @@ class TestExtractContextPatch:
         assert clean == output
         assert patch is None
 
+    def test_input_output_is_not_mutated(self) -> None:
+        output = {"result": "success", CONTEXT_PATCH_KEY: {"set": {"echo.k": 1}}}
+        clean, _ = extract_context_patch(output)
+        assert CONTEXT_PATCH_KEY in output
+        assert clean is not output
+
     def test_extracts_patch_from_output(self) -> None:
         output = {
             "result": "success",
@@ -159,6 +198,25 @@ class TestExtractContextPatch:
         with pytest.raises(ContextError, match="must be strings"):
             extract_context_patch(output)
 
+    def test_consume_removes_key_in_place(self) -> None:
+        output = {"result": "success", CONTEXT_PATCH_KEY: {"set": {"echo.k": 1}}}
+        clean, patch = extract_context_patch(output, consume=True)
+        assert clean is output
+        assert output == {"result": "success"}
+        assert patch is not None
+
+    def test_consume_keeps_key_when_invalid(self) -> None:
+        output = {CONTEXT_PATCH_KEY: "not an object"}
+        with pytest.raises(ContextError):
+            extract_context_patch(output, consume=True)
+        assert CONTEXT_PATCH_KEY in output
+
+    def test_non_dict_output_passes_through(self) -> None:
+        output = [1, 2]
+        clean, patch = extract_context_patch(output)  # type: ignore[arg-type]
+        assert clean is output
+        assert patch is None
+
 
 class TestApplyPatch:
     """Tests for apply_patch function."""
@@ -222,6 +280,26 @@ class TestWriteContext:
 
         assert out_path.exists()
 
+    def test_writes_compact_json_by_default(self, tmp_path: Path) -> None:
+        ctx = TaskkitContext(vars={"test": "value"})
+        out_path = tmp_path / "context.json"
+
+        write_context(out_path, ctx)
+
+        assert out_path.read_bytes() == _json.dumps(ctx.to_dict()) + b"\n"
+        assert out_path.stat().st_size == serialized_size_bytes(ctx) + 1
+
+    def test_indent_writes_pretty_json(self, tmp_path: Path) -> None:
+        ctx = TaskkitContext(vars={"test": "value"})
+        out_path = tmp_path / "context.json"
+
+        write_context(out_path, ctx, indent=True)
+
+        text = out_path.read_text()
+        assert text.endswith("}\n")
+        assert '\n  "vars": {\n' in text
+        assert json.loads(text)["vars"] == {"test": "value"}
+
     def test_exceeds_size_raises_error(self, tmp_path: Path) -> None:
         # Create context with large data
         large_vars = {f"key_{i}": "x" * 1000 for i in range(100)}
@@ -231,6 +309,12 @@ class TestWriteContext:
         with pytest.raises(ContextSizeError, match="exceeds limit"):
             write_context(out_path, ctx, max_bytes=1024)
 
+    def test_size_error_message_includes_sizes(self) -> None:
+        error = ContextSizeError("too big", size_bytes=2048, max_bytes=1024)
+
+        assert str(error) == "too big (size_bytes=2048, max_bytes=1024)"
+        assert str(error) is str(error)
+
 
 class TestSerializedSizeBytes:
     """Tests for serialized_size_bytes function."""
@@ -284,6 +368,26 @@ class TestValidatePatch:
         with pytest.raises(AssertionError, match="must be namespaced"):
             validate_patch("echo", patch)
 
+    def test_reports_all_unnamespaced_keys(self) -> None:
+        patch = ContextPatch(set={"bare": 1, "echo.ok": 2}, unset=["other.key"])
+        with pytest.raises(AssertionError, match="context keys 'bare', 'other.key' must be"):
+            validate_patch("echo", patch)
+
+    def test_task_name_is_matched_literally(self) -> None:
+        patch = ContextPatch(set={"echoXkey": "value"})
+        with pytest.raises(AssertionError, match="must be namespaced"):
+            validate_patch("echo", patch)
+
+    def test_non_string_set_key_raises_error(self) -> None:
+        patch = {"set": {1: "value"}, "unset": []}
+        with pytest.raises(AssertionError, match="must be a string, got int"):
+            validate_patch("echo", patch)
+
+    def test_non_string_unset_value_raises_error(self) -> None:
+        patch = {"set": {}, "unset": ["echo.key", None]}
+        with pytest.raises(AssertionError, match="unset values must be strings"):
+            validate_patch("echo", patch)
+
     def test_dict_patch_format_is_valid(self) -> None:
         patch = {
             "set": {"echo.key": "value"},
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import pickle
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 import pytest
 
+from homelab_taskkit import __version__
 from homelab_taskkit.deps import TaskkitEnv, build_deps
 
 
@@ -104,6 +107,11 @@ class TestBuildDeps:
             # Should raise TypeError when trying to modify
             deps.context["key"] = "new_value"  # type: ignore[index]
 
+    def test_missing_context_is_empty_and_read_only(self) -> None:
+        with build_deps({}) as deps, pytest.raises(TypeError):
+            assert dict(deps.context) == {}
+            deps.context["key"] = "value"  # type: ignore[index]
+
     def test_creates_taskkit_env(self) -> None:
         env = {
             "TASKKIT_TASK_ID": "test-task",
@@ -114,6 +122,18 @@ class TestBuildDeps:
             assert deps.taskkit.task_id == "test-task"
             assert deps.taskkit.run_id == "run-123"
 
+    def test_taskkit_env_reused_for_same_values(self) -> None:
+        with build_deps({"TASKKIT_RUN_ID": "run-1", "OTHER": "x"}) as first:
+            pass
+        with build_deps({"TASKKIT_RUN_ID": "run-1"}) as second:
+            pass
+        with build_deps({"TASKKIT_RUN_ID": "run-2"}) as third:
+            pass
+
+        assert second.taskkit is first.taskkit
+        assert third.taskkit is not first.taskkit
+        assert third.taskkit.run_id == "run-2"
+
     def test_now_returns_utc_datetime(self) -> None:
         env: dict[str, str] = {}
 
@@ -122,6 +142,11 @@ class TestBuildDeps:
             assert now.tzinfo == UTC
             assert isinstance(now, datetime)
 
+    def test_now_is_picklable(self) -> None:
+        with build_deps({}) as deps:
+            now = pickle.loads(pickle.dumps(deps.now))
+            assert now().tzinfo == UTC
+
     def test_logger_is_available(self) -> None:
         env: dict[str, str] = {}
 
@@ -133,7 +158,7 @@ class TestBuildDeps:
     def test_http_client_is_closed_after_context(self) -> None:
         env: dict[str, str] = {}
 
-        with build_deps(env) as deps:
+        with build_deps(env, reuse_client=False) as deps:
             http = deps.http
 
         # After context exits, client should be closed
@@ -147,3 +172,33 @@ class TestBuildDeps:
         with build_deps(env, timeout=60.0) as deps:
             # Verify timeout was set (httpx stores this internally)
             assert deps.http.timeout.connect == 60.0
+
+    def test_pool_limits_from_kwargs_and_env(self) -> None:
+        env = {"TASKKIT_HTTP_MAX_CONNECTIONS": "7", "TASKKIT_HTTP_KEEPALIVE_EXPIRY": "2.5"}
+
+        with (
+            patch("homelab_taskkit.deps.httpx.Client") as client_cls,
+            build_deps(env, max_keepalive_connections=3, reuse_client=False),
+        ):
+            pass
+
+        limits = client_cls.call_args.kwargs["limits"]
+        assert limits.max_connections == 7
+        assert limits.max_keepalive_connections == 3
+        assert limits.keepalive_expiry == 2.5
+
+    def test_http_client_sends_user_agent(self) -> None:
+        with build_deps({}) as deps:
+            assert deps.http.headers["user-agent"] == f"homelab-taskkit/{__version__}"
+
+    def test_shared_client_reused_across_calls(self) -> None:
+        with build_deps({}) as first:
+            pass
+        with build_deps({}) as second:
+            pass
+        with build_deps({}, timeout=5.0) as other:
+            pass
+
+        assert first.http is second.http
+        assert not first.http.is_closed
+        assert other.http is not first.http
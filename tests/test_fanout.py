@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
@@ -13,6 +15,7 @@ from homelab_taskkit.fanout import (
     TaskkitFanout,
     empty_fanout,
     extract_fanout,
+    iter_fanout_items,
     write_fanout,
     write_fanout_items,
 )
@@ -39,6 +42,16 @@ class TestTaskkitFanout:
         assert fanout.count == 2
         assert fanout.items == items
 
+    def test_from_items_stringifies_non_json_values(self) -> None:
+        when = datetime(2024, 1, 15, tzinfo=UTC)
+        fanout = TaskkitFanout.from_items([{"at": when, "path": Path("/tmp/x"), "tags": ("a",)}])
+        assert fanout.items == [{"at": str(when), "path": "/tmp/x", "tags": ("a",)}]
+
+    def test_from_items_keeps_json_native_items(self) -> None:
+        item = {"cluster": "c1", "nodes": [1, 2.5, None, True]}
+        fanout = TaskkitFanout.from_items([item])
+        assert fanout.items[0] is item
+
     def test_to_dict(self) -> None:
         fanout = TaskkitFanout(items=[{"x": 1}])
         d = fanout.to_dict()
@@ -100,6 +113,40 @@ class TestExtractFanout:
         with pytest.raises(ValueError, match="must be a list"):
             extract_fanout(output)
 
+    def test_dict_and_list_subclasses_accepted(self) -> None:
+        class Items(list):
+            pass
+
+        output = {FANOUT_KEY: OrderedDict(items=Items([{"t": 1}]))}
+        _, fanout = extract_fanout(output)
+        assert fanout is not None
+        assert fanout.items == [{"t": 1}]
+
+    def test_leaves_input_untouched_by_default(self) -> None:
+        output = {"result": "ok", FANOUT_KEY: [{"cluster": "c1"}]}
+        clean, _ = extract_fanout(output)
+        assert clean is not output
+        assert FANOUT_KEY in output
+
+    def test_consume_removes_key_in_place(self) -> None:
+        output = {"result": "ok", FANOUT_KEY: [{"cluster": "c1"}]}
+        clean, fanout = extract_fanout(output, consume=True)
+        assert clean is output
+        assert output == {"result": "ok"}
+        assert fanout is not None
+
+    def test_consume_keeps_key_when_invalid(self) -> None:
+        output = {FANOUT_KEY: "not a list or dict"}
+        with pytest.raises(ValueError):
+            extract_fanout(output, consume=True)
+        assert FANOUT_KEY in output
+
+    def test_non_dict_output_passes_through(self) -> None:
+        output = [1, 2]
+        clean, fanout = extract_fanout(output)  # type: ignore[arg-type]
+        assert clean is output
+        assert fanout is None
+
 
 class TestWriteFanout:
     """Tests for write_fanout function."""
@@ -133,6 +180,16 @@ class TestWriteFanout:
         content = out_path.read_text()
         assert content.endswith("\n")
 
+    def test_jsonl_writes_one_item_per_line(self, tmp_path: Path) -> None:
+        fanout = TaskkitFanout(items=[{"target": "t1"}, {"target": "t2"}])
+
+        out_path = tmp_path / "fanout.jsonl"
+        write_fanout(out_path, fanout)
+
+        lines = out_path.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == fanout.items
+        assert list(iter_fanout_items(out_path)) == fanout.items
+
 
 class TestWriteFanoutItems:
     """Tests for write_fanout_items function (raw array output)."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
@@ -141,6 +142,25 @@ class TestExtractFlowControl:
         with pytest.raises(ValueError, match="must be an object"):
             extract_flow_control(output)
 
+    def test_leaves_input_untouched_by_default(self) -> None:
+        output = {"result": "ok", FLOW_CONTROL_KEY: {"deploy": True}}
+        clean, _ = extract_flow_control(output)
+        assert clean is not output
+        assert FLOW_CONTROL_KEY in output
+
+    def test_consume_removes_key_in_place(self) -> None:
+        output = {"result": "ok", FLOW_CONTROL_KEY: {"deploy": True}}
+        clean, fc = extract_flow_control(output, consume=True)
+        assert clean is output
+        assert output == {"result": "ok"}
+        assert fc is not None
+
+    def test_non_dict_output_passes_through(self) -> None:
+        output = [1, 2]
+        clean, fc = extract_flow_control(output)  # type: ignore[arg-type]
+        assert clean is output
+        assert fc is None
+
 
 class TestWriteFlowControl:
     """Tests for write_flow_control function."""
@@ -199,3 +219,13 @@ class TestWriteFlowControlVars:
         write_flow_control_vars(out_path, fc)
 
         assert out_path.exists()
+
+    def test_non_json_values_are_stringified(self, tmp_path: Path) -> None:
+        fc = TaskkitFlowControl(vars={"deadline": datetime(2024, 1, 15, tzinfo=UTC), "count": 3})
+
+        out_path = tmp_path / "flow_control_vars.json"
+        write_flow_control_vars(out_path, fc)
+
+        text = out_path.read_text()
+        assert json.loads(text) == {"deadline": "2024-01-15 00:00:00+00:00", "count": 3}
+        assert text.startswith('{\n  "deadline"')
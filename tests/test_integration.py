@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import json
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
 # Import tasks to register them before running tests
 import homelab_taskkit.tasks  # noqa: F401
+from homelab_taskkit import registry
+from homelab_taskkit.fanout import FANOUT_KEY
+from homelab_taskkit.messages import MESSAGES_KEY
+from homelab_taskkit.registry import TaskDef
 from homelab_taskkit.runner import (
     EXIT_SUCCESS,
     EXIT_TASK_NOT_FOUND,
@@ -25,6 +32,12 @@ class TestRunnerIntegration:
         """Return path to schemas directory."""
         return Path(__file__).parent.parent / "schemas"
 
+    @pytest.fixture
+    def isolated_registry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Let tests register tasks without leaking them into later tests."""
+        monkeypatch.setattr(registry, "_TASKS", dict(registry._TASKS))
+        monkeypatch.setattr(registry, "_SORTED_TASKS", list(registry._SORTED_TASKS))
+
     def test_echo_task_full_workflow(self, tmp_path: Path, schemas_root: Path):
         """Test complete echo task: input → validate → run → validate → output."""
         # Arrange
@@ -109,36 +122,143 @@ class TestRunnerIntegration:
         assert exit_code == EXIT_SUCCESS
         assert output_file.exists()
 
+    @pytest.mark.usefixtures("isolated_registry")
+    def test_reserved_keys_stripped_without_mutating_task_output(self, tmp_path: Path):
+        """Test that reserved keys leave the output file but not the task's dict."""
+        (tmp_path / "any.json").write_text("{}")
+        returned = {
+            "result": 1,
+            MESSAGES_KEY: [{"level": "info", "message": "hi"}],
+            FANOUT_KEY: [{"x": 1}],
+        }
+        task = TaskDef(
+            name="reserved_keys",
+            description="Returns reserved keys",
+            input_schema="any.json",
+            output_schema="any.json",
+            run=lambda inputs, deps: returned,
+        )
+        registry.register_task(task)
+        output_file = tmp_path / "output.json"
+
+        exit_code = run_task(
+            task_name=task.name,
+            input_source="{}",
+            output_path=str(output_file),
+            schemas_root=str(tmp_path),
+            messages_enabled=True,
+            messages_output_path=tmp_path / "messages.json",
+            fanout_enabled=True,
+            fanout_output_path=tmp_path / "fanout.json",
+        )
+
+        assert exit_code == EXIT_SUCCESS
+        assert json.loads(output_file.read_text()) == {"result": 1}
+        assert set(returned) == {"result", MESSAGES_KEY, FANOUT_KEY}
+        assert json.loads((tmp_path / "fanout.json").read_text())["items"] == [{"x": 1}]
+
+    @pytest.mark.usefixtures("isolated_registry")
+    def test_non_dict_output_fails_output_validation(self, tmp_path: Path):
+        """Test that a non-dict task output is rejected by the output schema, not a crash."""
+        (tmp_path / "any.json").write_text("{}")
+        (tmp_path / "object.json").write_text('{"type": "object"}')
+        task = TaskDef(
+            name="returns_list",
+            description="Returns a list",
+            input_schema="any.json",
+            output_schema="object.json",
+            run=lambda inputs, deps: [1, 2],
+        )
+        registry.register_task(task)
+        messages_file = tmp_path / "messages.json"
+
+        exit_code = run_task(
+            task_name=task.name,
+            input_source="{}",
+            output_path=str(tmp_path / "output.json"),
+            schemas_root=str(tmp_path),
+            messages_enabled=True,
+            messages_output_path=messages_file,
+        )
+
+        assert exit_code == EXIT_VALIDATION_ERROR
+        codes = [m["code"] for m in json.loads(messages_file.read_text())["messages"]]
+        assert codes == ["OUTPUT_VALIDATION_ERROR"]
+
+    def test_artifacts_in_one_directory_create_it_once(
+        self, tmp_path: Path, schemas_root: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that output and artifacts sharing a directory cost one makedirs."""
+        from homelab_taskkit import _io_common
+
+        created: list[str] = []
+        real_makedirs = _io_common.os.makedirs
+
+        def record(name: str, exist_ok: bool = False) -> None:
+            created.append(name)
+            real_makedirs(name, exist_ok=exist_ok)
+
+        monkeypatch.setattr(_io_common, "_MKDIR_CACHE", set())
+        monkeypatch.setattr(_io_common.os, "makedirs", record)
+        out_dir = tmp_path / "outputs"
+
+        exit_code = run_task(
+            task_name="echo",
+            input_source='{"message": "hi"}',
+            output_path=str(out_dir / "output.json"),
+            schemas_root=str(schemas_root),
+            messages_enabled=True,
+            messages_output_path=out_dir / "messages.json",
+            fanout_enabled=True,
+            fanout_output_path=out_dir / "fanout.json",
+            flow_control_enabled=True,
+            flow_control_output_path=out_dir / "flow_control.json",
+        )
+
+        assert exit_code == EXIT_SUCCESS
+        assert created == [str(out_dir)]
+
+    @pytest.mark.usefixtures("isolated_registry")
+    def test_registered_task_is_listed_in_name_order(self):
+        """Test that register_task keeps list_tasks sorted and in step with get_task."""
+        task = TaskDef(
+            name="aaa_registered",
+            description="Sorts first",
+            input_schema="any.json",
+            output_schema="any.json",
+            run=lambda inputs, deps: {},
+        )
+
+        registry.register_task(task)
+
+        assert registry.list_tasks()[0] is registry.get_task(task.name) is task
+        names = [t.name for t in registry.list_tasks()]
+        assert names == sorted(names)
+
 
 class TestCLIIntegration:
     """Integration tests for CLI commands."""
 
     def test_cli_list_shows_tasks(self, capsys):
         """Test that CLI list command shows registered tasks."""
-        from typer.testing import CliRunner
-
         from homelab_taskkit.cli import app
 
-        runner = CliRunner()
-        result = runner.invoke(app, ["list"])
+        exit_code = app(["list"])
 
-        assert result.exit_code == 0
-        assert "echo" in result.stdout
-        assert "http_request" in result.stdout
+        assert exit_code == 0
+        stdout = capsys.readouterr().out
+        assert "echo" in stdout
+        assert "http_request" in stdout
 
     def test_cli_run_echo_task(self, tmp_path: Path):
         """Test running echo task via CLI."""
-        from typer.testing import CliRunner
-
         from homelab_taskkit.cli import app
 
         input_file = tmp_path / "input.json"
         output_file = tmp_path / "output.json"
         input_file.write_text('{"message": "CLI test"}')
 
-        runner = CliRunner()
-        result = runner.invoke(
-            app,
+        exit_code = app(
             [
                 "run",
                 "echo",
@@ -148,10 +268,173 @@ class TestCLIIntegration:
                 str(output_file),
                 "--schemas",
                 str(Path(__file__).parent.parent / "schemas"),
-            ],
+            ]
         )
 
-        assert result.exit_code == 0
+        assert exit_code == 0
         assert output_file.exists()
         output_data = json.loads(output_file.read_text())
         assert output_data["echoed_message"] == "CLI test"
+
+    def test_cli_main_run_keeps_exit_code_and_output(self, tmp_path: Path):
+        """Test that the fast exit after `run` preserves the exit code and flushed output."""
+        input_file = tmp_path / "input.json"
+        input_file.write_text('{"message": "CLI test"}')
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "homelab_taskkit.cli",
+                "run",
+                "no-such-task",
+                "--input",
+                str(input_file),
+                "--output",
+                str(tmp_path / "output.json"),
+            ],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+
+        assert result.returncode == 3
+        assert "Task not found: no-such-task" in result.stderr
+
+    def test_cli_group_without_subcommand_prints_help(self, capsys):
+        """Test that a bare command group prints its help instead of failing."""
+        from homelab_taskkit.cli import app
+
+        exit_code = app(["workflow"])
+
+        assert exit_code == 0
+        stdout = capsys.readouterr().out
+        assert "list-steps" in stdout
+        assert "validate" in stdout
+
+    def test_cli_import_does_not_load_rich(self):
+        """Test that importing the CLI module defers Rich until a command needs it."""
+        code = "import sys, homelab_taskkit.cli; sys.exit('rich' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+
+        assert result.returncode == 0
+
+    def test_cli_unknown_command_is_usage_error(self, capsys):
+        """Test that an unknown command exits with the usage-error code."""
+        from homelab_taskkit.cli import app
+
+        exit_code = app(["step", "bogus"])
+
+        assert exit_code == 2
+        assert "unknown command 'bogus'" in capsys.readouterr().err
+
+    def test_cli_schema_piped_output_is_raw_file(self, capfdbinary):
+        """Test that piped schema output is the schema file byte-for-byte."""
+        from homelab_taskkit.cli import app
+
+        schemas_root = Path(__file__).parent.parent / "schemas"
+
+        exit_code = app(["schema", "echo", "--schemas", str(schemas_root)])
+
+        assert exit_code == 0
+        expected = (schemas_root / "echo" / "input.json").read_bytes()
+        assert capfdbinary.readouterr().out.rstrip(b"\n") == expected.rstrip(b"\n")
+
+    def test_cli_step_run_fast_path_skips_parser(self, monkeypatch):
+        """Test that `step run -v` dispatches without building an argparse parser."""
+        from homelab_taskkit import cli
+
+        calls = []
+        monkeypatch.setattr(cli, "step_run_cmd", lambda args: calls.append(args.verbose) or 0)
+        monkeypatch.setattr(cli, "_PARSERS", {})
+
+        assert cli.app(["step", "run", "-v"]) == 0
+        assert cli.app(["step", "run"]) == 0
+
+        assert calls == [True, False]
+        assert cli._PARSERS == {}
+
+    def test_cli_run_fast_path_builds_only_run_parser(self, monkeypatch):
+        """Test that `run` dispatches with only its own parser built."""
+        from homelab_taskkit import cli
+
+        calls = []
+        monkeypatch.setattr(cli, "run_cmd", lambda args: calls.append(args) or 0)
+        monkeypatch.setattr(cli, "_PARSERS", {})
+
+        assert cli.app(["run", "echo", "-i", "in.json", "-o", "out.json", "--no-context"]) == 0
+
+        assert calls[0].task_name == "echo"
+        assert calls[0].context_enabled is False
+        assert list(cli._PARSERS) == [("run",)]
+
+    def test_cli_eager_import_loads_tasks_and_steps(self):
+        """Test that TASKKIT_EAGER_IMPORT populates the registries at import time."""
+        code = (
+            "import sys, homelab_taskkit.cli; "
+            "sys.exit('homelab_taskkit.tasks' not in sys.modules "
+            "or 'homelab_taskkit.steps' not in sys.modules)"
+        )
+        env = {**os.environ, "TASKKIT_EAGER_IMPORT": "1"}
+        result = subprocess.run([sys.executable, "-c", code], env=env, check=False)
+
+        assert result.returncode == 0
+
+    def test_init_logging_keeps_existing_handlers(self, monkeypatch):
+        """Test that logging setup adds one handler and respects existing ones."""
+        import logging
+
+        from homelab_taskkit import runner
+
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", [])
+        monkeypatch.setattr(root, "level", root.level)
+
+        runner.init_logging(logging.DEBUG)
+        runner.init_logging(logging.INFO)
+
+        assert len(root.handlers) == 1
+        assert root.handlers[0].formatter is runner._LOG_FORMATTER
+        assert root.level == logging.DEBUG
+
+    def test_cli_workflow_run_uses_runner_logging(self, monkeypatch, tmp_path):
+        """Test that the CLI configures logging through the runner's helper."""
+        import logging
+
+        from homelab_taskkit import cli, runner
+
+        levels: list[int] = []
+        monkeypatch.setattr(runner, "init_logging", levels.append)
+
+        cli.app(["workflow", "run", "-w", str(tmp_path / "missing.yaml"), "-v"])
+
+        assert levels == [logging.DEBUG]
+
+    def test_cli_list_piped_output_is_tab_separated(self, capsys):
+        """Test that non-TTY list output is one tab-separated row per task."""
+        from homelab_taskkit.cli import app
+
+        assert app(["list"]) == 0
+
+        rows = [line.split("\t") for line in capsys.readouterr().out.splitlines()]
+        assert rows[0] == ["Name", "Description", "Input Schema", "Output Schema"]
+        echo_row = next(row for row in rows if row[0] == "echo")
+        assert echo_row[2:] == ["echo/input.json", "echo/output.json"]
+
+    def test_cli_tsv_output_escapes_tabs_and_newlines(self, capsys):
+        """Test that cell text cannot break the one-row-per-line TSV layout."""
+        from homelab_taskkit.cli import _write_tsv
+
+        _write_tsv(("Name", "Description"), [("demo", "first\tsecond\nthird")])
+
+        assert capsys.readouterr().out == "Name\tDescription\ndemo\tfirst second third\n"
+
+    def test_cli_schema_rejects_unknown_type(self, capsys):
+        """Test that --type only accepts 'input' or 'output'."""
+        from homelab_taskkit.cli import app
+
+        with pytest.raises(SystemExit) as exc_info:
+            app(["schema", "echo", "--type", "bogus"])
+
+        assert exc_info.value.code == 2
+        assert "invalid choice" in capsys.readouterr().err
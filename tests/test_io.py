@@ -0,0 +1,52 @@
+"""Tests for input/output handling utilities."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from homelab_taskkit import io
+from homelab_taskkit.io import read_input, write_output
+
+
+class TestReadInput:
+    """Tests for read_input function."""
+
+    def test_reads_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "input.json"
+        path.write_text('{"a": 1}')
+        assert read_input(str(path)) == {"a": 1}
+
+    def test_inline_object_skips_stat(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail(self: Path) -> bool:
+            raise AssertionError("stat called for inline JSON")
+
+        monkeypatch.setattr(io.Path, "exists", fail)
+        assert read_input('{"x": [1, 2]}') == {"x": [1, 2]}
+
+    def test_inline_scalar(self) -> None:
+        assert read_input("42") == 42
+
+    def test_long_inline_payload(self) -> None:
+        payload = json.dumps({"k": "v" * 10_000})
+        assert read_input(payload) == {"k": "v" * 10_000}
+
+    def test_bracket_named_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tmp_path)
+        Path("[inputs].json").write_text('{"from": "file"}')
+        assert read_input("[inputs].json") == {"from": "file"}
+
+    def test_invalid_json_raises(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            read_input("{not json")
+
+
+class TestWriteOutput:
+    """Tests for write_output function."""
+
+    def test_writes_indented_json(self, tmp_path: Path) -> None:
+        path = tmp_path / "nested" / "output.json"
+        write_output(path, {"a": 1})
+        assert path.read_text() == '{\n  "a": 1\n}\n'
@@ -0,0 +1,199 @@
+"""Tests for the shared artifact file writers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from homelab_taskkit import _io_common
+
+
+class TestWriteBytes:
+    """Tests for _io_common.write_bytes."""
+
+    def test_creates_file(self, tmp_path: Path):
+        """Test that a missing file is created with the given bytes."""
+        path = tmp_path / "out.json"
+
+        _io_common.write_bytes(path, b'{"a":1}\n')
+
+        assert path.read_bytes() == b'{"a":1}\n'
+
+    def test_truncates_existing_file(self, tmp_path: Path):
+        """Test that a longer previous file is fully replaced."""
+        path = tmp_path / "out.json"
+        path.write_bytes(b"x" * 100)
+
+        _io_common.write_bytes(path, b"[]\n")
+
+        assert path.read_bytes() == b"[]\n"
+
+    def test_missing_directory_raises(self, tmp_path: Path):
+        """Test that the parent directory is not created implicitly."""
+        with pytest.raises(FileNotFoundError):
+            _io_common.write_bytes(tmp_path / "missing" / "out.json", b"{}")
+
+    def test_leaves_no_temp_file(self, tmp_path: Path):
+        """Test that the temporary file is renamed into place."""
+        _io_common.write_bytes(tmp_path / "out.json", b"{}")
+
+        assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+    def test_failed_write_keeps_original(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that a failed write leaves the old file and no temp file behind."""
+        path = tmp_path / "out.json"
+        path.write_bytes(b"old")
+
+        def fail(fd: int, data: memoryview) -> int:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(_io_common.os, "write", fail)
+
+        with pytest.raises(OSError, match="disk full"):
+            _io_common.write_bytes(path, b"new")
+
+        assert path.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+
+    def test_fsync_flag_syncs_before_rename(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that TASKKIT_FSYNC=1 flushes the data before renaming."""
+        synced: list[int] = []
+        monkeypatch.setenv(_io_common.FSYNC_ENV, "1")
+        monkeypatch.setattr(_io_common, "_datasync", synced.append)
+
+        _io_common.write_bytes(tmp_path / "out.json", b"{}")
+
+        assert len(synced) == 1
+
+
+class TestWriteChunks:
+    """Tests for _io_common.write_chunks."""
+
+    def test_writes_concatenated_chunks(self, tmp_path: Path):
+        """Test that the file holds every chunk in order."""
+        path = tmp_path / "out.json"
+
+        _io_common.write_chunks(path, iter([b"[", b"1,", b"2", b"]"]))
+
+        assert path.read_bytes() == b"[1,2]"
+
+    def test_coalesces_small_chunks(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that small chunks are batched into buffer-sized writes."""
+        sizes: list[int] = []
+        real_write = _io_common.os.write
+
+        def record(fd: int, data: memoryview) -> int:
+            sizes.append(len(data))
+            return real_write(fd, data)
+
+        monkeypatch.setattr(_io_common.os, "write", record)
+        chunk = b"x" * 1024
+        count = 3 * _io_common._WRITE_BUFFER_SIZE // len(chunk)
+
+        _io_common.write_chunks(tmp_path / "out.json", (chunk for _ in range(count)))
+
+        assert sizes == [_io_common._WRITE_BUFFER_SIZE] * 3
+
+    def test_empty_chunks_create_empty_file(self, tmp_path: Path):
+        """Test that no chunks still produces the (empty) file."""
+        path = tmp_path / "out.json"
+
+        _io_common.write_chunks(path, [])
+
+        assert path.read_bytes() == b""
+
+
+class TestAppendBytes:
+    """Tests for _io_common.append_bytes."""
+
+    def test_appends_to_existing_file(self, tmp_path: Path):
+        """Test that data is added after the existing contents."""
+        path = tmp_path / "messages.jsonl"
+        path.write_bytes(b'{"a":1}\n')
+
+        _io_common.append_bytes(path, b'{"b":2}\n')
+
+        assert path.read_bytes() == b'{"a":1}\n{"b":2}\n'
+
+    def test_single_write_per_call(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that all appended lines go out in one write call."""
+        calls: list[int] = []
+        real_write = _io_common.os.write
+
+        def record(fd: int, data: memoryview) -> int:
+            calls.append(len(data))
+            return real_write(fd, data)
+
+        monkeypatch.setattr(_io_common.os, "write", record)
+
+        _io_common.append_bytes(tmp_path / "messages.jsonl", b"{}\n" * 100)
+
+        assert calls == [300]
+
+    def test_empty_data_creates_file(self, tmp_path: Path):
+        """Test that appending no data still creates the artifact file."""
+        path = tmp_path / "messages.jsonl"
+
+        _io_common.append_bytes(path, b"")
+
+        assert path.read_bytes() == b""
+
+
+class TestEnsureParent:
+    """Tests for _io_common.ensure_parent."""
+
+    def test_creates_nested_parent(self, tmp_path: Path):
+        """Test that missing parent directories are created."""
+        path = tmp_path / "a" / "b" / "out.json"
+
+        _io_common.ensure_parent(path)
+
+        assert path.parent.is_dir()
+
+    def test_skips_mkdir_for_cached_parent(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that a second call for the same directory makes no syscall."""
+        _io_common.ensure_parent(tmp_path / "out" / "result.json")
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("makedirs called for a cached directory")
+
+        monkeypatch.setattr(_io_common.os, "makedirs", fail)
+
+        _io_common.ensure_parent(tmp_path / "out" / "fanout.json")
+
+    def test_write_recreates_removed_parent(self, tmp_path: Path):
+        """Test that a cached directory removed externally is recreated on write."""
+        path = tmp_path / "out" / "result.json"
+        _io_common.ensure_parent(path)
+        path.parent.rmdir()
+
+        _io_common.write_bytes(path, b"{}")
+
+        assert path.read_bytes() == b"{}"
+
+
+class TestSyncDirectories:
+    """Tests for _io_common.sync_directories."""
+
+    def test_syncs_each_directory_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that several artifacts in one directory cost one directory fsync."""
+        _io_common.sync_directories()  # drop anything left by earlier tests
+        monkeypatch.setenv(_io_common.FSYNC_ENV, "1")
+        monkeypatch.setattr(_io_common, "_datasync", lambda fd: None)
+        _io_common.write_bytes(tmp_path / "output.json", b"{}")
+        _io_common.write_bytes(tmp_path / "fanout.json", b"{}")
+        synced: list[int] = []
+        monkeypatch.setattr(_io_common.os, "fsync", synced.append)
+
+        _io_common.sync_directories()
+        _io_common.sync_directories()
+
+        assert len(synced) == 1
+
+    def test_untracked_without_fsync_flag(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that directories are not tracked unless TASKKIT_FSYNC=1."""
+        monkeypatch.delenv(_io_common.FSYNC_ENV, raising=False)
+        _io_common.write_bytes(tmp_path / "output.json", b"{}")
+
+        assert str(tmp_path) not in _io_common._PENDING_DIR_SYNCS
@@ -0,0 +1,132 @@
+"""Tests for the JSON encoding helpers."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+
+import pytest
+
+from homelab_taskkit import _json
+
+
+class TestDumps:
+    """Tests for _json.dumps."""
+
+    def test_compact_by_default(self):
+        """Test that output uses compact separators."""
+        assert _json.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+    def test_indent_and_newline_match_stdlib(self):
+        """Test that indented output matches json.dumps(indent=2)."""
+        data = {"name": "test", "items": [1, {"nested": True}], "empty": {}}
+
+        result = _json.dumps(data, indent=True, newline=True)
+
+        assert result == (json.dumps(data, indent=2) + "\n").encode()
+
+    def test_non_ascii_is_utf8(self):
+        """Test that non-ASCII text is written as UTF-8, not escaped."""
+        assert _json.dumps({"msg": "héllo"}).decode("utf-8") == '{"msg":"héllo"}'
+
+    def test_default_receives_datetime(self):
+        """Test that datetimes go through the default callback like json.dumps."""
+        value = datetime(2024, 1, 1, tzinfo=UTC)
+
+        assert _json.loads(_json.dumps({"at": value}, default=str)) == {"at": str(value)}
+
+    def test_non_string_keys_are_coerced(self):
+        """Test that non-string dict keys become strings."""
+        assert _json.loads(_json.dumps({1: "one"})) == {"1": "one"}
+
+    def test_unserializable_raises_type_error(self):
+        """Test that unserializable values raise TypeError without a default."""
+        with pytest.raises(TypeError):
+            _json.dumps({"obj": object()})
+
+    def test_big_int_keeps_full_value(self):
+        """Test that integers beyond 64 bits are written exactly, as json.dumps does."""
+        assert _json.dumps({"a": 2**70}, default=str) == b'{"a":1180591620717411303424}'
+
+    def test_nan_written_as_null_with_orjson(self):
+        """Test that NaN becomes null when orjson is the encoder (stdlib writes NaN)."""
+        pytest.importorskip("orjson")
+        assert _json.dumps({"x": float("nan")}) == b'{"x":null}'
+
+
+class TestDumpsEnvelope:
+    """Tests for _json.dumps_envelope."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [[], {}, [{"a": [1, {"b": "x\ny"}]}, "s"], {"flag": True, "nested": {"k": []}}],
+    )
+    def test_matches_dumps_of_dict(self, value):
+        """Test that output is identical to dumping the envelope dict."""
+        expected = _json.dumps({"version": "v1", "items": value}, indent=True, newline=True)
+
+        assert _json.dumps_envelope("v1", "items", value) == expected
+
+    def test_default_applies_to_payload(self):
+        """Test that the default callback is used for the payload."""
+        value = datetime(2024, 1, 1, tzinfo=UTC)
+
+        result = _json.loads(_json.dumps_envelope("v1", "vars", {"at": value}, default=str))
+
+        assert result == {"version": "v1", "vars": {"at": str(value)}}
+
+
+class TestIterEnvelope:
+    """Tests for _json.iter_envelope."""
+
+    @pytest.mark.parametrize("items", [[], ["s"], [{"a": [1, {"b": "x\ny"}]}, [], 3]])
+    def test_matches_dumps_envelope(self, items):
+        """Test that the joined chunks equal the one-shot envelope encoding."""
+        expected = _json.dumps_envelope("v1", "items", items)
+
+        assert b"".join(_json.iter_envelope("v1", "items", items)) == expected
+
+    def test_consumes_items_lazily(self):
+        """Test that items are pulled from the iterable as chunks are consumed."""
+        seen: list[int] = []
+
+        def items():
+            for i in range(3):
+                seen.append(i)
+                yield i
+
+        chunks = _json.iter_envelope("v1", "items", items())
+        next(chunks)
+        next(chunks)
+
+        assert seen == [0]
+
+
+class TestLoads:
+    """Tests for _json.loads."""
+
+    def test_loads_bytes_and_str(self):
+        """Test that both bytes and str are accepted."""
+        assert _json.loads(b'{"a": 1}') == {"a": 1}
+        assert _json.loads('{"a": 1}') == {"a": 1}
+
+    def test_invalid_json_raises_decode_error(self):
+        """Test that invalid input raises the stdlib-compatible decode error."""
+        with pytest.raises(_json.JSONDecodeError):
+            _json.loads(b"{not json")
+
+    @pytest.mark.parametrize(
+        "document",
+        [
+            "123456789012345678901234567890",
+            "-9223372036854775809",
+            '{"n": 18446744073709551616}',
+        ],
+    )
+    def test_big_int_is_not_rounded(self, document):
+        """Test that integers beyond 64 bits parse exactly, from bytes and str."""
+        expected = json.loads(document)
+
+        assert _json.loads(document.encode()) == expected
+        assert _json.loads(document) == expected
+        assert _json.loads(memoryview(document.encode())) == expected
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import json
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
+from homelab_taskkit import messages as messages_module
 from homelab_taskkit.messages import (
     MESSAGES_KEY,
     MESSAGES_VERSION,
@@ -14,6 +16,7 @@ from homelab_taskkit.messages import (
     TaskkitMessages,
     empty_messages,
     extract_messages,
+    iter_messages,
     write_messages,
 )
 
@@ -88,6 +91,15 @@ class TestTaskkitMessage:
         )
         assert msg.source == "explicit"
 
+    def test_from_dict_shares_level_strings(self) -> None:
+        parsed = json.loads('[{"level": "error", "message": "a"}, {"level": "error"}]')
+        first, second = (TaskkitMessage.from_dict(item) for item in parsed)
+        assert first.level is second.level
+
+    def test_from_dict_keeps_unknown_level(self) -> None:
+        msg = TaskkitMessage.from_dict({"level": ["odd"], "message": "test"})
+        assert msg.level == ["odd"]
+
 
 class TestTaskkitMessages:
     """Tests for TaskkitMessages container."""
@@ -105,6 +117,20 @@ class TestTaskkitMessages:
         assert msgs.messages[0].message == "Test warning"
         assert msgs.messages[0].timestamp is not None
 
+    @pytest.mark.parametrize("micros", [0, 7, 999_999])
+    def test_timestamp_matches_isoformat(
+        self, micros: int, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        expected = datetime(2024, 1, 15, 12, 30, 45, micros, tzinfo=UTC)
+        now_ns = int(expected.timestamp()) * 1_000_000_000 + micros * 1000
+        monkeypatch.setattr(messages_module.time, "time_ns", lambda: now_ns)
+
+        msgs = TaskkitMessages()
+        msgs.add_info("first")
+        msgs.add_info("second")
+
+        assert [m.timestamp for m in msgs.messages] == [expected.isoformat()] * 2
+
     def test_add_error(self) -> None:
         msgs = TaskkitMessages()
         msgs.add_error("Something failed", code="ERR_01", source="test")
@@ -138,6 +164,49 @@ class TestTaskkitMessages:
         msgs.add_warning("warn")
         assert msgs.has_warnings
 
+    def test_level_checks_see_direct_list_changes(self) -> None:
+        msgs = TaskkitMessages()
+        assert not msgs.has_errors
+        msgs.messages.extend([TaskkitMessage(level="error", message="from task")])
+        assert msgs.has_errors
+        msgs.messages.clear()
+        assert not msgs.has_errors
+
+    def test_level_checks_see_reassigned_list(self) -> None:
+        msgs = TaskkitMessages()
+        msgs.add_info("info")
+        assert not msgs.has_errors
+        msgs.messages = [TaskkitMessage(level="error", message="replaced")]
+        assert msgs.has_errors
+        assert not msgs.has_warnings
+
+    def test_level_checks_see_clear_then_add(self) -> None:
+        msgs = TaskkitMessages()
+        msgs.add_error("error")
+        assert msgs.has_errors
+        msgs.messages.clear()
+        msgs.add_info("info")
+        assert not msgs.has_errors
+
+    def test_level_checks_see_replaced_last_item(self) -> None:
+        msgs = TaskkitMessages()
+        msgs.add_warning("warn")
+        assert msgs.has_warnings
+        msgs.messages[-1] = TaskkitMessage(level="info", message="downgraded")
+        assert not msgs.has_warnings
+
+    def test_extend_counts_levels(self) -> None:
+        msgs = TaskkitMessages()
+        msgs.extend(
+            [
+                TaskkitMessage(level="warning", message="w"),
+                TaskkitMessage(level="error", message="e"),
+            ]
+        )
+        assert msgs.has_errors
+        assert msgs.has_warnings
+        assert len(msgs.messages) == 2
+
     def test_to_dict(self) -> None:
         msgs = TaskkitMessages()
         msgs.add_error("Error 1", code="E1")
@@ -193,6 +262,31 @@ class TestExtractMessages:
         with pytest.raises(ValueError, match="must be an object"):
             extract_messages(output, task_name="test")
 
+    def test_input_output_is_not_mutated(self) -> None:
+        output = {"result": "ok", MESSAGES_KEY: []}
+        clean, _ = extract_messages(output, task_name="test")
+        assert MESSAGES_KEY in output
+        assert clean is not output
+
+    def test_consume_removes_key_in_place(self) -> None:
+        output = {"result": "ok", MESSAGES_KEY: [{"level": "info", "message": "hi"}]}
+        clean, msgs = extract_messages(output, task_name="test", consume=True)
+        assert clean is output
+        assert output == {"result": "ok"}
+        assert len(msgs) == 1
+
+    def test_consume_keeps_key_when_invalid(self) -> None:
+        output = {MESSAGES_KEY: "not a list"}
+        with pytest.raises(ValueError):
+            extract_messages(output, task_name="test", consume=True)
+        assert MESSAGES_KEY in output
+
+    def test_non_dict_output_passes_through(self) -> None:
+        output = [1, 2]
+        clean, msgs = extract_messages(output, task_name="test")  # type: ignore[arg-type]
+        assert clean is output
+        assert msgs == []
+
 
 class TestWriteMessages:
     """Tests for write_messages function."""
@@ -228,3 +322,29 @@ class TestWriteMessages:
 
         content = out_path.read_text()
         assert content.endswith("\n")
+
+    def test_jsonl_appends_one_message_per_line(self, tmp_path: Path) -> None:
+        out_path = tmp_path / "messages.jsonl"
+
+        first = TaskkitMessages()
+        first.add_error("First", code="ERR")
+        write_messages(out_path, first)
+
+        second = TaskkitMessages()
+        second.add_info("Second")
+        write_messages(out_path, second)
+
+        lines = out_path.read_text().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["First", "Second"]
+
+    def test_iter_messages_reads_jsonl(self, tmp_path: Path) -> None:
+        msgs = TaskkitMessages()
+        msgs.add_error("Boom", code="ERR")
+        msgs.add_warning("Careful")
+        out_path = tmp_path / "messages.jsonl"
+        write_messages(out_path, msgs)
+
+        loaded = list(iter_messages(out_path))
+
+        assert [m.level for m in loaded] == ["error", "warning"]
+        assert loaded[0].code == "ERR"
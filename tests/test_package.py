@@ -0,0 +1,76 @@
+"""Tests for the package-level lazy re-exports."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import homelab_taskkit
+
+
+class TestLazyExports:
+    """Tests for PEP 562 re-exports in homelab_taskkit/__init__.py."""
+
+    def test_all_exports_resolve(self):
+        """Test that every name in __all__ resolves to its defining object."""
+        for name in homelab_taskkit.__all__:
+            assert getattr(homelab_taskkit, name) is not None
+
+    def test_export_matches_submodule(self):
+        """Test that re-exported names are the submodule objects."""
+        from homelab_taskkit.runner import run_task
+
+        assert homelab_taskkit.run_task is run_task
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no_such_name"):
+            homelab_taskkit.no_such_name  # noqa: B018
+
+    def test_import_does_not_load_submodules(self):
+        """Test that importing the package alone loads no submodules."""
+        code = (
+            "import sys, homelab_taskkit; "
+            "sys.exit('homelab_taskkit.runner' in sys.modules "
+            "or 'homelab_taskkit.testing' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+
+        assert result.returncode == 0
+
+    def test_runner_import_defers_heavy_modules(self):
+        """Test that importing the runner loads neither jsonschema nor httpx."""
+        code = (
+            "import sys, homelab_taskkit.runner; "
+            "sys.exit('jsonschema' in sys.modules or 'httpx' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+
+        assert result.returncode == 0
+
+    def test_task_registration_defers_httpx(self):
+        """Test that registering the built-in tasks does not import httpx."""
+        code = (
+            "import sys, homelab_taskkit.tasks; "
+            "from homelab_taskkit.registry import get_task; "
+            "get_task('http_request'); "
+            "sys.exit('httpx' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], check=False)
+
+        assert result.returncode == 0
+
+
+class TestFastEntryPoints:
+    """Tests for the slim homelab_taskkit._fast module."""
+
+    def test_fast_exports_match_submodules(self):
+        """Test that _fast re-exports the registry and runner objects."""
+        from homelab_taskkit import _fast
+        from homelab_taskkit.registry import get_task
+        from homelab_taskkit.runner import run_task
+
+        assert _fast.get_task is get_task
+        assert _fast.run_task is run_task
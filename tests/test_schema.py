@@ -0,0 +1,146 @@
+"""Tests for JSON schema loading and validation."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from homelab_taskkit import schema
+from homelab_taskkit.schema import SchemaValidationError, load_schema, load_validator, validate
+
+SCHEMA = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "properties": {"message": {"type": "string"}},
+    "required": ["message"],
+}
+
+
+@pytest.fixture
+def schema_file(tmp_path: Path) -> Path:
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(SCHEMA))
+    return path
+
+
+class TestLoadSchema:
+    """Tests for load_schema."""
+
+    def test_loads_schema(self, schema_file: Path) -> None:
+        assert load_schema(schema_file) == SCHEMA
+
+    def test_equivalent_paths_share_cached_schema(self, schema_file: Path) -> None:
+        first = load_schema(schema_file)
+        second = load_schema(str(schema_file.parent / "." / schema_file.name))
+
+        assert first is second
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            load_schema(tmp_path / "missing.json")
+
+    def test_edited_file_is_reloaded(self, schema_file: Path) -> None:
+        load_schema(schema_file)
+        schema_file.write_text(json.dumps({"type": "string"}))
+        stat = schema_file.stat()
+        os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_schema(schema_file) == {"type": "string"}
+
+    def test_replaced_file_is_reloaded(self, schema_file: Path) -> None:
+        load_schema(schema_file)
+        replacement = schema_file.with_name("replacement.json")
+        replacement.write_text(json.dumps({"type": "string"}))
+        stat = schema_file.stat()
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, schema_file)
+
+        assert load_schema(schema_file) == {"type": "string"}
+
+
+class TestValidate:
+    """Tests for validate."""
+
+    def test_valid_instance_passes(self) -> None:
+        validate({"message": "hi"}, SCHEMA)
+
+    def test_invalid_instance_collects_errors(self) -> None:
+        with pytest.raises(SchemaValidationError) as exc_info:
+            validate({"message": 1}, SCHEMA)
+
+        assert exc_info.value.errors == ["At 'message': 1 is not of type 'string'"]
+
+    def test_validator_cached_per_schema_dict(self) -> None:
+        validate({"message": "hi"}, SCHEMA)
+        cached = schema._DICT_VALIDATORS[id(SCHEMA)]
+
+        validate({"message": "again"}, SCHEMA)
+
+        assert schema._DICT_VALIDATORS[id(SCHEMA)] is cached
+
+
+class TestLoadValidator:
+    """Tests for load_validator."""
+
+    def test_validator_is_cached(self, schema_file: Path) -> None:
+        assert load_validator(schema_file) is load_validator(schema_file)
+
+    def test_validate_accepts_validator(self, schema_file: Path) -> None:
+        validator = load_validator(schema_file)
+
+        validate({"message": "hi"}, validator)
+        with pytest.raises(SchemaValidationError):
+            validate({}, validator)
+
+
+class TestFastCheck:
+    """Tests for the optional fastjsonschema pre-check."""
+
+    def test_repo_schemas_are_portable(self) -> None:
+        for path in (Path(__file__).parent.parent / "schemas").glob("*/*.json"):
+            assert schema._is_portable(load_schema(path)), path
+
+    def test_refs_are_not_portable(self) -> None:
+        assert not schema._is_portable({"$defs": {"a": {}}, "$ref": "#/$defs/a"})
+        assert not schema._is_portable({"items": [{"type": "string"}]})
+
+    def test_valid_instance_uses_compiled_check(self) -> None:
+        pytest.importorskip("fastjsonschema")
+        validator = schema._validator_for(SCHEMA)
+
+        validate({"message": "hi"}, SCHEMA)
+
+        assert schema._FAST_CHECKS[id(validator)][1] is not None
+
+    def test_defaults_are_not_applied(self) -> None:
+        pytest.importorskip("fastjsonschema")
+        with_default = {"type": "object", "properties": {"n": {"type": "integer", "default": 1}}}
+        instance: dict[str, int] = {}
+
+        validate(instance, with_default)
+
+        assert instance == {}
+
+    def test_env_selects_jsonschema_only(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv(schema.VALIDATOR_ENV, "jsonschema")
+        monkeypatch.setattr(schema, "_fast_check", pytest.fail)
+
+        validate({"message": "hi"}, SCHEMA)
+
+    @pytest.mark.parametrize("validator_env", [None, "jsonschema"])
+    def test_const_schema_validates(
+        self, monkeypatch: pytest.MonkeyPatch, validator_env: str | None
+    ) -> None:
+        # fastjsonschema fails to compile some valid schemas (KeyError for const)
+        if validator_env is None:
+            monkeypatch.delenv(schema.VALIDATOR_ENV, raising=False)
+        else:
+            monkeypatch.setenv(schema.VALIDATOR_ENV, validator_env)
+        with_const = {"type": "object", "properties": {"mode": {"const": "x"}}}
+
+        validate({"mode": "x"}, with_const)
+        with pytest.raises(SchemaValidationError):
+            validate({"mode": "y"}, with_const)
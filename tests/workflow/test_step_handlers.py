@@ -12,6 +12,7 @@ import pytest
 
 # Import step handlers to register them
 import homelab_taskkit.steps  # noqa: F401
+from homelab_taskkit.steps.smoke_test import step_check_dns
 from homelab_taskkit.workflow.models import StepDeps, StepInput
 from homelab_taskkit.workflow.registry import get_step, has_step
 
@@ -65,6 +66,29 @@ class TestSmokeTestHandlersRegistered:
         assert has_step("smoke-test-finalize")
 
 
+class TestImportStepsByPrefix:
+    """Handler prefix scopes step imports to one package."""
+
+    def test_prefix_imports_only_matching_package(self):
+        """A known prefix imports its steps subpackage and stops there."""
+        from homelab_taskkit.workflow import step_runner
+
+        with patch.object(
+            step_runner.importlib, "import_module", wraps=step_runner.importlib.import_module
+        ) as import_module:
+            step_runner._import_steps("smoke-test-init", handler_prefix="smoke-test")
+
+        import_module.assert_called_once_with("homelab_taskkit.steps.smoke_test")
+
+    def test_unknown_prefix_falls_back(self):
+        """An unknown prefix falls back to importing every package."""
+        from homelab_taskkit.workflow import step_runner
+
+        step_runner._import_steps("smoke-test-init", handler_prefix="no-such-prefix")
+
+        assert has_step("smoke-test-init")
+
+
 class TestSmokeTestInit:
     """Tests for smoke-test-init handler."""
 
@@ -92,6 +116,26 @@ class TestSmokeTestInit:
         assert result.context_updates["smoke_test"]["passed_checks"] == 0
         assert result.context_updates["smoke_test"]["failed_checks"] == 0
 
+    def test_init_partitions_targets(self, step_deps: StepDeps):
+        """Init handler stores the DNS and HTTP target subsets for the check steps."""
+        handler = get_step("smoke-test-init")
+        dns_only = {"name": "dns-only", "dns_host": "example.com"}
+        http_only = {"name": "http-only", "http_url": "https://example.com"}
+        both = {"name": "both", "dns_host": "test.com", "http_url": "https://test.com"}
+
+        step_input = StepInput(
+            step_name="init",
+            task_id="task-123",
+            workflow_name="SmokeTest",
+            params={"targets": [dns_only, http_only, both]},
+        )
+
+        result = handler(step_input, step_deps)
+
+        smoke_test = result.context_updates["smoke_test"]
+        assert smoke_test["dns_targets"] == [dns_only, both]
+        assert smoke_test["http_targets"] == [http_only, both]
+
     def test_init_without_targets(self, step_deps: StepDeps):
         """Init handler returns errors when targets are missing."""
         handler = get_step("smoke-test-init")
@@ -113,6 +157,10 @@ class TestSmokeTestInit:
 class TestSmokeTestCheckDns:
     """Tests for smoke-test-check-dns handler."""
 
+    @pytest.fixture(autouse=True)
+    def _empty_dns_cache(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(step_check_dns, "_DNS_CACHE", {})
+
     def test_check_dns_success(self, step_deps: StepDeps):
         """Check DNS succeeds for valid hosts."""
         handler = get_step("smoke-test-check-dns")
@@ -135,8 +183,11 @@ class TestSmokeTestCheckDns:
             },
         )
 
-        with patch("socket.gethostbyname_ex") as mock_resolve:
-            mock_resolve.return_value = ("dns.google", [], ["8.8.8.8"])
+        with patch("socket.getaddrinfo") as mock_resolve:
+            mock_resolve.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("8.8.8.8", 0)),
+                (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2001:4860:4860::8888", 0, 0, 0)),
+            ]
             result = handler(step_input, step_deps)
 
         assert not result.has_errors
@@ -145,6 +196,10 @@ class TestSmokeTestCheckDns:
         assert smoke_test["failed_checks"] == 0
         assert "google" in smoke_test["dns_results"]
         assert smoke_test["dns_results"]["google"]["resolved"] is True
+        assert smoke_test["dns_results"]["google"]["addresses"] == [
+            "8.8.8.8",
+            "2001:4860:4860::8888",
+        ]
 
     def test_check_dns_failure(self, step_deps: StepDeps):
         """Check DNS handles resolution failures."""
@@ -168,7 +223,7 @@ class TestSmokeTestCheckDns:
             },
         )
 
-        with patch("socket.gethostbyname_ex") as mock_resolve:
+        with patch("socket.getaddrinfo") as mock_resolve:
             mock_resolve.side_effect = socket.gaierror("Name resolution failed")
             result = handler(step_input, step_deps)
 
@@ -177,6 +232,76 @@ class TestSmokeTestCheckDns:
         assert smoke_test["failed_checks"] == 1
         assert smoke_test["dns_results"]["invalid"]["resolved"] is False
 
+    def test_check_dns_multiple_targets_keep_order(self, step_deps: StepDeps):
+        """Check DNS resolves several targets and reports them in target order."""
+        handler = get_step("smoke-test-check-dns")
+
+        step_input = StepInput(
+            step_name="check-dns",
+            task_id="task-123",
+            workflow_name="SmokeTest",
+            params={
+                "targets": [
+                    {"name": "a", "dns_host": "a.test"},
+                    {"name": "bad", "dns_host": "bad.test"},
+                    {"name": "c", "dns_host": "c.test"},
+                ]
+            },
+            vars={"smoke_test": {"passed_checks": 0, "failed_checks": 0}},
+        )
+
+        def resolve(host: str, port: None, **kwargs: int):
+            if host == "bad.test":
+                raise socket.gaierror("Name resolution failed")
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 0))]
+
+        with patch("socket.getaddrinfo", side_effect=resolve):
+            result = handler(step_input, step_deps)
+
+        smoke_test = result.context_updates["smoke_test"]
+        assert smoke_test["passed_checks"] == 2
+        assert smoke_test["failed_checks"] == 1
+        assert list(smoke_test["dns_results"]) == ["a", "bad", "c"]
+        assert smoke_test["dns_results"]["bad"]["resolved"] is False
+
+    def test_check_dns_reuses_recent_lookup(self, step_deps: StepDeps):
+        """Check DNS resolves a host once across runs within the cache TTL."""
+        handler = get_step("smoke-test-check-dns")
+
+        step_input = StepInput(
+            step_name="check-dns",
+            task_id="task-123",
+            workflow_name="SmokeTest",
+            params={"targets": [{"name": "a", "dns_host": "a.test"}]},
+            vars={"smoke_test": {"passed_checks": 0, "failed_checks": 0}},
+        )
+        answer = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 0))]
+
+        with patch("socket.getaddrinfo", return_value=answer) as mock_resolve:
+            handler(step_input, step_deps)
+            result = handler(step_input, step_deps)
+
+        assert mock_resolve.call_count == 1
+        assert result.context_updates["smoke_test"]["dns_results"]["a"]["addresses"] == ["10.0.0.1"]
+
+    def test_check_dns_does_not_cache_failures(self, step_deps: StepDeps):
+        """Check DNS retries hosts whose previous lookup failed."""
+        handler = get_step("smoke-test-check-dns")
+
+        step_input = StepInput(
+            step_name="check-dns",
+            task_id="task-123",
+            workflow_name="SmokeTest",
+            params={"targets": [{"name": "bad", "dns_host": "bad.test"}]},
+            vars={"smoke_test": {"passed_checks": 0, "failed_checks": 0}},
+        )
+
+        with patch("socket.getaddrinfo", side_effect=socket.gaierror("nope")) as mock_resolve:
+            handler(step_input, step_deps)
+            handler(step_input, step_deps)
+
+        assert mock_resolve.call_count == 2
+
     def test_check_dns_skips_missing_host(self, step_deps: StepDeps):
         """Check DNS skips targets without dns_host."""
         handler = get_step("smoke-test-check-dns")
@@ -207,6 +332,56 @@ class TestSmokeTestCheckDns:
         assert smoke_test["passed_checks"] == 0
         assert smoke_test["failed_checks"] == 0
 
+    def test_check_dns_uses_partitioned_targets(self, step_deps: StepDeps):
+        """Check DNS resolves the dns_targets stored by init instead of rescanning params."""
+        handler = get_step("smoke-test-check-dns")
+
+        step_input = StepInput(
+            step_name="check-dns",
+            task_id="task-123",
+            workflow_name="SmokeTest",
+            params={"targets": [{"name": "stale", "dns_host": "stale.test"}]},
+            vars={
+                "smoke_test": {
+                    "passed_checks": 0,
+                    "failed_checks": 0,
+                    "dns_targets": [{"name": "google", "dns_host": "dns.google"}],
+                }
+            },
+        )
+
+        with patch("socket.getaddrinfo") as mock_resolve:
+            mock_resolve.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("8.8.8.8", 0)),
+            ]
+            result = handler(step_input, step_deps)
+
+        mock_resolve.assert_called_once()
+        assert list(result.context_updates["smoke_test"]["dns_results"]) == ["google"]
+
+    def test_check_dns_leaves_shared_vars_untouched(self, step_deps: StepDeps):
+        """Check DNS returns new dicts, so a retried attempt does not double-count."""
+        handler = get_step("smoke-test-check-dns")
+        shared = {"passed_checks": 0, "failed_checks": 0, "dns_results": {}}
+
+        step_input = StepInput(
+            step_name="check-dns",
+            task_id="task-123",
+            workflow_name="SmokeTest",
+            params={"targets": [{"name": "google", "dns_host": "dns.google"}]},
+            vars={"smoke_test": shared},
+        )
+
+        with patch("socket.getaddrinfo") as mock_resolve:
+            mock_resolve.return_value = [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("8.8.8.8", 0)),
+            ]
+            handler(step_input, step_deps)
+            result = handler(step_input, step_deps)
+
+        assert shared == {"passed_checks": 0, "failed_checks": 0, "dns_results": {}}
+        assert result.context_updates["smoke_test"]["passed_checks"] == 1
+
 
 class TestSmokeTestCheckHttp:
     """Tests for smoke-test-check-http handler."""
@@ -326,6 +501,78 @@ class TestSmokeTestCheckHttp:
         assert smoke_test["passed_checks"] == 0
         assert smoke_test["failed_checks"] == 0
 
+    def test_check_http_multiple_targets_keep_order(self, step_deps: StepDeps):
+        """Check HTTP probes several targets and reports them in target order."""
+        handler = get_step("smoke-test-check-http")
+
+        step_input = StepInput(
+            step_name="check-http",
+            task_id="task-123",
+            workflow_name="SmokeTest",
+            params={
+                "targets": [
+                    {"name": "a", "http_url": "https://a.test"},
+                    {"name": "down", "http_url": "https://down.test"},
+                    {"name": "c", "http_url": "https://c.test"},
+                ]
+            },
+            vars={"smoke_test": {"passed_checks": 0, "failed_checks": 0}},
+        )
+
+        def get(url: str, timeout: float):
+            if url == "https://down.test":
+                raise httpx.ConnectError("refused")
+            response = MagicMock()
+            response.status_code = 200
+            response.elapsed.total_seconds.return_value = 0.1
+            return response
+
+        with patch.object(step_deps.http, "get", side_effect=get):
+            result = handler(step_input, step_deps)
+
+        smoke_test = result.context_updates["smoke_test"]
+        assert smoke_test["passed_checks"] == 2
+        assert smoke_test["failed_checks"] == 1
+        assert list(smoke_test["http_results"]) == ["a", "down", "c"]
+        assert smoke_test["http_results"]["down"]["error"] == "refused"
+
+    def test_check_http_same_host_probed_back_to_back(self, step_deps: StepDeps):
+        """Check HTTP probes targets sharing a host on one worker, in target order."""
+        import threading
+
+        handler = get_step("smoke-test-check-http")
+
+        step_input = StepInput(
+            step_name="check-http",
+            task_id="task-123",
+            workflow_name="SmokeTest",
+            params={
+                "targets": [
+                    {"name": "api", "http_url": "https://svc.test/api"},
+                    {"name": "other", "http_url": "https://other.test"},
+                    {"name": "health", "http_url": "https://svc.test/health"},
+                ]
+            },
+            vars={"smoke_test": {"passed_checks": 0, "failed_checks": 0}},
+        )
+        calls: list[tuple[str, int]] = []
+
+        def get(url: str, timeout: float):
+            calls.append((url, threading.get_ident()))
+            response = MagicMock()
+            response.status_code = 200
+            response.elapsed.total_seconds.return_value = 0.1
+            return response
+
+        with patch.object(step_deps.http, "get", side_effect=get):
+            result = handler(step_input, step_deps)
+
+        svc_calls = [(url, ident) for url, ident in calls if "svc.test" in url]
+        assert [url for url, _ in svc_calls] == ["https://svc.test/api", "https://svc.test/health"]
+        assert svc_calls[0][1] == svc_calls[1][1]
+        smoke_test = result.context_updates["smoke_test"]
+        assert list(smoke_test["http_results"]) == ["api", "other", "health"]
+
 
 class TestSmokeTestFinalize:
     """Tests for smoke-test-finalize handler."""